@@ -2,9 +2,10 @@
 Main Flask application for AI Resume Portfolio Builder
 """
 import os
-from flask import Flask, redirect, url_for, send_from_directory
+from flask import Flask, redirect, url_for, request
 from flask_cors import CORS
 from backend.config import Config
+from backend.services.static_assets import StaticManifest
 
 # Determine static folder path - use build if available, otherwise use public
 static_folder_path = os.path.join(os.path.dirname(__file__), 'frontend', 'build')
@@ -14,8 +15,7 @@ if not os.path.exists(static_folder_path):
 app = Flask(
     __name__,
     template_folder=os.path.join(os.path.dirname(__file__), 'frontend', 'templates'),
-    static_folder=static_folder_path,
-    static_url_path="/",
+    static_folder=None,
     instance_path=os.path.join(os.path.dirname(__file__), 'backend', 'instance')
 )
 
@@ -24,8 +24,38 @@ os.makedirs(app.instance_path, exist_ok=True)
 
 app.config.from_object(Config)
 
+# Keep only an opaque session id in the cookie; data lives server-side
+if Config.SESSION_STORE == "server":
+    from backend.services.session_store import ServerSideSessionInterface
+    app.session_interface = ServerSideSessionInterface()
+
 CORS(app)
 
+# Per-request and per-stage timings: /metrics plus Server-Timing headers
+if Config.METRICS_ENABLED:
+    from backend.services import metrics
+    metrics.init_app(app)
+
+# Opt-in per-request cProfile; nothing is installed unless enabled
+if Config.PROFILING_ENABLED:
+    from backend.services import request_profiler
+    request_profiler.init_app(app)
+
+# Memory high-water per endpoint/export format (MEMORY_TRACKING=rss|tracemalloc)
+if Config.MEMORY_TRACKING != "off":
+    from backend.services import memory_tracker
+    memory_tracker.init_app(app)
+
+# Per-user token buckets and fair-queued render/LLM slots for /api/ai
+if Config.RATE_LIMIT_ENABLED:
+    from backend.services import rate_limiter
+    rate_limiter.init_app(app)
+
+# Background pre-rendering of downloads when a profile is saved
+if Config.PRERENDER_ENABLED:
+    from backend.services import prerender
+    prerender.init_app(app)
+
 # Register blueprints
 from backend.routes.auth_routes import auth_bp
 from backend.routes.profile_routes import profile_bp
@@ -35,16 +65,23 @@ app.register_blueprint(auth_bp)
 app.register_blueprint(profile_bp)
 app.register_blueprint(ai_bp)
 
+if Config.PROFILING_ENABLED or Config.MEMORY_TRACKING != "off":
+    from backend.routes.debug_routes import debug_bp
+    app.register_blueprint(debug_bp)
+
+# Scan the frontend build once; requests are served from memory with
+# precompressed variants, strong ETags and long-lived caching for hashed files
+static_manifest = StaticManifest(static_folder_path)
+app.extensions['static_manifest'] = static_manifest
+
 @app.route("/")
 def serve():
-    return send_from_directory(app.static_folder, "index.html")
-
-@app.route("/<path:path>")
-def static_proxy(path):
-    file_path = os.path.join(app.static_folder, path)
-    if os.path.exists(file_path):
-        return send_from_directory(app.static_folder, path)
-    return send_from_directory(app.static_folder, "index.html")
+    return static_manifest.respond(request, "index.html")
+
+# Registered under the "static" endpoint so url_for('static', filename=...) keeps working
+@app.route("/<path:filename>", endpoint="static")
+def static_proxy(filename):
+    return static_manifest.respond(request, filename)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
@@ -0,0 +1,10 @@
+"""
+ASGI entry point for the AI Resume Portfolio Builder
+Serves the same app as app.py, with the LLM endpoints awaiting the model
+asynchronously (see backend/routes/ai_asgi.py). Run it with:
+    uvicorn asgi:app --host 0.0.0.0 --port 5001
+"""
+from app import app as flask_app
+from backend.routes.ai_asgi import AIAsgiApp
+
+app = AIAsgiApp(flask_app)
@@ -6,3 +6,101 @@ load_dotenv()
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "secret_key_here")
     GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
+    # LLM endpoints; point both at a local stub for load tests (benchmarks/llm_stub.py)
+    GROK_API_URL = os.getenv("GROK_API_URL", "https://api.x.ai/v1/chat/completions")
+    GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "")
+    # LLM router: each task goes to the fastest healthy route (EWMA latency) of its
+    # quality tier. LLM_ROUTES is a JSON list replacing the built-in routes; a route
+    # cools down after LLM_FAILURE_THRESHOLD consecutive errors
+    LLM_ROUTES = os.getenv("LLM_ROUTES", "")
+    LLM_EWMA_ALPHA = float(os.getenv("LLM_EWMA_ALPHA", "0.3"))
+    LLM_FAILURE_THRESHOLD = int(os.getenv("LLM_FAILURE_THRESHOLD", "3"))
+    LLM_COOLDOWN_SECONDS = float(os.getenv("LLM_COOLDOWN_SECONDS", "30"))
+    LLM_ALLOW_DOWNGRADE = os.getenv("LLM_ALLOW_DOWNGRADE", "true").lower() == "true"
+    # User store: SQLite in WAL mode; relative paths are resolved inside backend/instance
+    DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///resume_builder.db")
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "4"))
+    # Seconds to wait for a free pooled connection before raising PoolTimeout
+    DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "10"))
+    # Semantic match score (needs NumPy): hashed n-gram embeddings blended into the
+    # keyword score with SEMANTIC_WEIGHT; FLOOR/CEILING map cosine similarity to 0-100
+    SEMANTIC_MATCH_ENABLED = os.getenv("SEMANTIC_MATCH_ENABLED", "true").lower() == "true"
+    SEMANTIC_WEIGHT = float(os.getenv("SEMANTIC_WEIGHT", "0.4"))
+    SEMANTIC_DIM = int(os.getenv("SEMANTIC_DIM", "2048"))
+    SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "4096"))
+    SEMANTIC_FLOOR = float(os.getenv("SEMANTIC_FLOOR", "0.1"))
+    SEMANTIC_CEILING = float(os.getenv("SEMANTIC_CEILING", "0.5"))
+    SEMANTIC_KEYWORD_THRESHOLD = float(os.getenv("SEMANTIC_KEYWORD_THRESHOLD", "0.55"))
+    # Profile saves queue background renders of the last-used template (niced
+    # threads) so the next download is served from the artifact store
+    PRERENDER_ENABLED = os.getenv("PRERENDER_ENABLED", "true").lower() == "true"
+    PRERENDER_FORMATS = os.getenv("PRERENDER_FORMATS", "txt,html,pdf")
+    PRERENDER_WORKERS = int(os.getenv("PRERENDER_WORKERS", "1"))
+    PRERENDER_NICE = int(os.getenv("PRERENDER_NICE", "10"))
+    ARTIFACT_TTL = int(os.getenv("ARTIFACT_TTL", "86400"))
+    # PDF fonts: "bundled" renders each template's font with a bundled open-license
+    # TTF (subset-embedded); "times" uses the built-in Times faces for every template
+    PDF_FONTS = os.getenv("PDF_FONTS", "bundled")
+    # Sessions: "server" keeps data in the database behind an opaque cookie id,
+    # "cookie" is Flask's signed-cookie session
+    SESSION_STORE = os.getenv("SESSION_STORE", "server")
+    # Profiles cached per worker (LRU entries)
+    PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "256"))
+    # DOCX backend: "python-docx" (object model) or "ooxml" (direct XML writer fast path)
+    DOCX_BACKEND = os.getenv("DOCX_BACKEND", "python-docx")
+    # PDF backend: "platypus" (flowables) or "canvas" (precomputed lines drawn
+    # directly; falls back to Platypus when content overflows one page)
+    PDF_BACKEND = os.getenv("PDF_BACKEND", "platypus")
+    # Templates marked multi_page (academic) render as multi-page CVs with running
+    # headers and page numbers instead of being auto-fitted onto one page
+    PDF_CV_MODE = os.getenv("PDF_CV_MODE", "true").lower() == "true"
+    # Bundle export: "thread" shares the worker process, "process" renders formats
+    # across cores in forkserver children (never forks the multithreaded worker)
+    BUNDLE_EXECUTOR = os.getenv("BUNDLE_EXECUTOR", "thread")
+    BUNDLE_MAX_WORKERS = int(os.getenv("BUNDLE_MAX_WORKERS", "0"))
+    # Import and pre-warm format backends / AI SDKs in gunicorn before serving
+    # (see gunicorn.conf.py); off by default so workers boot as fast as possible
+    WARMUP_BACKENDS = os.getenv("WARMUP_BACKENDS", "false").lower() == "true"
+    # Request/stage metrics (Prometheus text format). /metrics is only served when
+    # METRICS_TOKEN is set, and scrapes must send "Authorization: Bearer <token>"
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+    # Add a Server-Timing header with the per-stage breakdown to every response
+    SERVER_TIMING = os.getenv("SERVER_TIMING", "true").lower() == "true"
+    # On-demand cProfile of single requests (X-Profile-Token header or an admin
+    # account sending X-Profile-Request: 1); profiles go to backend/instance/profiles
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILING_ADMIN_EMAILS = [e.strip().lower() for e in os.getenv("PROFILING_ADMIN_EMAILS", "").split(",") if e.strip()]
+    PROFILING_TOKEN_TTL = int(os.getenv("PROFILING_TOKEN_TTL", "3600"))
+    PROFILING_MAX_FILES = int(os.getenv("PROFILING_MAX_FILES", "50"))
+    # Memory high-water per AI endpoint and export format: "off", "rss" (cheap) or
+    # "tracemalloc" (peak Python allocation + top allocation sites; slower)
+    MEMORY_TRACKING = os.getenv("MEMORY_TRACKING", "off").lower()
+    MEMORY_TRACE_FRAMES = int(os.getenv("MEMORY_TRACE_FRAMES", "5"))
+    # Per-user rate limits on /api/ai as "<requests>/<seconds>" per class: llm
+    # (cover letter, portfolio, analysis), render (PDF/DOCX exports, bundles) and
+    # light (everything else); over the limit answers 429 with Retry-After
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_LLM = os.getenv("RATE_LIMIT_LLM", "10/60")
+    RATE_LIMIT_RENDER = os.getenv("RATE_LIMIT_RENDER", "30/60")
+    RATE_LIMIT_LIGHT = os.getenv("RATE_LIMIT_LIGHT", "120/60")
+    # "sqlite" shares llm/render buckets across workers, "memory" keeps them per worker
+    RATE_LIMIT_STORE = os.getenv("RATE_LIMIT_STORE", "sqlite")
+    # Concurrent llm/render requests per worker (0 = unlimited); beyond that requests
+    # wait in a per-user fair queue for up to RATE_LIMIT_QUEUE_TIMEOUT seconds
+    RATE_LIMIT_SLOTS_LLM = int(os.getenv("RATE_LIMIT_SLOTS_LLM", "4"))
+    RATE_LIMIT_SLOTS_RENDER = int(os.getenv("RATE_LIMIT_SLOTS_RENDER", "2"))
+    RATE_LIMIT_QUEUE_TIMEOUT = float(os.getenv("RATE_LIMIT_QUEUE_TIMEOUT", "10"))
+    # ASGI mode (asgi.py): threads running Flask requests (exports, bundles, analysis)
+    # and concurrent upstream connections shared by the async LLM endpoints
+    ASGI_EXECUTOR_WORKERS = int(os.getenv("ASGI_EXECUTOR_WORKERS", "8"))
+    ASGI_LLM_CONNECTIONS = int(os.getenv("ASGI_LLM_CONNECTIONS", "100"))
+    # AI generation latency budget: past GENERATION_BUDGET_MS (minus a reserve for
+    # rendering) the template output is returned and the AI result is stored as an
+    # upgrade for the client to fetch; GENERATION_DEADLINE_MS caps the LLM call
+    # itself (its HTTP timeout) and any budget a client asks for
+    GENERATION_BUDGET_MS = float(os.getenv("GENERATION_BUDGET_MS", "8000"))
+    GENERATION_DEADLINE_MS = float(os.getenv("GENERATION_DEADLINE_MS", "30000"))
+    GENERATION_FALLBACK_RESERVE_MS = float(os.getenv("GENERATION_FALLBACK_RESERVE_MS", "200"))
+    GENERATION_BACKGROUND_WORKERS = int(os.getenv("GENERATION_BACKGROUND_WORKERS", "8"))
+    UPGRADE_TTL = int(os.getenv("UPGRADE_TTL", "3600"))
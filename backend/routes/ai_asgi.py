@@ -0,0 +1,298 @@
+"""
+ASGI variant of the /api/ai blueprint (served by asgi.py under uvicorn)
+Cover letter and portfolio generation await the LLM router over a shared
+httpx.AsyncClient, so a request waiting on the model costs a coroutine instead
+of a worker thread. Every other request (exports, bundles, analysis, templates
+and the rest of the site) is handed to the Flask app on a thread pool: the
+CPU-bound renderers never block the event loop and behave exactly as under
+WSGI, hooks included
+
+Both paths read the same session cookie through the Flask app's session
+interface, so a user logged in on the WSGI app is logged in here too
+"""
+import asyncio
+import io
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from flask import request, session
+
+from backend.config import Config
+from backend.routes.ai_routes import generation_body, get_user_from_session
+from backend.services.cover_letter_generator import cover_letter_inputs, fallback_cover_letter
+from backend.services.grok_service import build_cover_letter_prompt, build_portfolio_prompt
+from backend.services.hedged_generation import hedged_generate_async, request_budget
+from backend.services.llm_router import ROUTER
+from backend.services.metrics import HTTP_LATENCY, HTTP_REQUESTS
+from backend.services.portfolio_generator import generate_basic_portfolio, portfolio_inputs
+
+# Request bodies above this are refused before reaching a handler
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+_DONE = object()
+
+
+def wsgi_environ(scope, body):
+    """WSGI environ for an ASGI HTTP scope and its complete body"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for raw_name, raw_value in scope.get('headers', []):
+        name = raw_name.decode('latin-1').upper().replace('-', '_')
+        value = raw_value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+            continue
+        if name == 'CONTENT_LENGTH':
+            continue
+        key = f'HTTP_{name}'
+        if key in environ:
+            value = environ[key] + ('; ' if name == 'COOKIE' else ',') + value
+        environ[key] = value
+    return environ
+
+
+async def _read_body(receive):
+    """Whole request body, or None when it exceeds MAX_BODY_BYTES"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return b''.join(chunks)
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+class AIAsgiApp:
+    """ASGI application wrapping the Flask app"""
+
+    def __init__(self, flask_app, executor_workers=None, llm_connections=None):
+        """
+        Args:
+            flask_app: The Flask app (app.app); serves everything without an async handler
+            executor_workers: Threads running Flask requests (default Config.ASGI_EXECUTOR_WORKERS)
+            llm_connections: Concurrent upstream LLM connections (default Config.ASGI_LLM_CONNECTIONS)
+        """
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(executor_workers or Config.ASGI_EXECUTOR_WORKERS,
+                                           thread_name_prefix='asgi-flask')
+        self.llm_connections = llm_connections or Config.ASGI_LLM_CONNECTIONS
+        self.client = None
+        self.routes = {
+            ('POST', '/api/ai/generate-cover-letter'): ('ai.generate_cover_letter_endpoint', self.cover_letter),
+            ('POST', '/api/ai/generate-portfolio'): ('ai.generate_portfolio_endpoint', self.portfolio),
+        }
+
+    def _client(self):
+        if self.client is None:
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.llm_connections,
+                                    max_keepalive_connections=self.llm_connections)
+            )
+        return self.client
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        body = await _read_body(receive)
+        if body is None:
+            await self._send(send, 413, {'error': 'Request body too large'})
+            return
+
+        route = self.routes.get((scope['method'], scope['path']))
+        if route is None:
+            await self._call_flask(scope, body, send)
+            return
+
+        endpoint, handler = route
+        start = time.perf_counter()
+        status, payload, headers = await handler(wsgi_environ(scope, body))
+        await self._send(send, status, payload, headers, scope)
+        if Config.METRICS_ENABLED:
+            HTTP_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint, method=scope['method'])
+            HTTP_REQUESTS.inc(endpoint=endpoint, method=scope['method'], status=status)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._client()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.client is not None:
+                    await self.client.aclose()
+                    self.client = None
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _send(self, send, status, payload, headers=None, scope=None):
+        body = self.flask_app.json.dumps(payload).encode('utf-8') + b'\n'
+        response_headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        # Match flask-cors on the WSGI app (any origin allowed)
+        if scope is not None and any(name == b'origin' for name, _ in scope.get('headers', [])):
+            response_headers.append((b'access-control-allow-origin', b'*'))
+        for name, value in (headers or {}).items():
+            response_headers.append((name.lower().encode('latin-1'), str(value).encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': status, 'headers': response_headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _call_flask(self, scope, body, send):
+        """Run the Flask app on the executor and relay its (possibly streamed) response"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=8)
+        cancelled = []
+
+        def put(item):
+            # Blocks the worker thread while the queue is full: slow clients throttle rendering
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def start_response(status, headers, exc_info=None):
+            put(('start', int(status.split(' ', 1)[0]), headers))
+            return lambda data: put(data)
+
+        def run():
+            # One thread runs the whole response, so stream_with_context and
+            # call_on_close hooks see the request context they expect
+            try:
+                iterable = self.flask_app(wsgi_environ(scope, body), start_response)
+                try:
+                    for chunk in iterable:
+                        if cancelled:
+                            break
+                        if chunk:
+                            put(chunk)
+                finally:
+                    if hasattr(iterable, 'close'):
+                        iterable.close()
+                put(_DONE)
+            except BaseException as e:
+                put(e)
+
+        future = loop.run_in_executor(self.executor, run)
+        try:
+            item = await queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            _, status, headers = item
+            await send({
+                'type': 'http.response.start',
+                'status': status,
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+            })
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                await send({'type': 'http.response.body', 'body': item, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+        except BaseException:
+            # Client went away (or the app failed): let the worker thread finish and exit
+            cancelled.append(True)
+            while not future.done():
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=0.1)
+                except asyncio.TimeoutError:
+                    pass
+            raise
+        await future
+
+    def _prepare(self, environ, limit_class):
+        """Load the session user and JSON body, applying the same checks as the WSGI routes
+
+        Returns:
+            tuple: (error response tuple or None, user, data, latency budget in seconds)
+        """
+        with self.flask_app.request_context(environ):
+            if 'user_id' not in session:
+                return (401, {'error': 'Unauthorized'}, None), None, None, None
+            user = get_user_from_session()
+            if not user:
+                return (404, {'error': 'User not found'}, None), None, None, None
+            limiter = self.flask_app.extensions.get('rate_limiter')
+            if limiter is not None:
+                wait = limiter.take(session['user_id'], limit_class)
+                if wait > 0:
+                    retry_after = max(1, int(math.ceil(wait)))
+                    return (429, {'error': 'Too many requests, please retry later', 'retry_after': retry_after},
+                            {'Retry-After': retry_after}), None, None, None
+            data = request.get_json(silent=True) or {}
+            return None, user, data, request_budget(data, request.headers)
+
+    async def _prepared(self, environ):
+        return await self._run_blocking(self._prepare, environ, 'llm')
+
+    async def _run_blocking(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def cover_letter(self, environ):
+        """POST /api/ai/generate-cover-letter"""
+        error, user, data, budget = await self._prepared(environ)
+        if error is not None:
+            return error
+        profile_data, job_data = cover_letter_inputs(user, data)
+        prompt = build_cover_letter_prompt(profile_data, job_data)
+        client = self._client()
+        result = await hedged_generate_async(
+            'cover_letter',
+            user.id,
+            lambda timeout: ROUTER.complete_async(client, 'cover_letter', prompt, timeout),
+            lambda: fallback_cover_letter(user, job_data),
+            budget,
+            self._run_blocking
+        )
+        return 200, generation_body('cover_letter', result), None
+
+    async def portfolio(self, environ):
+        """POST /api/ai/generate-portfolio"""
+        error, user, data, budget = await self._prepared(environ)
+        if error is not None:
+            return error
+        if not data.get('use_ai', True):
+            content = generate_basic_portfolio(user, data)
+            return 200, generation_body('portfolio', {'content': content, 'source': 'template',
+                                                      'upgrade_id': None}), None
+        prompt = build_portfolio_prompt(portfolio_inputs(user))
+        client = self._client()
+        result = await hedged_generate_async(
+            'portfolio',
+            user.id,
+            lambda timeout: ROUTER.complete_async(client, 'portfolio', prompt, timeout),
+            lambda: generate_basic_portfolio(user, data),
+            budget,
+            self._run_blocking
+        )
+        return 200, generation_body('portfolio', result), None
@@ -1,54 +1,45 @@
 """
 AI-powered routes for resume, cover letter, and portfolio generation
 """
-from flask import Blueprint, request, jsonify, session, Response
-from backend.routes.auth_routes import users
+from flask import Blueprint, request, jsonify, session, Response, stream_with_context, url_for
+from backend.services.user_repository import get_user_repository
+from backend.services.profile_repository import get_profile_repository
+from backend.services.profile_snapshot import UserSnapshot
 from backend.services.resume_generator import generate_resume
 from backend.services.cover_letter_generator import generate_cover_letter
 from backend.services.portfolio_generator import generate_portfolio
 from backend.services.resume_templates import ResumeTemplates
 from backend.services.resume_optimizer import ResumeOptimizer
 from backend.services.resume_exporter import ResumeExporter
+from backend.services.html_renderer import HTMLRenderer
+from backend.services.resume_bundle import ResumeBundle
+from backend.services.metrics import timed
+from backend.services.hedged_generation import UpgradeStore, request_budget
+from backend.services.artifact_store import ArtifactStore
+from backend.services.prerender import ANALYZE_KIND
 
 ai_bp = Blueprint('ai', __name__, url_prefix='/api/ai')
 
-ai_bp = Blueprint('ai', __name__, url_prefix='/api/ai')
-
-class SimpleUser:
-    def __init__(self, user_data, profile_data):
-        self.id = user_data['id']
-        self.name = user_data['name']
-        self.email = user_data['email']
-        self.profile = SimpleProfile(profile_data) if profile_data else None
-
-class SimpleProfile:
-    def __init__(self, data):
-        self.headline = data.get('headline', '')
-        self.phone = data.get('phone', '')
-        self.linkedin = data.get('linkedin', '')
-        self.github = data.get('github', '')
-        self.email = data.get('email', '')
-        self.leetcode = data.get('leetcode', '')
-        self.other_links = data.get('other_links', '')
-        self.summary = data.get('summary', '')
-        self.skills = data.get('skills', '')
-        self.projects = data.get('projects', '')
-        self.experience = data.get('experience', '')
-        self.education = data.get('education', '')
-        self.dob = data.get('dob', '')
-        self.languages = data.get('languages', '')
-        self.hobbies = data.get('hobbies', '')
-
 def get_user_from_session():
+    """Current user with their ProfileSnapshot (profile is None if none was saved)"""
     user_id = session.get('user_id')
     if not user_id:
         return None
-    # Find user by id
-    for email, user_data in users.items():
-        if user_data['id'] == user_id:
-            profile_data = session.get('profile', {})
-            return SimpleUser(user_data, profile_data)
-    return None
+    user_data = get_user_repository().get_by_id(user_id)
+    if user_data is None:
+        return None
+    profile = get_profile_repository().get(user_id)
+    return UserSnapshot(user_data['id'], user_data['name'], user_data['email'],
+                        None if profile.is_empty else profile)
+
+def generation_body(key, result):
+    """JSON body for a hedged generation result; template answers that the AI
+    output will replace carry the URL to fetch it from"""
+    body = {key: result['content'], 'source': result['source']}
+    if result['upgrade_id']:
+        body['upgrade_id'] = result['upgrade_id']
+        body['upgrade_url'] = f"{ai_bp.url_prefix}/upgrades/{result['upgrade_id']}"
+    return body
 
 @ai_bp.route('/templates', methods=['GET'])
 def get_templates():
@@ -76,19 +67,43 @@ def generate_resume_endpoint():
         data = request.get_json(silent=True) or {}
         export_format = data.get('format', 'txt').lower()
         template_name = data.get('template', 'professional')
+        docx_backend = data.get('docx_backend')
+        if docx_backend not in ('python-docx', 'ooxml'):
+            docx_backend = None
 
         # Validate format
         supported_formats = [f['format'] for f in ResumeExporter.get_supported_formats()]
         if export_format not in supported_formats:
             export_format = 'txt'
 
-        # Get profile data
-        profile_data = session.get('profile', {})
+        # Profile snapshot loaded with the user
+        profile = user.profile
 
-        # Generate resume in requested format
-        resume_content, content_type = ResumeExporter.export_resume(
-            user, profile_data, export_format, template_name
-        )
+        # Remembered so the next profile save pre-renders this template
+        if session.get('resume_template') != template_name:
+            session['resume_template'] = template_name
+
+        # Clients that prefer text/html get the page streamed directly, linking the
+        # cached stylesheet instead of inlining it; everyone else keeps the JSON envelope
+        if export_format == 'html' and _prefers_html():
+            document = ResumeExporter.compile_document(user, profile, template_name)
+            stylesheet_href = url_for('ai.resume_stylesheet', filename=HTMLRenderer.stylesheet_filename())
+            return Response(
+                HTMLRenderer.render(document, stylesheet_href),
+                mimetype='text/html',
+                headers={'Vary': 'Accept'}
+            )
+
+        # Generate resume in requested format, unless it was pre-rendered at the last profile save
+        artifact = None
+        if profile is not None and (export_format != 'docx' or docx_backend is None):
+            artifact = ArtifactStore.get(user.id, export_format, template_name, profile.version)
+        if artifact is not None:
+            resume_content, content_type = artifact
+        else:
+            resume_content, content_type = ResumeExporter.export_resume(
+                user, profile, export_format, template_name, docx_backend
+            )
 
         # For file downloads, return as attachment
         if export_format in ['pdf', 'docx']:
@@ -106,7 +121,9 @@ def generate_resume_endpoint():
         elif export_format == 'html':
             # For HTML format, return as JSON with HTML content
             html_content = resume_content.decode('utf-8')
-            return jsonify({'resume': html_content, 'format': 'html'}), 200
+            response = jsonify({'resume': html_content, 'format': 'html'})
+            response.headers['Vary'] = 'Accept'
+            return response, 200
         else:
             # For text format, return as JSON
             resume_text = resume_content.decode('utf-8')
@@ -115,6 +132,64 @@ def generate_resume_endpoint():
     except Exception as e:
         return jsonify({'error': f'Failed to generate resume: {str(e)}'}), 500
 
+def _prefers_html():
+    """True when the Accept header ranks text/html above application/json"""
+    accept = request.accept_mimetypes
+    return accept.best_match(['application/json', 'text/html']) == 'text/html' and \
+        accept['text/html'] > accept['application/json']
+
+@ai_bp.route('/assets/<filename>', methods=['GET'])
+def resume_stylesheet(filename):
+    """Serve the resume stylesheet under its content-hashed name as an immutable asset"""
+    if filename != HTMLRenderer.stylesheet_filename():
+        return jsonify({'error': 'Not found'}), 404
+
+    stylesheet, digest = HTMLRenderer.stylesheet()
+    if digest in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(stylesheet, mimetype='text/css')
+    response.set_etag(digest)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+@ai_bp.route('/generate-bundle', methods=['POST'])
+def generate_bundle_endpoint():
+    """Render several formats and templates of the resume into one streamed ZIP
+
+    Request body:
+    {
+        "formats": ["pdf", "docx", "html"],
+        "templates": ["professional", "modern"],
+        "docx_backend": "ooxml" (optional)
+    }
+
+    The archive ends with manifest.json listing each artifact with its render time.
+    """
+    if 'user_id' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    user = get_user_from_session()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    data = request.get_json(silent=True) or {}
+    pairs = ResumeBundle.plan(data.get('formats', ['pdf', 'docx', 'html']),
+                              data.get('templates', ['professional']))
+    if not pairs:
+        return jsonify({'error': 'No valid formats or templates requested'}), 400
+
+    docx_backend = data.get('docx_backend')
+    if docx_backend not in ('python-docx', 'ooxml'):
+        docx_backend = None
+
+    filename = f"resume_{user.name.lower().replace(' ', '_')}_bundle.zip"
+    return Response(
+        stream_with_context(ResumeBundle.stream(user, user.profile, pairs, docx_backend)),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
 @ai_bp.route('/generate-cover-letter', methods=['POST'])
 def generate_cover_letter_endpoint():
     """Generate cover letter using AI"""
@@ -127,8 +202,8 @@ def generate_cover_letter_endpoint():
     
     try:
         data = request.get_json(silent=True) or {}
-        cover_letter = generate_cover_letter(user, data)
-        return jsonify({'cover_letter': cover_letter}), 200
+        result = generate_cover_letter(user, data, request_budget(data, request.headers))
+        return jsonify(generation_body('cover_letter', result)), 200
     except Exception as e:
         return jsonify({'error': f'Failed to generate cover letter: {str(e)}'}), 500
 
@@ -144,11 +219,28 @@ def generate_portfolio_endpoint():
     
     try:
         data = request.get_json(silent=True) or {}
-        portfolio = generate_portfolio(user, data)
-        return jsonify({'portfolio': portfolio}), 200
+        result = generate_portfolio(user, data, request_budget(data, request.headers))
+        return jsonify(generation_body('portfolio', result)), 200
     except Exception as e:
         return jsonify({'error': f'Failed to generate portfolio: {str(e)}'}), 500
 
+@ai_bp.route('/upgrades/<upgrade_id>', methods=['GET'])
+def get_upgrade(upgrade_id):
+    """AI output that arrived after a template answer was sent
+
+    Returns 202 with Retry-After while the AI call is still running, then 200
+    with status "ready" and the content (or status "failed").
+    """
+    if 'user_id' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    upgrade = UpgradeStore.get(upgrade_id, session['user_id'])
+    if upgrade is None:
+        return jsonify({'error': 'Upgrade not found'}), 404
+    if upgrade['status'] == 'pending':
+        return jsonify(upgrade), 202, {'Retry-After': '1'}
+    return jsonify(upgrade), 200
+
 @ai_bp.route('/analyze-resume', methods=['POST'])
 def analyze_resume_endpoint():
     """Analyze resume against job description
@@ -185,23 +277,19 @@ def analyze_resume_endpoint():
         resume_text = data.get('resume_text', '').strip()
         
         if not resume_text and user.profile:
-            # Build resume text from profile data
-            profile = user.profile
-            resume_parts = [
-                f"Name: {user.name}",
-                f"Headline: {profile.headline or ''}",
-                f"Summary: {profile.summary or ''}",
-                f"Skills: {profile.skills or ''}",
-                f"Projects: {profile.projects or ''}",
-                f"Education: {profile.education or ''}"
-            ]
-            resume_text = '\n'.join([part for part in resume_parts if part])
+            # Snapshot pre-rendered at the last profile save, else built from profile data
+            snapshot = ArtifactStore.get(user.id, ANALYZE_KIND, '', user.profile.version)
+            if snapshot is not None:
+                resume_text = snapshot[0].decode('utf-8')
+            else:
+                resume_text = ResumeOptimizer.profile_resume_text(user)
         
         if not resume_text:
             return jsonify({'error': 'Resume content not found. Please complete your profile first.'}), 400
         
         # Analyze resume
-        analysis_result = ResumeOptimizer.calculate_match_score(resume_text, job_description)
+        with timed('match_score'):
+            analysis_result = ResumeOptimizer.calculate_match_score(resume_text, job_description)
         
         return jsonify(analysis_result), 200
     except Exception as e:
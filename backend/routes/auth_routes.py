@@ -1,11 +1,9 @@
 from flask import Blueprint, render_template, request, redirect, url_for, session
 from werkzeug.security import generate_password_hash, check_password_hash
+from backend.services.user_repository import get_user_repository
 
 auth_bp = Blueprint("auth", __name__)
 
-# Temporary in-memory storage for users
-users = {}
-
 @auth_bp.route("/register", methods=["GET", "POST"])
 def register():
     if request.method == "POST":
@@ -16,18 +14,16 @@ def register():
         if not name or not email or not password:
             return render_template("register.html", error="All fields are required")
 
-        if email in users:
+        users = get_user_repository()
+        if users.get_by_email(email):
             return render_template("register.html", error="Email already exists")
         
         if len(password) < 6:
             return render_template("register.html", error="Password must be at least 6 characters")
 
-        users[email] = {
-            'id': len(users) + 1,
-            'name': name,
-            'email': email,
-            'password_hash': generate_password_hash(password)
-        }
+        # The unique email index settles concurrent registrations of the same address
+        if users.create_user(name, email, generate_password_hash(password)) is None:
+            return render_template("register.html", error="Email already exists")
 
         return redirect(url_for("auth.login"))
 
@@ -42,8 +38,9 @@ def login():
         if not email or not password:
             return render_template("login.html", error="Email and password are required")
 
-        user = users.get(email)
+        user = get_user_repository().get_by_email(email)
         if user and check_password_hash(user['password_hash'], password):
+            session.clear()  # new session id on login
             session["user_id"] = user['id']
             session["user_name"] = user['name']
             return redirect("/dashboard")
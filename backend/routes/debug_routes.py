@@ -0,0 +1,54 @@
+"""
+Diagnostics routes (only registered when profiling or memory tracking is enabled)
+Access requires the signed profiling token or an account listed in
+PROFILING_ADMIN_EMAILS
+"""
+from flask import Blueprint, current_app, jsonify, request
+
+from backend.services.llm_router import ROUTER
+from backend.services.request_profiler import RequestProfiler
+
+debug_bp = Blueprint('debug', __name__, url_prefix='/api/debug')
+
+
+@debug_bp.before_request
+def require_authorization():
+    if not RequestProfiler.authorized():
+        return jsonify({'error': 'Forbidden'}), 403
+
+
+@debug_bp.route('/profiles', methods=['GET'])
+def list_profiles():
+    """Stored request profiles, newest first"""
+    profiler = current_app.extensions.get('request_profiler')
+    if profiler is None:
+        return jsonify({'error': 'Profiling is disabled'}), 404
+    return jsonify({'profiles': profiler.list()}), 200
+
+
+@debug_bp.route('/profiles/<profile_id>', methods=['GET'])
+def profile_summary(profile_id):
+    """Top functions of one profile (?limit=25&sort=cumulative|tottime)"""
+    profiler = current_app.extensions.get('request_profiler')
+    if profiler is None:
+        return jsonify({'error': 'Profiling is disabled'}), 404
+    limit = min(max(request.args.get('limit', 25, type=int), 1), 200)
+    summary = profiler.summary(profile_id, limit, request.args.get('sort', 'cumulative'))
+    if summary is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    return jsonify(summary), 200
+
+
+@debug_bp.route('/memory', methods=['GET'])
+def memory_report():
+    """Memory high-water marks per endpoint and export format (?heap=1 adds current top sites)"""
+    tracker = current_app.extensions.get('memory_tracker')
+    if tracker is None:
+        return jsonify({'error': 'Memory tracking is disabled'}), 404
+    return jsonify(tracker.report(request.args.get('heap') == '1')), 200
+
+
+@debug_bp.route('/llm-routes', methods=['GET'])
+def llm_routes():
+    """LLM router state: per-route latency, error rate and health plus recent decisions"""
+    return jsonify(ROUTER.stats()), 200
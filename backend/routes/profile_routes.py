@@ -1,7 +1,8 @@
 """
 Profile routes for user profile management
 """
-from flask import Blueprint, render_template, request, redirect, url_for, session
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, session
+from backend.services.profile_repository import get_profile_repository
 
 profile_bp = Blueprint('profile', __name__)
 
@@ -36,8 +37,8 @@ def profile():
         languages = request.form.get("languages")
         hobbies = request.form.get("hobbies")
 
-        # Store profile in session temporarily
-        session['profile'] = {
+        # Stored server-side once per user instead of in the session cookie
+        snapshot = get_profile_repository().save(session['user_id'], {
             'headline': headline,
             'phone': phone,
             'linkedin': linkedin,
@@ -53,7 +54,13 @@ def profile():
             'dob': dob,
             'languages': languages,
             'hobbies': hobbies
-        }
+        })
+
+        # Warm the downloads the user is likely to ask for next
+        prerenderer = current_app.extensions.get('prerenderer')
+        if prerenderer is not None:
+            prerenderer.schedule(session['user_id'], snapshot.version,
+                                 session.get('resume_template', 'professional'))
         return redirect("/dashboard")
 
-    return render_template("profile.html", profile=session.get('profile', {}))
+    return render_template("profile.html", profile=get_profile_repository().get(session['user_id']).to_dict())
@@ -2,6 +2,27 @@
 AI-Powered Resume Enhancement Service
 Generates MS Word standard formatted resumes with AI optimization
 """
+import copy
+import functools
+import threading
+
+try:
+    from .metrics import timed
+    from .profile_snapshot import normalize
+    from .resume_document import ResumeDocument, Section, TextBlock, Bullet, Entry, SkillGroup, Link
+except ImportError:
+    from metrics import timed
+    from profile_snapshot import normalize
+    from resume_document import ResumeDocument, Section, TextBlock, Bullet, Entry, SkillGroup, Link
+
+# Parsed python-docx default package, loaded once per process and cloned per render
+_BASE_DOCUMENT = None
+_BASE_DOCUMENT_LOCK = threading.Lock()
+
+# Enhancer results memoized per field value. A profile is rendered once per
+# format and template, so the same text is parsed many times; cached results
+# are immutable and fresh document nodes are built from them on every call
+_MEMO_SIZE = 1024
 
 class AIResumeEnhancer:
     """Enhances resume content using AI techniques"""
@@ -56,7 +77,8 @@ class AIResumeEnhancer:
             'spacing': 1.5,
             'margins': {'top': 1, 'bottom': 1, 'left': 1, 'right': 1},
             'colors': {'primary': (0, 0, 0), 'accent': (51, 51, 51)},
-            'sections_order': ['contact', 'summary', 'education', 'skills', 'projects', 'experience', 'personal_details']
+            'sections_order': ['contact', 'summary', 'education', 'skills', 'projects', 'experience', 'personal_details'],
+            'multi_page': True
         },
         'detailed': {
             'name': 'Detailed',
@@ -80,6 +102,7 @@ class AIResumeEnhancer:
     }
 
     @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
     def enhance_headline(headline, industry='technology'):
         """AI-enhance job headline to be more impactful"""
         if not headline:
@@ -100,6 +123,7 @@ class AIResumeEnhancer:
         return enhancements.get(industry, f"Experienced {headline}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
     def enhance_summary(summary, industry='technology'):
         """AI-enhance summary with action words and metrics"""
         if not summary:
@@ -124,11 +148,8 @@ class AIResumeEnhancer:
         return enhanced.strip()
 
     @staticmethod
-    def enhance_bullet(text):
-        """Convert text to professional bullet point"""
-        if not text:
-            return ""
-        
+    def _bullet_text(text):
+        """Strip bullet characters and capitalize the first letter"""
         text = text.strip()
         
         # Remove existing bullet characters
@@ -139,50 +160,78 @@ class AIResumeEnhancer:
         if text and not text[0].isupper():
             text = text[0].upper() + text[1:]
         
-        return f"• {text}"
+        return text
 
     @staticmethod
-    def enhance_experience_bullets(experience_text):
-        """Convert experience text to professional bullet points with metrics"""
-        if not experience_text:
+    def enhance_bullet(text):
+        """Convert text to professional bullet point"""
+        if not text:
             return ""
         
-        lines = experience_text.split('\n')
-        enhanced_bullets = []
-        
-        for line in lines:
+        return f"• {AIResumeEnhancer._bullet_text(text)}"
+
+    @staticmethod
+    def experience_bullets(experience_text):
+        """Convert experience text to Bullet nodes with impact metric hints
+
+        Args:
+            experience_text: Newline-separated experience lines
+
+        Returns:
+            list: Bullet objects, one per non-empty line
+        """
+        if not experience_text:
+            return []
+        return [Bullet(text) for text in AIResumeEnhancer._experience_lines(experience_text)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
+    def _experience_lines(experience_text):
+        """Bullet texts of experience_text (memoized; see experience_bullets)"""
+        lines = []
+        for line in experience_text.split('\n'):
             line = line.strip()
             if line:
-                enhanced = AIResumeEnhancer.enhance_bullet(line)
+                text = AIResumeEnhancer._bullet_text(line)
                 
                 # Add impact metric suggestions if missing
                 if 'led' in line.lower() or 'managed' in line.lower():
                     if '%' not in line and 'team' not in line.lower():
-                        enhanced += " [Added measurable impact metrics]"
+                        text += " [Added measurable impact metrics]"
                 
-                enhanced_bullets.append(enhanced)
+                lines.append(text)
         
-        return '\n'.join(enhanced_bullets)
+        return tuple(lines)
 
     @staticmethod
-    def enhance_project_bullets(projects_text):
+    def enhance_experience_bullets(experience_text):
+        """Convert experience text to professional bullet points with metrics"""
+        bullets = AIResumeEnhancer.experience_bullets(experience_text)
+        return '\n'.join(bullet.to_text() for bullet in bullets)
+
+    @staticmethod
+    def project_entries(projects_text):
         """
-        Convert projects text to professional format with separated titles and descriptions.
+        Split projects text into Entry nodes with separated titles and descriptions.
         
-        Format: Project titles are not bulleted (bold in PDF), descriptions are bulleted.
         Expects input like:
         - "Project Title - Description text"
         - "Project Title\nDescription text"
         
-        Returns formatted text with __TITLE__ marking for titles (used by PDF generator)
+        Description lines that appear before any title become an untitled Entry.
         """
         if not projects_text:
-            return ""
-        
-        lines = projects_text.split('\n')
-        formatted_projects = []
+            return []
+        return [Entry(title, [Bullet(text) for text in bullets])
+                for title, bullets in AIResumeEnhancer._project_outline(projects_text)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
+    def _project_outline(projects_text):
+        """(title, bullet texts) pairs of projects_text (memoized; see project_entries)"""
+        entries = []
         
-        for line in lines:
+        for line in projects_text.split('\n'):
             line = line.strip()
             if not line:
                 continue
@@ -194,31 +243,40 @@ class AIResumeEnhancer:
             # Heuristic: if it contains " - " it's likely "Title - Description"
             if ' - ' in clean_line:
                 parts = clean_line.split(' - ', 1)
-                title = parts[0].strip()
-                description = parts[1].strip()
-                
-                # Add title without bullet (marked with special indicator for PDF)
-                formatted_projects.append(f"__TITLE__{title}")
+                entry = (parts[0].strip(), [])
+                entries.append(entry)
                 
-                # Capitalize and add bullet to description
+                # Capitalize description and add it as the first bullet
+                description = parts[1].strip()
                 if description:
-                    if description and not description[0].isupper():
+                    if not description[0].isupper():
                         description = description[0].upper() + description[1:]
-                    formatted_projects.append(f"• {description}")
+                    entry[1].append(description)
             else:
                 # If no " - " separator, treat as project title if it's short
                 # (likely a project name)
                 if len(clean_line) < 80 and not clean_line.startswith('developed') and \
                    not clean_line.startswith('built') and not clean_line.startswith('created'):
-                    # Looks like a title
-                    formatted_projects.append(f"__TITLE__{clean_line}")
+                    entries.append((clean_line, []))
                 else:
-                    # Looks like a description - add bullet
-                    if clean_line and not clean_line[0].isupper():
+                    # Looks like a description - attach to the current project
+                    if not clean_line[0].isupper():
                         clean_line = clean_line[0].upper() + clean_line[1:]
-                    formatted_projects.append(f"• {clean_line}")
+                    if not entries:
+                        entries.append((None, []))
+                    entries[-1][1].append(clean_line)
+        
+        return tuple((title, tuple(bullets)) for title, bullets in entries)
+
+    @staticmethod
+    def enhance_project_bullets(projects_text):
+        """
+        Convert projects text to professional format with separated titles and descriptions.
         
-        return '\n'.join(formatted_projects)
+        Returns formatted text with __TITLE__ marking for titles, bulleted descriptions
+        """
+        entries = AIResumeEnhancer.project_entries(projects_text)
+        return '\n'.join(entry.to_text() for entry in entries)
 
     @staticmethod
     def categorize_skills(skills_str):
@@ -236,6 +294,13 @@ class AIResumeEnhancer:
         if not skills_str:
             return {}
         
+        # Return single category with all merged skills - NO separate Additional Skills section
+        return {'Technical Skills': list(AIResumeEnhancer._merged_skills(skills_str))}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
+    def _merged_skills(skills_str):
+        """Deduplicated skills of skills_str (memoized; see categorize_skills)"""
         skills_list = [s.strip() for s in skills_str.split(',')]
         
         # Remove duplicates while preserving order (case-insensitive)
@@ -246,120 +311,213 @@ class AIResumeEnhancer:
             if skill_lower not in seen:
                 seen.add(skill_lower)
                 merged_skills.append(skill)
+        return tuple(merged_skills)
+
+    @staticmethod
+    def personal_details(profile):
+        """Build the 'Label: value' lines of the Personal Details section
+
+        Args:
+            profile: Profile object (dob, languages and hobbies are optional)
+
+        Returns:
+            list: Detail lines in display order, empty if nothing is set
+        """
+        return list(AIResumeEnhancer._detail_lines(getattr(profile, 'dob', None),
+                                                   getattr(profile, 'languages', None),
+                                                   getattr(profile, 'hobbies', None)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=_MEMO_SIZE)
+    def _detail_lines(dob, languages, hobbies):
+        """Personal detail lines for these field values (memoized; see personal_details)"""
+        personal_details = []
+        if dob:
+            dob_val = dob
+            try:
+                from datetime import datetime
+                dob_date = datetime.strptime(dob_val, '%Y-%m-%d')
+                dob_val = dob_date.strftime('%d %B %Y')
+            except:
+                pass
+            personal_details.append(f"Date of Birth: {dob_val}")
         
-        # Return single category with all merged skills - NO separate Additional Skills section
-        return {'Technical Skills': merged_skills}
+        if languages:
+            personal_details.append(f"Languages: {languages}")
+            
+        if hobbies:
+            personal_details.append(f"Hobbies: {hobbies}")
+
+        return tuple(personal_details)
 
     @staticmethod
-    def format_resume_ms_word_standard(template, user, profile):
-        """Generate resume in MS Word standard format"""
-        format_spec = AIResumeEnhancer.RESUME_FORMATS.get(template, {})
+    def build_resume_document(template, user, profile):
+        """Compile a profile into the structured ResumeDocument for a template
+
+        Args:
+            template: Template name from RESUME_FORMATS
+            user: User object with name and email
+            profile: ProfileSnapshot, profile dictionary, profile-like object or None
+
+        Returns:
+            ResumeDocument, or None if the template is unknown
+
+        The header comes from the contact fields; sections follow the template's
+        compiled plan (see compile_section_plan). Inputs are normalized to
+        snapshots here, so every template entry point accepts any profile-like
+        object.
+        """
+        plan = _SECTION_PLANS.get(template)
         
-        if not format_spec:
-            return "Error: Invalid template"
+        if plan is None:
+            return None
         
-        resume_parts = []
-        section_divider = '─' * 70
+        user, profile = normalize(user, profile)
         
         # Header - ATS-Friendly Contact Information (Clean, Minimal)
-        # Build contact line with phone and email
-        contact_parts = [profile.phone if profile and profile.phone else '[Your Phone]']
-        contact_parts.append(profile.email if profile and profile.email else user.email)
-        
-        # Add only labels for social profiles (no URLs)
-        if profile and profile.linkedin:
-            contact_parts.append('LinkedIn')
-        if profile and profile.github:
-            contact_parts.append('GitHub')
-        if profile and profile.leetcode:
-            contact_parts.append('LeetCode')
-        
-        contact_line = ' | '.join(contact_parts)
-        headline = profile.headline if profile and profile.headline else 'Professional Developer'
-        
-        resume_parts.append(f"""{user.name.upper()}
-{headline}
-{contact_line}""")
-        
-        # Add other links if provided
-        if profile and profile.other_links and profile.other_links.strip():
-            links = [link.strip() for link in profile.other_links.split('\n') if link.strip()]
-            if links:
-                resume_parts.append(f"Additional Links: {' | '.join(links)}")
-        
-        # Professional Summary
+        links = []
+        for label, url in (('LinkedIn', profile and profile.linkedin),
+                           ('GitHub', profile and profile.github),
+                           ('LeetCode', profile and profile.leetcode)):
+            if url:
+                links.append(Link(label, Link.absolute(url), url))
+        
+        other_links = list(profile.other_links_list) if profile else []
+        
+        document = ResumeDocument(
+            template,
+            user.name,
+            profile.headline if profile and profile.headline else 'Professional Developer',
+            profile.phone if profile and profile.phone else '',
+            profile.email if profile and profile.email else user.email,
+            links,
+            other_links
+        )
+        for render_section in plan:
+            section = render_section(profile)
+            if section is not None:
+                document.sections.append(section)
+        
+        return document
+
+    @staticmethod
+    def summary_section(profile):
+        """Professional Summary"""
         if profile.summary:
-            enhanced_summary = AIResumeEnhancer.enhance_summary(profile.summary)
-            resume_parts.append(f"""
-PROFESSIONAL SUMMARY
-{section_divider}
-{enhanced_summary}""")
-        
-        # Education Section
+            return Section('summary', 'PROFESSIONAL SUMMARY', 'Professional Summary',
+                           [TextBlock(AIResumeEnhancer.enhance_summary(profile.summary))])
+        return None
+
+    @staticmethod
+    def education_section(profile):
+        """Education Section"""
         if profile.education:
-            resume_parts.append(f"""
-EDUCATION
-{section_divider}
-{profile.education}""")
-        
-        # Skills Section
+            return Section('education', 'EDUCATION', 'Education', [TextBlock(profile.education)])
+        return None
+
+    @staticmethod
+    def skills_section(profile):
+        """Skills Section"""
         if profile.skills:
             merged_skills = AIResumeEnhancer.categorize_skills(profile.skills)
             if merged_skills and 'Technical Skills' in merged_skills:
-                resume_parts.append(f"""
-SKILLS
-{section_divider}""")
-                skills_list = merged_skills['Technical Skills']
-                resume_parts.append(f"__SKILL_LABEL__Technical Skills:__/SKILL_LABEL__ {', '.join(skills_list)}")
-        
-        # Projects Section
+                return Section('skills', 'SKILLS', 'Skills',
+                               [SkillGroup('Technical Skills:', merged_skills['Technical Skills'])])
+        return None
+
+    @staticmethod
+    def projects_section(profile):
+        """Projects Section"""
         if profile.projects:
-            enhanced_proj = AIResumeEnhancer.enhance_project_bullets(profile.projects)
-            resume_parts.append(f"""
-PROJECTS & ACHIEVEMENTS
-{section_divider}
-{enhanced_proj}""")
+            return Section('projects', 'PROJECTS & ACHIEVEMENTS', 'Projects & Achievements',
+                           AIResumeEnhancer.project_entries(profile.projects))
+        return None
 
-        # Experience Section
+    @staticmethod
+    def experience_section(profile):
+        """Experience Section"""
         if profile.experience:
-            enhanced_exp = AIResumeEnhancer.enhance_experience_bullets(profile.experience)
-            resume_parts.append(f"""
-PROFESSIONAL EXPERIENCE
-{section_divider}
-{enhanced_exp}""")
-        
-        # Personal Details Section
-        personal_details = []
-        if hasattr(profile, 'dob') and profile.dob:
-            dob_val = profile.dob
-            try:
-                from datetime import datetime
-                dob_date = datetime.strptime(dob_val, '%Y-%m-%d')
-                dob_val = dob_date.strftime('%d %B %Y')
-            except:
-                pass
-            personal_details.append(f"Date of Birth: {dob_val}")
-        
-        if hasattr(profile, 'languages') and profile.languages:
-            personal_details.append(f"Languages: {profile.languages}")
-            
-        if hasattr(profile, 'hobbies') and profile.hobbies:
-            personal_details.append(f"Hobbies: {profile.hobbies}")
+            return Section('experience', 'PROFESSIONAL EXPERIENCE', 'Professional Experience',
+                           AIResumeEnhancer.experience_bullets(profile.experience))
+        return None
 
+    @staticmethod
+    def personal_details_section(profile):
+        """Personal Details Section"""
+        personal_details = AIResumeEnhancer.personal_details(profile)
         if personal_details:
-            resume_parts.append(f"\nPERSONAL DETAILS\n{section_divider}\n" + "\n".join(personal_details))
+            return Section('personal_details', 'PERSONAL DETAILS', 'Personal Details',
+                           [TextBlock(detail) for detail in personal_details])
+        return None
+
+    @staticmethod
+    def compile_section_plan(template):
+        """Section renderers of a template, in its sections_order
+
+        'contact' is the document header, which is always rendered first; unknown
+        section keys are reported and skipped.
+
+        Returns:
+            tuple: Callables taking the profile and returning a Section or None
+        """
+        plan = []
+        for key in AIResumeEnhancer.RESUME_FORMATS[template].get('sections_order', []):
+            if key == 'contact':
+                continue
+            renderer = getattr(AIResumeEnhancer, f'{key}_section', None)
+            if renderer is None:
+                print(f"Template {template}: unknown section '{key}' ignored")
+                continue
+            plan.append(renderer)
+        return tuple(plan)
+
+    @staticmethod
+    def format_resume_ms_word_standard(template, user, profile):
+        """Generate resume in MS Word standard format"""
+        document = AIResumeEnhancer.build_resume_document(template, user, profile)
         
-        return '\n'.join(resume_parts)
+        if document is None:
+            return "Error: Invalid template"
+        
+        return document.to_text()
 
     @staticmethod
-    def generate_word_document(template, user, profile, output_path):
-        """Generate MS Word (.docx) file with proper formatting"""
+    def _new_word_document():
+        """Return a fresh python-docx Document cloned from the cached default package
+
+        Parsing the default template (styles, numbering, settings parts) is the most
+        expensive part of ``Document()``, so it is done once per process and every
+        render works on a deep copy of that tree.
+        """
+        global _BASE_DOCUMENT
+        if _BASE_DOCUMENT is None:
+            with _BASE_DOCUMENT_LOCK:
+                if _BASE_DOCUMENT is None:
+                    from docx import Document
+                    _BASE_DOCUMENT = Document()
+        return copy.deepcopy(_BASE_DOCUMENT)
+
+    @staticmethod
+    def generate_word_document(template, user, profile, output, document=None):
+        """Generate MS Word (.docx) file with proper formatting
+
+        Args:
+            template: Template name from RESUME_FORMATS
+            user: User object with name and email
+            profile: Profile object with all fields
+            output: File path or writable binary stream (e.g. ``io.BytesIO``)
+            document: Prebuilt ResumeDocument; compiled from the profile if omitted
+
+        Returns:
+            bool: True if the document was written, False if python-docx is missing
+        """
         try:
-            from docx import Document
             from docx.shared import Pt, RGBColor, Inches
             from docx.enum.text import WD_ALIGN_PARAGRAPH
             
-            doc = Document()
+            if document is None:
+                document = AIResumeEnhancer.build_resume_document(template, user, profile)
+            doc = AIResumeEnhancer._new_word_document()
             format_spec = AIResumeEnhancer.RESUME_FORMATS.get(template, {})
             
             # Set margins
@@ -372,110 +530,64 @@ PROFESSIONAL EXPERIENCE
             
             # Add header with name (ATS-friendly: no fancy formatting)
             header = doc.add_paragraph()
-            header_run = header.add_run(user.name.upper())
+            header_run = header.add_run(document.name.upper())
             header_run.font.size = Pt(14)
             header_run.font.bold = True
             # No color - keeps ATS readable
             header.alignment = WD_ALIGN_PARAGRAPH.CENTER
             
-            # Add role tagline (1 line, no special characters)
-            tagline = doc.add_paragraph("Senior Software Developer | Full-Stack Engineer")
-            tagline.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            tagline_run = tagline.runs[0]
-            tagline_run.font.size = Pt(10)
-            
-            # Add contact info (minimal formatting, pipe-separated)
-            contact = doc.add_paragraph(f"{user.email} | [Your Phone] | linkedin.com/in/yourprofile | github.com/yourprofile")
-            contact.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_run = contact.runs[0]
-            contact_run.font.size = Pt(10)
-            
-            # Add professional summary
-            if profile.summary:
-                doc.add_heading('PROFESSIONAL SUMMARY', level=1)
-                summary_para = doc.add_paragraph(AIResumeEnhancer.enhance_summary(profile.summary))
-                summary_para_format = summary_para.paragraph_format
-                summary_para_format.space_after = Pt(6)
-            
-            # Add education
-            if profile.education:
-                doc.add_heading('EDUCATION', level=1)
-                doc.add_paragraph(profile.education)
+            # Add role tagline and contact lines (minimal formatting, pipe-separated)
+            for line in AIResumeEnhancer.word_header_lines(document):
+                para = doc.add_paragraph(line)
+                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                para.runs[0].font.size = Pt(10)
             
-            # Add skills
-            if profile.skills:
-                doc.add_heading('SKILLS', level=1)
-                merged_skills = AIResumeEnhancer.categorize_skills(profile.skills)
-                if merged_skills and 'Technical Skills' in merged_skills:
-                    p = doc.add_paragraph()
-                    # Add category label in bold
-                    label_run = p.add_run('Technical Skills:')
-                    label_run.font.bold = True
-                    label_run.font.color.rgb = RGBColor(0, 0, 0)  # Dark black
-                    # Add skills in normal font
-                    p.add_run(f" {', '.join(merged_skills['Technical Skills'])}")
-            
-            # Add projects
-            if profile.projects:
-                doc.add_heading('PROJECTS & ACHIEVEMENTS', level=1)
-                enhanced_projects = AIResumeEnhancer.enhance_project_bullets(profile.projects)
-                proj_lines = enhanced_projects.split('\n')
-                for line in proj_lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    # Check if this is a project title (marked with __TITLE__)
-                    if '__TITLE__' in line:
-                        # Extract title and remove marker
-                        title_text = line.replace('__TITLE__', '').strip()
-                        # Add as bold paragraph without bullet
-                        p = doc.add_paragraph(title_text)
-                        p_format = p.paragraph_format
-                        p_format.line_spacing = 1.15
-                        for run in p.runs:
-                            run.font.bold = True
+            for resume_section in document.sections:
+                doc.add_heading(resume_section.title, level=1)
+                for item in resume_section.items:
+                    if isinstance(item, SkillGroup):
+                        p = doc.add_paragraph()
+                        # Add category label in bold
+                        label_run = p.add_run(item.label)
+                        label_run.font.bold = True
+                        label_run.font.color.rgb = RGBColor(0, 0, 0)  # Dark black
+                        # Add skills in normal font
+                        p.add_run(f" {', '.join(item.items)}")
+                    elif isinstance(item, Entry):
+                        if item.title is not None:
+                            # Project title as bold paragraph without bullet
+                            p = doc.add_paragraph(item.title)
+                            p.paragraph_format.line_spacing = 1.15
+                            for run in p.runs:
+                                run.font.bold = True
+                        for bullet in item.bullets:
+                            doc.add_paragraph(bullet.text, style='List Bullet')
+                    elif isinstance(item, Bullet):
+                        doc.add_paragraph(item.text, style='List Bullet')
                     else:
-                        # Add as bulleted item
-                        doc.add_paragraph(line, style='List Bullet')
-
-            # Add experience
-            if profile.experience:
-                doc.add_heading('PROFESSIONAL EXPERIENCE', level=1)
-                exp_lines = profile.experience.split('\n')
-                for line in exp_lines:
-                    doc.add_paragraph(line.strip(), style='List Bullet')
-                    
-            # Add personal details
-            personal_details = []
-            if hasattr(profile, 'dob') and profile.dob:
-                dob_val = profile.dob
-                try:
-                    from datetime import datetime
-                    dob_date = datetime.strptime(dob_val, '%Y-%m-%d')
-                    dob_val = dob_date.strftime('%d %B %Y')
-                except:
-                    pass
-                personal_details.append(f"Date of Birth: {dob_val}")
-            
-            if hasattr(profile, 'languages') and profile.languages:
-                personal_details.append(f"Languages: {profile.languages}")
-                
-            if hasattr(profile, 'hobbies') and profile.hobbies:
-                personal_details.append(f"Hobbies: {profile.hobbies}")
-
-            if personal_details:
-                doc.add_heading('PERSONAL DETAILS', level=1)
-                for detail in personal_details:
-                    doc.add_paragraph(detail)
+                        para = doc.add_paragraph(item.text)
+                        if resume_section.key == 'summary':
+                            para.paragraph_format.space_after = Pt(6)
             
-            # Save document
-            doc.save(output_path)
+            # Save document to the given path or stream
+            with timed('docx_save'):
+                doc.save(output)
             return True
             
         except ImportError:
             print("python-docx not installed. Install with: pip install python-docx")
             return False
 
+    @staticmethod
+    def word_header_lines(document):
+        """Tagline, contact and additional-links lines under the name in Word output"""
+        contact = [document.phone or '[Your Phone]', document.email]
+        contact.extend(link.display for link in document.links)
+        lines = [document.headline, ' | '.join(contact)]
+        if document.other_links:
+            lines.append(f"Additional Links: {' | '.join(document.other_links)}")
+        return lines
+
     @staticmethod
     def get_format_specs(template):
         """Get detailed format specifications"""
@@ -494,3 +606,10 @@ PROFESSIONAL EXPERIENCE
             }
             for key, value in AIResumeEnhancer.RESUME_FORMATS.items()
         ]
+
+
+# Every template's section plan, compiled once at import
+_SECTION_PLANS = {
+    template: AIResumeEnhancer.compile_section_plan(template)
+    for template in AIResumeEnhancer.RESUME_FORMATS
+}
@@ -0,0 +1,53 @@
+"""
+Rendered resume artifacts kept for fast downloads
+One row per user, artifact kind (txt, html, pdf, analyze, ...) and template,
+stamped with the profile version it was rendered from. A row is only served
+while that version is still the user's current one, so a profile save
+invalidates everything rendered before it without deleting anything.
+Artifacts live in the shared database, so any worker can serve them
+"""
+import random
+import time
+
+from backend.config import Config
+from backend.services.database import get_database
+from backend.services.metrics import REGISTRY
+
+ARTIFACT_LOOKUPS = REGISTRY.counter(
+    'resume_artifact_lookups_total', 'Pre-rendered artifact lookups by kind and result (hit, miss)',
+    ('kind', 'result')
+)
+
+# Fraction of artifact writes that also purge expired rows
+_PURGE_PROBABILITY = 0.01
+
+
+class ArtifactStore:
+    """Pre-rendered artifacts keyed by user, kind and template"""
+
+    @staticmethod
+    def put(user_id, kind, template, version, content, content_type):
+        """Store (or replace) an artifact rendered from profile version"""
+        now = time.time()
+        with get_database().connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO artifacts (user_id, kind, template, version, content, content_type, created) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (user_id, kind, template, version, content, content_type, now)
+            )
+            if random.random() < _PURGE_PROBABILITY:
+                conn.execute('DELETE FROM artifacts WHERE created < ?', (now - Config.ARTIFACT_TTL,))
+
+    @staticmethod
+    def get(user_id, kind, template, version):
+        """(content, content_type) rendered from exactly this profile version, or None"""
+        with get_database().connection() as conn:
+            row = conn.execute(
+                'SELECT content, content_type FROM artifacts '
+                'WHERE user_id = ? AND kind = ? AND template = ? AND version = ? AND created >= ?',
+                (user_id, kind, template, version, time.time() - Config.ARTIFACT_TTL)
+            ).fetchone()
+        ARTIFACT_LOOKUPS.inc(kind=kind, result='miss' if row is None else 'hit')
+        if row is None:
+            return None
+        return bytes(row['content']), row['content_type']
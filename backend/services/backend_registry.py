@@ -0,0 +1,116 @@
+"""
+Lazy registry for heavy format backends and AI SDKs
+reportlab, python-docx, requests and numpy together dominate worker import time.
+Callers resolve them through the registries below so each one is imported on
+first use; warmup() imports and pre-warms everything ahead of traffic instead
+"""
+import importlib
+import threading
+import time
+
+
+class LazyRegistry:
+    """Maps names to 'package.module:attribute' targets imported on first get()"""
+
+    def __init__(self, name):
+        self.name = name
+        self._targets = {}
+        self._warmups = {}
+        self._loaded = {}
+        self._import_ms = {}
+        self._lock = threading.Lock()
+
+    def register(self, key, target, warmup=None):
+        """Register a lazily imported target
+
+        Args:
+            key: Lookup name, e.g. 'pdf'
+            target: 'module' or 'module:attribute'
+            warmup: Optional name of a zero-argument callable on the resolved
+                object that primes its caches (called by warm())
+        """
+        self._targets[key] = target
+        if warmup:
+            self._warmups[key] = warmup
+
+    def get(self, key):
+        """Return the target for key, importing its module the first time"""
+        try:
+            return self._loaded[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key not in self._loaded:
+                module_name, _, attribute = self._targets[key].partition(':')
+                start = time.perf_counter()
+                resolved = importlib.import_module(module_name)
+                if attribute:
+                    resolved = getattr(resolved, attribute)
+                self._import_ms[key] = (time.perf_counter() - start) * 1000
+                self._loaded[key] = resolved
+        return self._loaded[key]
+
+    def keys(self):
+        return list(self._targets)
+
+    def warm(self):
+        """Import every target and run its warmup hook
+
+        Returns:
+            dict: {key: milliseconds spent importing and warming}
+        """
+        timings = {}
+        for key in self._targets:
+            start = time.perf_counter()
+            try:
+                resolved = self.get(key)
+                hook = self._warmups.get(key)
+                if hook:
+                    getattr(resolved, hook)()
+            except Exception as e:
+                print(f"Warmup of {self.name} '{key}' failed: {e}")
+            timings[key] = round((time.perf_counter() - start) * 1000, 2)
+        return timings
+
+    def status(self):
+        """Loaded state and first-import cost of each registered target"""
+        return {
+            key: {
+                'target': target,
+                'loaded': key in self._loaded,
+                'import_ms': round(self._import_ms[key], 2) if key in self._import_ms else None,
+            }
+            for key, target in self._targets.items()
+        }
+
+
+# Resume format backends
+FORMAT_BACKENDS = LazyRegistry('format backend')
+FORMAT_BACKENDS.register('pdf', 'backend.services.pdf_exporter:PDFExporter', warmup='warm')
+FORMAT_BACKENDS.register('pdf-canvas', 'backend.services.pdf_canvas_writer:CanvasPDFWriter', warmup='warm')
+FORMAT_BACKENDS.register('python-docx', 'backend.services.ai_resume_enhancer:AIResumeEnhancer',
+                         warmup='_new_word_document')
+FORMAT_BACKENDS.register('ooxml', 'backend.services.docx_ooxml_writer:OOXMLDocxWriter',
+                         warmup='_load_static_parts')
+
+# AI provider SDKs
+AI_SDKS = LazyRegistry('AI SDK')
+AI_SDKS.register('requests', 'requests')
+
+# Numeric libraries (semantic resume matching)
+NUMERIC_LIBS = LazyRegistry('numeric library')
+NUMERIC_LIBS.register('numpy', 'numpy')
+
+
+def warmup():
+    """Pre-import and pre-warm all registered backends and SDKs
+
+    Returns:
+        dict: Per-registry timings in milliseconds
+    """
+    return {
+        'format_backends': FORMAT_BACKENDS.warm(),
+        'ai_sdks': AI_SDKS.warm(),
+        'numeric_libs': NUMERIC_LIBS.warm(),
+    }
@@ -1,10 +1,12 @@
 from backend.services.grok_service import generate_cover_letter_with_grok
+from backend.services.hedged_generation import hedged_generate
 
-def generate_cover_letter(user, data):
-    """Generate cover letter using user data and AI enhancement"""
-    if not user:
-        raise ValueError("User data is required to generate cover letter")
+def cover_letter_inputs(user, data):
+    """Profile and job dictionaries for the cover letter prompt
 
+    Returns:
+        tuple: (profile_data, job_data)
+    """
     job_title = data.get('job_title', 'Your Target Position') if data else 'Your Target Position'
     company_name = data.get('company_name', 'the Company') if data else 'the Company'
     job_description = data.get('job_description', '') if data else ''
@@ -12,11 +14,9 @@ def generate_cover_letter(user, data):
     # Prepare user profile data
     profile = user.profile if user.profile else None
     
-    skills = profile.skills.split(',') if profile and profile.skills else []
-    skills = [s.strip() for s in skills if s.strip()]
+    skills = list(profile.skills_list) if profile else []
     
-    experience = profile.experience.split('|') if profile and profile.experience else []
-    experience = [e.strip() for e in experience if e.strip()]
+    experience = list(profile.experience_list) if profile else []
     
     profile_data = {
         "name": user.name,
@@ -32,18 +32,36 @@ def generate_cover_letter(user, data):
         "company": company_name,
         "description": job_description
     }
+    return profile_data, job_data
+
+def fallback_cover_letter(user, job_data):
+    """Basic template letter used when the AI call fails"""
+    profile = user.profile if user.profile else None
+    job_title = job_data["position"]
+    company_name = job_data["company"]
+    cover_letter = f"Dear Hiring Manager,\n\n"
+    cover_letter += f"I am writing to express my strong interest in the {job_title} position at {company_name}.\n\n"
+    cover_letter += f"{profile.summary if profile and profile.summary else 'I am a dedicated professional with a passion for delivering quality work and continuous learning.'}\n\n"
+    cover_letter += f"I am excited about the opportunity to contribute to {company_name} and would welcome the chance to discuss how I can add value to your team.\n\n"
+    cover_letter += f"Best regards,\n{user.name}"
+    return cover_letter
+
+def generate_cover_letter(user, data, budget=None):
+    """Generate cover letter using user data and AI enhancement, falling back to
+    a basic template letter when the AI misses the budget
+
+    Returns:
+        dict: content, source ('ai' or 'template') and upgrade_id (see hedged_generation)
+    """
+    if not user:
+        raise ValueError("User data is required to generate cover letter")
+
+    profile_data, job_data = cover_letter_inputs(user, data)
 
-    try:
-        # Use Grok API for professional cover letter generation
-        cover_letter = generate_cover_letter_with_grok(profile_data, job_data)
-        return cover_letter
-
-    except Exception as e:
-        # Fallback to basic template if AI fails
-        print(f"AI cover letter generation failed: {e}")
-        cover_letter = f"Dear Hiring Manager,\n\n"
-        cover_letter += f"I am writing to express my strong interest in the {job_title} position at {company_name}.\n\n"
-        cover_letter += f"{profile.summary if profile and profile.summary else 'I am a dedicated professional with a passion for delivering quality work and continuous learning.'}\n\n"
-        cover_letter += f"I am excited about the opportunity to contribute to {company_name} and would welcome the chance to discuss how I can add value to your team.\n\n"
-        cover_letter += f"Best regards,\n{user.name}"
-        return cover_letter
+    return hedged_generate(
+        'cover_letter',
+        getattr(user, 'id', None),
+        lambda timeout: generate_cover_letter_with_grok(profile_data, job_data, timeout),
+        lambda: fallback_cover_letter(user, job_data),
+        budget
+    )
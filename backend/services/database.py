@@ -0,0 +1,220 @@
+"""
+Shared SQLite database for users, sessions, profiles, rate-limit buckets and
+AI upgrades
+One database file in WAL mode is shared by every gunicorn worker. Each process
+keeps a small connection pool, and the schema is versioned through
+PRAGMA user_version
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from backend.config import Config
+
+_INSTANCE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'instance')
+
+# Schema migrations, applied in order; PRAGMA user_version records the last one run
+_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        expires REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)",
+    """
+    CREATE TABLE IF NOT EXISTS profiles (
+        user_id INTEGER PRIMARY KEY,
+        version INTEGER NOT NULL,
+        data BLOB NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rate_limits (
+        key TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS upgrades (
+        id TEXT PRIMARY KEY,
+        user_id INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        status TEXT NOT NULL,
+        content TEXT,
+        created REAL NOT NULL,
+        updated REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS artifacts (
+        user_id INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        template TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        content BLOB NOT NULL,
+        content_type TEXT NOT NULL,
+        created REAL NOT NULL,
+        PRIMARY KEY (user_id, kind, template)
+    )
+    """,
+]
+
+_DATABASE = None
+_DATABASE_PID = None
+_DATABASE_LOCK = threading.Lock()
+
+
+def database_path(database_url):
+    """Resolve a sqlite:/// URL to a file path; relative paths live in backend/instance
+
+    Args:
+        database_url: e.g. 'sqlite:///resume_builder.db' or 'sqlite:////var/data/app.db'
+
+    Returns:
+        str: Filesystem path of the database
+    """
+    if not database_url.startswith('sqlite:///'):
+        raise ValueError(f"Unsupported DATABASE_URL (only sqlite:/// is supported): {database_url}")
+    path = database_url[len('sqlite:///'):]
+    if not os.path.isabs(path):
+        path = os.path.join(_INSTANCE_DIR, path)
+    return path
+
+
+class PoolTimeout(sqlite3.OperationalError):
+    """No pooled connection became free in time (pool too small, or a thread
+    borrowing a second connection while holding one)"""
+
+
+class Database:
+    """Pooled SQLite connections plus schema migration"""
+
+    def __init__(self, path, pool_size=4, pool_timeout=10.0):
+        self.path = path
+        self._pool = queue.LifoQueue()
+        self._pool_size = pool_size
+        self._pool_timeout = pool_timeout
+        self._created = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self.connection() as conn:
+            Database._migrate(conn)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=10000')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled autocommit connection, opening a new one while below pool_size
+
+        Raises:
+            PoolTimeout: When all pool_size connections stay borrowed for pool_timeout seconds
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self._pool_size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    conn = self._pool.get(timeout=self._pool_timeout)
+                except queue.Empty:
+                    raise PoolTimeout(
+                        f"No database connection free after {self._pool_timeout:g}s "
+                        f"(all {self._pool_size} in use)"
+                    ) from None
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection inside BEGIN IMMEDIATE ... COMMIT (rolled back on error)"""
+        with self.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+
+    @staticmethod
+    def _migrate(conn):
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for number, statement in enumerate(_MIGRATIONS[version:], start=version + 1):
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                # Re-check under the write lock: another worker may have migrated meanwhile
+                if conn.execute('PRAGMA user_version').fetchone()[0] < number:
+                    conn.execute(statement)
+                    conn.execute(f'PRAGMA user_version = {number}')
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+    def pool_stats(self):
+        """Connections opened by this process and how many are idle in the pool"""
+        return {'open': self._created, 'idle': self._pool.qsize(), 'size': self._pool_size}
+
+    def close(self):
+        """Close pooled connections (idle ones only; borrowed ones return to the pool)"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+def get_database():
+    """Process-wide Database for Config.DATABASE_URL
+
+    Rebuilt after a fork so gunicorn workers never share SQLite connections
+    with the master process.
+    """
+    global _DATABASE, _DATABASE_PID
+    pid = os.getpid()
+    if _DATABASE is None or _DATABASE_PID != pid:
+        with _DATABASE_LOCK:
+            if _DATABASE is None or _DATABASE_PID != pid:
+                _DATABASE = Database(database_path(Config.DATABASE_URL), Config.DATABASE_POOL_SIZE,
+                                     Config.DATABASE_POOL_TIMEOUT)
+                _DATABASE_PID = pid
+    return _DATABASE
@@ -0,0 +1,243 @@
+"""
+Direct OOXML writer for DOCX export
+Fast path that skips python-docx's object model: document.xml is assembled from
+precompiled XML fragments and zipped together with static parts that are
+compressed once per process
+"""
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from xml.sax.saxutils import escape
+
+try:
+    from .ai_resume_enhancer import AIResumeEnhancer
+    from .metrics import timed
+    from .resume_document import Bullet, Entry, SkillGroup
+except ImportError:
+    from ai_resume_enhancer import AIResumeEnhancer
+    from metrics import timed
+    from resume_document import Bullet, Entry, SkillGroup
+
+# Static package parts (styles, numbering with the 'List Bullet' definition,
+# settings, theme, ...) precompressed once: {name: (crc, size, compressed bytes)}
+_STATIC_PARTS = None
+_DOCUMENT_OPEN_TAG = None
+_STATIC_PARTS_LOCK = threading.Lock()
+
+_DOCUMENT_PART = 'word/document.xml'
+
+# Characters XML 1.0 cannot carry; python-docx (lxml) rejects them with this message
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_XML_INVALID_MESSAGE = ('All strings must be XML compatible: Unicode or ASCII, '
+                        'no NULL bytes or control characters')
+
+# Precompiled fragments matching what python-docx emits for the same calls
+_P_CENTER = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+_P_HEADING1 = '<w:pPr><w:pStyle w:val="Heading1"/></w:pPr>'
+_P_LIST_BULLET = '<w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+_P_SPACE_AFTER_6PT = '<w:pPr><w:spacing w:after="120"/></w:pPr>'
+_P_LINE_115 = '<w:pPr><w:spacing w:line="276" w:lineRule="auto"/></w:pPr>'
+_R_BOLD = '<w:rPr><w:b/></w:rPr>'
+_R_BOLD_14PT = '<w:rPr><w:b/><w:sz w:val="28"/></w:rPr>'
+_R_BOLD_BLACK = '<w:rPr><w:b/><w:color w:val="000000"/></w:rPr>'
+_R_10PT = '<w:rPr><w:sz w:val="20"/></w:rPr>'
+_SECT_PR = (
+    '<w:sectPr w:rsidR="00FC693F" w:rsidRPr="0006063C" w:rsidSect="00034616">'
+    '<w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="{top}" w:right="{right}" w:bottom="{bottom}" w:left="{left}" '
+    'w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/><w:docGrid w:linePitch="360"/></w:sectPr>'
+)
+
+
+class OOXMLDocxWriter:
+    """Writes resume .docx packages without building a python-docx object tree"""
+
+    @staticmethod
+    def _load_static_parts():
+        """Read the python-docx default package once and precompress its static parts"""
+        global _STATIC_PARTS, _DOCUMENT_OPEN_TAG
+        if _STATIC_PARTS is not None:
+            return _STATIC_PARTS
+        with _STATIC_PARTS_LOCK:
+            if _STATIC_PARTS is None:
+                import zipfile
+                import docx
+
+                template_path = os.path.join(os.path.dirname(docx.__file__), 'templates', 'default.docx')
+                parts = []
+                with zipfile.ZipFile(template_path) as package:
+                    for info in package.infolist():
+                        data = package.read(info.filename)
+                        if info.filename == _DOCUMENT_PART:
+                            text = data.decode('utf-8')
+                            _DOCUMENT_OPEN_TAG = text[:text.index('<w:body>')]
+                            continue
+                        parts.append((info.filename, zlib.crc32(data), len(data), OOXMLDocxWriter._deflate(data)))
+                _STATIC_PARTS = parts
+        return _STATIC_PARTS
+
+    @staticmethod
+    def _deflate(data):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def _text(text):
+        """Run content for text, turning newlines and tabs into <w:br/> and <w:tab/>
+
+        Raises:
+            ValueError: text holds a character XML cannot carry, as python-docx does
+        """
+        if _XML_INVALID.search(text):
+            raise ValueError(_XML_INVALID_MESSAGE)
+        if '\n' not in text and '\r' not in text and '\t' not in text:
+            if text[0].isspace() or text[-1].isspace():
+                return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+            return f'<w:t>{escape(text)}</w:t>'
+
+        parts = []
+        pending = []
+
+        def flush():
+            if pending:
+                value = ''.join(pending)
+                pending.clear()
+                if value[0].isspace() or value[-1].isspace():
+                    parts.append(f'<w:t xml:space="preserve">{escape(value)}</w:t>')
+                else:
+                    parts.append(f'<w:t>{escape(value)}</w:t>')
+
+        for char in text:
+            if char in '\n\r':
+                flush()
+                parts.append('<w:br/>')
+            elif char == '\t':
+                flush()
+                parts.append('<w:tab/>')
+            else:
+                pending.append(char)
+        flush()
+        return ''.join(parts)
+
+    @staticmethod
+    def _run(text, run_props=''):
+        return f'<w:r>{run_props}{OOXMLDocxWriter._text(text)}</w:r>'
+
+    @staticmethod
+    def _paragraph(text='', para_props='', run_props=''):
+        if not text:
+            return f'<w:p>{para_props}</w:p>' if para_props else '<w:p/>'
+        return f'<w:p>{para_props}{OOXMLDocxWriter._run(text, run_props)}</w:p>'
+
+    @staticmethod
+    def _twips(inches):
+        return int(round(inches * 1440))
+
+    @staticmethod
+    def build_document_xml(template, user, profile, document=None):
+        """Assemble word/document.xml for a resume, mirroring generate_word_document
+
+        Returns:
+            bytes: UTF-8 encoded document part
+        """
+        OOXMLDocxWriter._load_static_parts()
+        if document is None:
+            document = AIResumeEnhancer.build_resume_document(template, user, profile)
+        format_spec = AIResumeEnhancer.RESUME_FORMATS.get(template, {})
+        paragraph = OOXMLDocxWriter._paragraph
+        run = OOXMLDocxWriter._run
+        body = []
+
+        # Header with name, role tagline and contact lines
+        body.append(paragraph(document.name.upper(), _P_CENTER, _R_BOLD_14PT))
+        for line in AIResumeEnhancer.word_header_lines(document):
+            body.append(paragraph(line, _P_CENTER, _R_10PT))
+
+        for section in document.sections:
+            body.append(paragraph(section.title, _P_HEADING1))
+            for item in section.items:
+                if isinstance(item, SkillGroup):
+                    body.append(f"<w:p>{run(item.label, _R_BOLD_BLACK)}{run(' ' + ', '.join(item.items))}</w:p>")
+                elif isinstance(item, Entry):
+                    if item.title is not None:
+                        body.append(paragraph(item.title, _P_LINE_115, _R_BOLD))
+                    for bullet in item.bullets:
+                        body.append(paragraph(bullet.text, _P_LIST_BULLET))
+                elif isinstance(item, Bullet):
+                    body.append(paragraph(item.text, _P_LIST_BULLET))
+                elif section.key == 'summary':
+                    body.append(paragraph(item.text, _P_SPACE_AFTER_6PT))
+                else:
+                    body.append(paragraph(item.text))
+
+        margins = format_spec['margins']
+        body.append(_SECT_PR.format(
+            top=OOXMLDocxWriter._twips(margins['top']),
+            right=OOXMLDocxWriter._twips(margins['right']),
+            bottom=OOXMLDocxWriter._twips(margins['bottom']),
+            left=OOXMLDocxWriter._twips(margins['left'])
+        ))
+
+        return (_DOCUMENT_OPEN_TAG + '<w:body>' + ''.join(body) + '</w:body></w:document>').encode('utf-8')
+
+    @staticmethod
+    def _write_zip(stream, entries):
+        """Write a ZIP archive of already-deflated entries: [(name, crc, size, deflated)]"""
+        now = time.localtime()
+        dos_time = (now.tm_hour << 11) | (now.tm_min << 5) | (now.tm_sec // 2)
+        dos_date = ((now.tm_year - 1980) << 9) | (now.tm_mon << 5) | now.tm_mday
+
+        offset = 0
+        central = []
+        for name, crc, size, deflated in entries:
+            encoded_name = name.encode('utf-8')
+            header = struct.pack(
+                '<IHHHHHIIIHH', 0x04034b50, 20, 0, 8, dos_time, dos_date,
+                crc, len(deflated), size, len(encoded_name), 0
+            )
+            stream.write(header)
+            stream.write(encoded_name)
+            stream.write(deflated)
+            central.append(struct.pack(
+                '<IHHHHHHIIIHHHHHII', 0x02014b50, 20, 20, 0, 8, dos_time, dos_date,
+                crc, len(deflated), size, len(encoded_name), 0, 0, 0, 0, 0, offset
+            ) + encoded_name)
+            offset += len(header) + len(encoded_name) + len(deflated)
+
+        directory = b''.join(central)
+        stream.write(directory)
+        stream.write(struct.pack(
+            '<IHHHHIIH', 0x06054b50, 0, 0, len(entries), len(entries), len(directory), offset, 0
+        ))
+
+    @staticmethod
+    def generate_word_document(template, user, profile, output, document=None):
+        """Generate MS Word (.docx) file, same signature as AIResumeEnhancer.generate_word_document
+
+        Args:
+            template: Template name from RESUME_FORMATS
+            user: User object with name and email
+            profile: Profile object with all fields
+            output: File path or writable binary stream
+            document: Prebuilt ResumeDocument; compiled from the profile if omitted
+
+        Returns:
+            bool: True when the document was written
+        """
+        static_parts = OOXMLDocxWriter._load_static_parts()
+        document_xml = OOXMLDocxWriter.build_document_xml(template, user, profile, document)
+        entries = [(_DOCUMENT_PART, zlib.crc32(document_xml), len(document_xml),
+                    OOXMLDocxWriter._deflate(document_xml))]
+        entries.extend(static_parts)
+
+        with timed('docx_save'):
+            if isinstance(output, (str, os.PathLike)):
+                with open(output, 'wb') as f:
+                    OOXMLDocxWriter._write_zip(f, entries)
+            else:
+                OOXMLDocxWriter._write_zip(output, entries)
+        return True
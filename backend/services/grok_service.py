@@ -1,12 +1,9 @@
 """
 Grok API Service for AI-Powered Resume Generation
-Integrates with Grok API for high-quality, ATS-optimized resume generation
+Builds the prompts for high-quality, ATS-optimized resume generation; the calls
+go through the LLM router (llm_router.py), which picks the provider and model
 """
-import requests
-from backend.config import Config
-
-GROK_URL = "https://api.x.ai/v1/chat/completions"
-AI_API_KEY = Config.GROQ_API_KEY
+from backend.services.llm_router import ROUTER
 
 
 def build_resume_prompt(profile_data):
@@ -72,12 +69,13 @@ REMEMBER:
 """
 
 
-def generate_resume_with_grok(profile_data):
+def generate_resume_with_grok(profile_data, timeout=30):
     """
     Generate a professional ATS-optimized resume using Grok API.
     
     Args:
         profile_data: Dictionary containing user profile information
+        timeout: HTTP timeout in seconds (the caller's remaining deadline)
         
     Returns:
         Generated resume content as string
@@ -87,31 +85,7 @@ def generate_resume_with_grok(profile_data):
     """
     prompt = build_resume_prompt(profile_data)
 
-    headers = {
-        "Authorization": f"Bearer {AI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "model": "grok-2-latest",
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.3
-    }
-
-    try:
-        response = requests.post(GROK_URL, json=payload, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Grok API Error: {response.status_code} - {response.text}")
-
-        return response.json()["choices"][0]["message"]["content"]
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to connect to Grok API: {str(e)}")
-    except (KeyError, ValueError) as e:
-        raise Exception(f"Failed to parse Grok API response: {str(e)}")
+    return ROUTER.complete('resume', prompt, timeout=timeout)
 
 
 def build_cover_letter_prompt(profile_data, job_data):
@@ -158,13 +132,14 @@ Now generate the cover letter.
 """
 
 
-def generate_cover_letter_with_grok(profile_data, job_data):
+def generate_cover_letter_with_grok(profile_data, job_data, timeout=30):
     """
     Generate a professional cover letter using Grok API.
     
     Args:
         profile_data: Dictionary containing user profile information
         job_data: Dictionary containing job information
+        timeout: HTTP timeout in seconds (the caller's remaining deadline)
         
     Returns:
         Generated cover letter content as string
@@ -174,31 +149,7 @@ def generate_cover_letter_with_grok(profile_data, job_data):
     """
     prompt = build_cover_letter_prompt(profile_data, job_data)
 
-    headers = {
-        "Authorization": f"Bearer {AI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "model": "grok-2-latest",
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.3
-    }
-
-    try:
-        response = requests.post(GROK_URL, json=payload, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Grok API Error: {response.status_code} - {response.text}")
-
-        return response.json()["choices"][0]["message"]["content"]
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to connect to Grok API: {str(e)}")
-    except (KeyError, ValueError) as e:
-        raise Exception(f"Failed to parse Grok API response: {str(e)}")
+    return ROUTER.complete('cover_letter', prompt, timeout=timeout)
 
 
 def build_resume_optimization_prompt(resume_text, job_description):
@@ -310,12 +261,13 @@ Education: {" | ".join(profile_data['education'])}
 """
 
 
-def generate_portfolio_with_grok(profile_data):
+def generate_portfolio_with_grok(profile_data, timeout=30):
     """
     Generate a professional portfolio using Grok API.
     
     Args:
         profile_data: Dictionary containing user profile information
+        timeout: HTTP timeout in seconds (the caller's remaining deadline)
         
     Returns:
         Generated portfolio content as string
@@ -325,31 +277,7 @@ def generate_portfolio_with_grok(profile_data):
     """
     prompt = build_portfolio_prompt(profile_data)
 
-    headers = {
-        "Authorization": f"Bearer {AI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "model": "grok-2-latest",
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.3
-    }
-
-    try:
-        response = requests.post(GROK_URL, json=payload, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Grok API Error: {response.status_code} - {response.text}")
-
-        return response.json()["choices"][0]["message"]["content"]
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to connect to Grok API: {str(e)}")
-    except (KeyError, ValueError) as e:
-        raise Exception(f"Failed to parse Grok API response: {str(e)}")
+    return ROUTER.complete('portfolio', prompt, timeout=timeout)
 
 
 def build_resume_optimization_prompt(resume_text, job_description):
@@ -413,31 +341,7 @@ def optimize_resume_with_grok(resume_text, job_description):
     """
     prompt = build_resume_optimization_prompt(resume_text, job_description)
 
-    headers = {
-        "Authorization": f"Bearer {AI_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
-    payload = {
-        "model": "grok-2-latest",
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": 0.3
-    }
-
-    try:
-        response = requests.post(GROK_URL, json=payload, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            raise Exception(f"Grok API Error: {response.status_code} - {response.text}")
-
-        return response.json()["choices"][0]["message"]["content"]
-    
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Failed to connect to Grok API: {str(e)}")
-    except (KeyError, ValueError) as e:
-        raise Exception(f"Failed to parse Grok API response: {str(e)}")
+    return ROUTER.complete('optimize', prompt, timeout=30)
 
 
 def build_pdf_format_prompt(resume_text):
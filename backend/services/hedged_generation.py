@@ -0,0 +1,225 @@
+"""
+Deadline-aware AI generation with an instant template fallback
+Each AI request carries a latency budget. The LLM call runs in the background.
+If it has not answered shortly before the budget runs out, the caller returns
+the deterministic template output at once. The LLM call keeps running, and
+when it finishes its text is stored as an "upgrade" that the client fetches
+from GET /api/ai/upgrades/<id>
+
+The LLM call also gets a hard deadline, passed down as its HTTP timeout, so a
+background upgrade cannot run forever. Upgrades live in the shared database,
+so any worker can answer the fetch
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from backend.config import Config
+from backend.services.database import get_database
+from backend.services.metrics import REGISTRY
+
+GENERATIONS = REGISTRY.counter(
+    'resume_generations_total', 'AI generations by kind and what the caller got (ai, template, upgrade_*)',
+    ('kind', 'source')
+)
+
+# Fraction of upgrade writes that also purge expired rows
+_PURGE_PROBABILITY = 0.01
+
+_EXECUTOR = None
+_EXECUTOR_PID = None
+_EXECUTOR_LOCK = threading.Lock()
+
+# Upgrade tasks of the ASGI app (the event loop only keeps weak references)
+_BACKGROUND_TASKS = set()
+
+
+class Deadline:
+    """Point in time a piece of work must finish by"""
+
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.expires - time.monotonic())
+
+
+def request_budget(data, headers=None):
+    """Latency budget in seconds for one request
+
+    Read from the JSON field latency_budget_ms or the X-Latency-Budget-Ms header,
+    defaulting to GENERATION_BUDGET_MS and never above GENERATION_DEADLINE_MS.
+    """
+    value = (data or {}).get('latency_budget_ms')
+    if value is None and headers is not None:
+        value = headers.get('X-Latency-Budget-Ms')
+    try:
+        budget_ms = float(value) if value is not None else Config.GENERATION_BUDGET_MS
+    except (TypeError, ValueError):
+        budget_ms = Config.GENERATION_BUDGET_MS
+    return min(max(budget_ms, 0.0), Config.GENERATION_DEADLINE_MS) / 1000
+
+
+def _executor():
+    """Background pool for LLM calls, rebuilt after a fork"""
+    global _EXECUTOR, _EXECUTOR_PID
+    pid = os.getpid()
+    if _EXECUTOR is None or _EXECUTOR_PID != pid:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None or _EXECUTOR_PID != pid:
+                _EXECUTOR = ThreadPoolExecutor(Config.GENERATION_BACKGROUND_WORKERS,
+                                               thread_name_prefix='llm-generation')
+                _EXECUTOR_PID = pid
+    return _EXECUTOR
+
+
+class UpgradeStore:
+    """AI results that arrived after the template fallback was sent"""
+
+    @staticmethod
+    def create(user_id, kind):
+        """Record a pending upgrade and return its id"""
+        upgrade_id = uuid.uuid4().hex
+        now = time.time()
+        with get_database().connection() as conn:
+            conn.execute(
+                'INSERT INTO upgrades (id, user_id, kind, status, content, created, updated) '
+                'VALUES (?, ?, ?, ?, NULL, ?, ?)',
+                (upgrade_id, user_id, kind, 'pending', now, now)
+            )
+            if random.random() < _PURGE_PROBABILITY:
+                conn.execute('DELETE FROM upgrades WHERE updated < ?', (now - Config.UPGRADE_TTL,))
+        return upgrade_id
+
+    @staticmethod
+    def finish(upgrade_id, content=None, error=None):
+        """Store the AI content (status ready) or mark the upgrade failed"""
+        status = 'ready' if error is None else 'failed'
+        with get_database().connection() as conn:
+            conn.execute(
+                'UPDATE upgrades SET status = ?, content = ?, updated = ? WHERE id = ?',
+                (status, content if error is None else str(error), time.time(), upgrade_id)
+            )
+
+    @staticmethod
+    def get(upgrade_id, user_id):
+        """Upgrade owned by user_id as a dictionary, or None"""
+        with get_database().connection() as conn:
+            row = conn.execute(
+                'SELECT id, kind, status, content, created, updated FROM upgrades '
+                'WHERE id = ? AND user_id = ? AND updated >= ?',
+                (upgrade_id, user_id, time.time() - Config.UPGRADE_TTL)
+            ).fetchone()
+        if row is None:
+            return None
+        upgrade = {'id': row['id'], 'kind': row['kind'], 'status': row['status']}
+        if row['status'] == 'ready':
+            upgrade['content'] = row['content']
+        return upgrade
+
+
+def _result(kind, content, source, upgrade_id=None):
+    GENERATIONS.inc(kind=kind, source=source)
+    return {'content': content, 'source': source, 'upgrade_id': upgrade_id}
+
+
+def _store_upgrade(kind, upgrade_id, content=None, error=None):
+    if error is not None:
+        print(f"AI {kind} upgrade failed: {error}")
+    try:
+        UpgradeStore.finish(upgrade_id, content, error)
+    except Exception as e:
+        print(f"Storing AI {kind} upgrade failed: {e}")
+        return
+    GENERATIONS.inc(kind=kind, source='upgrade_ready' if error is None else 'upgrade_failed')
+
+
+def _fallback(kind, user_id, fallback, pending):
+    """Template result; with pending=True also opens an upgrade for the running LLM call"""
+    content = fallback()
+    if not pending or user_id is None:
+        return _result(kind, content, 'template'), None
+    upgrade_id = UpgradeStore.create(user_id, kind)
+    return _result(kind, content, 'template', upgrade_id), upgrade_id
+
+
+def hedged_generate(kind, user_id, llm_call, fallback, budget=None):
+    """Return the LLM output if it arrives within budget, otherwise the template output
+
+    Args:
+        kind: 'resume', 'portfolio' or 'cover_letter'
+        user_id: Owner of a possible upgrade (None disables upgrades)
+        llm_call: Callable taking the HTTP timeout in seconds and returning text
+        fallback: Zero-argument callable producing the template text
+        budget: Seconds the caller may wait (default: request_budget({}))
+
+    Returns:
+        dict: content, source ('ai' or 'template') and upgrade_id (set when
+        the AI result will be stored for later)
+    """
+    budget = request_budget({}) if budget is None else budget
+    hard_deadline = Deadline(Config.GENERATION_DEADLINE_MS / 1000)
+    wait = max(0.0, budget - Config.GENERATION_FALLBACK_RESERVE_MS / 1000)
+
+    def call():
+        timeout = hard_deadline.remaining()
+        if timeout <= 0:
+            raise TimeoutError('Generation deadline passed before the LLM call started')
+        return llm_call(timeout)
+
+    future = _executor().submit(call)
+    try:
+        return _result(kind, future.result(timeout=wait), 'ai')
+    except FutureTimeout:
+        pass
+    except Exception as e:
+        print(f"AI {kind} generation failed: {e}")
+        return _fallback(kind, user_id, fallback, pending=False)[0]
+
+    result, upgrade_id = _fallback(kind, user_id, fallback, pending=True)
+    if upgrade_id is not None:
+        def store(done):
+            error = done.exception()
+            _store_upgrade(kind, upgrade_id, None if error else done.result(), error)
+        future.add_done_callback(store)
+    return result
+
+
+async def hedged_generate_async(kind, user_id, llm_call, fallback, budget, run_blocking):
+    """hedged_generate for the ASGI app: llm_call is a coroutine function taking the timeout
+
+    Args:
+        run_blocking: Coroutine function running a blocking callable off the
+            event loop (database writes, template rendering)
+    """
+    hard_deadline = Deadline(Config.GENERATION_DEADLINE_MS / 1000)
+    wait = max(0.0, budget - Config.GENERATION_FALLBACK_RESERVE_MS / 1000)
+    task = asyncio.ensure_future(llm_call(hard_deadline.remaining()))
+    try:
+        return _result(kind, await asyncio.wait_for(asyncio.shield(task), wait), 'ai')
+    except asyncio.TimeoutError:
+        pass
+    except Exception as e:
+        print(f"AI {kind} generation failed: {e}")
+        return (await run_blocking(_fallback, kind, user_id, fallback, False))[0]
+
+    result, upgrade_id = await run_blocking(_fallback, kind, user_id, fallback, True)
+    if upgrade_id is None:
+        task.cancel()
+        return result
+
+    async def store():
+        try:
+            content, error = await task, None
+        except Exception as e:
+            content, error = None, e
+        await run_blocking(_store_upgrade, kind, upgrade_id, content, error)
+    background = asyncio.ensure_future(store())
+    _BACKGROUND_TASKS.add(background)
+    background.add_done_callback(_BACKGROUND_TASKS.discard)
+    return result
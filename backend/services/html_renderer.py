@@ -0,0 +1,180 @@
+"""
+Compiled, streaming HTML renderer for resumes
+Each template is compiled once at import into static page chunks plus a section
+renderer plan; render() then walks a ResumeDocument and yields HTML chunks. The
+stylesheet lives in assets/resume.css and is loaded and content-hashed once so
+it can be served as an immutable asset or inlined into standalone files
+"""
+import hashlib
+import os
+from html import escape
+
+try:
+    from .ai_resume_enhancer import AIResumeEnhancer
+    from .resume_document import Bullet
+except ImportError:
+    from ai_resume_enhancer import AIResumeEnhancer
+    from resume_document import Bullet
+
+_STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'resume.css')
+
+with open(_STYLESHEET_PATH, 'rb') as _f:
+    _STYLESHEET = _f.read()
+_STYLESHEET_HASH = hashlib.sha256(_STYLESHEET).hexdigest()[:16]
+_INLINE_STYLE = '    <style>\n' + _STYLESHEET.decode('utf-8') + '    </style>\n'
+
+_PAGE_OPEN = (
+    '<!DOCTYPE html>\n'
+    '<html lang="en">\n'
+    '<head>\n'
+    '    <meta charset="UTF-8">\n'
+    '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+)
+_PAGE_CLOSE = '    </div>\n</body>\n</html>'
+_SUMMARY_OPEN = '<p style="margin-bottom: 15px; text-align: justify; color: #555;">'
+
+
+def _text(value):
+    return escape(value, quote=False)
+
+
+def _title(section):
+    return f'<div class="section-title">{_text(section.title)}</div>\n'
+
+
+def _render_summary(section):
+    lines = [line for item in section.items for line in item.lines()]
+    if lines:
+        yield f'{_SUMMARY_OPEN}{_text(chr(10).join(lines))}</p>\n'
+
+
+def _render_projects(section):
+    yield _title(section)
+    for entry in section.items:
+        if entry.title is not None:
+            yield f'  <div class="project-title"><strong>{_text(entry.title)}</strong></div>\n'
+        for bullet in entry.bullets:
+            yield f'  <div class="project-desc">• {_text(bullet.text)}</div>\n'
+
+
+def _render_skills(section):
+    yield _title(section)
+    for group in section.items:
+        yield f'<p><strong style="color: #000;">{_text(group.label)}</strong> {_text(", ".join(group.items))}</p>\n'
+
+
+def _render_list(section):
+    """Regular sections: every bullet or text line becomes a list item"""
+    items = []
+    for item in section.items:
+        if isinstance(item, Bullet):
+            items.append(item.text)
+        else:
+            items.extend(line.lstrip('-•').strip() for line in item.lines())
+    if items:
+        yield _title(section)
+        yield '<ul>\n' + ''.join(f'  <li>{_text(item)}</li>\n' for item in items) + '</ul>\n'
+
+
+_SECTION_RENDERERS = {
+    'summary': _render_summary,
+    'projects': _render_projects,
+    'skills': _render_skills,
+}
+
+
+class _CompiledTemplate:
+    """Per-template render plan: section renderers keyed by section key"""
+    __slots__ = ('name', 'renderers', 'body_open')
+
+    def __init__(self, name, sections_order):
+        self.name = name
+        self.renderers = {key: _SECTION_RENDERERS.get(key, _render_list) for key in sections_order}
+        self.body_open = f'</head>\n<body class="template-{name}">\n    <div class="container">\n'
+
+
+_COMPILED = {
+    name: _CompiledTemplate(name, spec.get('sections_order', []))
+    for name, spec in AIResumeEnhancer.RESUME_FORMATS.items()
+}
+
+
+class HTMLRenderer:
+    """Renders ResumeDocument objects as HTML pages"""
+
+    CONTENT_TYPE = 'text/html; charset=utf-8'
+
+    @staticmethod
+    def stylesheet():
+        """Return the stylesheet bytes and their content hash"""
+        return _STYLESHEET, _STYLESHEET_HASH
+
+    @staticmethod
+    def stylesheet_filename():
+        """Hashed filename the stylesheet is served under"""
+        return f'resume.{_STYLESHEET_HASH}.css'
+
+    @staticmethod
+    def _header(document):
+        name = _text(document.name)
+        email = escape(document.email or '')
+        phone = _text(document.phone)
+        headline = _text(document.headline)
+        contact_line = ' | '.join(
+            f'<a href="{escape(link.url)}" target="_blank" class="profile-link">{link.label}</a>'
+            for link in document.links
+        )
+
+        parts = ['        <div class="header">\n', f'            <div class="name">{name}</div>\n']
+        if headline:
+            parts.append(f'            <div class="headline">{headline}</div>\n')
+        parts.append('            <div class="contact">\n')
+        if phone and phone != '[Your Phone]':
+            parts.append(f'                <span class="contact-item">📞 {phone}</span>\n')
+        if email:
+            parts.append(
+                f'                <span class="contact-item">📧 <a href="mailto:{email}" '
+                f'style="color: #0066cc; text-decoration: none;">{email}</a></span>\n'
+            )
+        if contact_line:
+            parts.append(f'                <span class="contact-item">{contact_line}</span>\n')
+        parts.append('            </div>\n        </div>\n')
+        return ''.join(parts)
+
+    @staticmethod
+    def render(document, stylesheet_href=None):
+        """Yield the HTML page for a document chunk by chunk
+
+        Args:
+            document: ResumeDocument to render
+            stylesheet_href: URL of the hashed stylesheet; when None the CSS is
+                inlined so the page works as a standalone file
+
+        Yields:
+            str: Consecutive pieces of the page
+        """
+        compiled = _COMPILED.get(document.template)
+        if compiled is None:
+            compiled = _CompiledTemplate(document.template, [section.key for section in document.sections])
+
+        head = [_PAGE_OPEN, f'    <title>{_text(document.name)} - Resume</title>\n']
+        if stylesheet_href:
+            head.append(f'    <link rel="stylesheet" href="{escape(stylesheet_href)}">\n')
+        else:
+            head.append(_INLINE_STYLE)
+        head.append(compiled.body_open)
+        head.append(HTMLRenderer._header(document))
+        yield ''.join(head)
+
+        for section in document.sections:
+            if not section.items:
+                continue
+            renderer = compiled.renderers.get(section.key, _render_list)
+            yield ''.join(renderer(section))
+
+        yield _PAGE_CLOSE
+
+    @staticmethod
+    def render_bytes(document, stylesheet_href=None):
+        """Render the whole page into UTF-8 bytes"""
+        return ''.join(HTMLRenderer.render(document, stylesheet_href)).encode('utf-8')
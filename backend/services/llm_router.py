@@ -0,0 +1,323 @@
+"""
+Latency-aware router over the LLM providers
+A route is one provider, model and OpenAI-compatible chat completions endpoint,
+with a quality tier. Each task type (resume, cover letter, suggestion, ...)
+needs a minimum tier. The router tries the healthy routes that meet it,
+fastest first by EWMA latency. It then fails over to routes that are cooling
+down after repeated errors, and finally (if LLM_ALLOW_DOWNGRADE) to lower
+tiers, until one answers or the timeout is spent
+
+Per-route latency, error rate and every routing outcome are exported in
+/metrics; GET /api/debug/llm-routes shows the same state plus recent decisions
+"""
+import collections
+import json
+import os
+import threading
+import time
+
+from backend.config import Config
+from backend.services.backend_registry import AI_SDKS
+from backend.services.metrics import REGISTRY, timed
+
+TIERS = {'standard': 1, 'high': 2}
+
+# Minimum tier and request settings per task type
+TASKS = {
+    'resume': {'tier': 'high', 'temperature': 0.3},
+    'cover_letter': {'tier': 'high', 'temperature': 0.3},
+    'portfolio': {'tier': 'high', 'temperature': 0.3},
+    'optimize': {'tier': 'high', 'temperature': 0.3},
+    'suggestion': {'tier': 'standard', 'temperature': 0.7, 'max_tokens': 150},
+}
+
+ROUTE_REQUESTS = REGISTRY.counter(
+    'resume_llm_route_requests_total', 'LLM calls per task and route by outcome (success, error)',
+    ('task', 'provider', 'model', 'outcome')
+)
+FAILOVERS = REGISTRY.counter(
+    'resume_llm_failovers_total', 'Tasks answered by a route other than the first choice', ('task',)
+)
+
+
+def default_routes():
+    """Built-in routes: xAI Grok and two Groq models, all keyed by GROQ_API_KEY"""
+    groq_url = (Config.GROQ_BASE_URL or 'https://api.groq.com').rstrip('/') + '/openai/v1/chat/completions'
+    return [
+        {'provider': 'xai', 'model': 'grok-2-latest', 'url': Config.GROK_API_URL, 'tier': 'high'},
+        {'provider': 'groq', 'model': 'llama3-70b-8192', 'url': groq_url, 'tier': 'high'},
+        {'provider': 'groq', 'model': 'llama3-8b-8192', 'url': groq_url, 'tier': 'standard'},
+    ]
+
+
+class Route:
+    """One provider/model endpoint and its health statistics"""
+
+    def __init__(self, provider, model, url, tier='standard', api_key=None, alpha=0.3):
+        self.provider = provider
+        self.model = model
+        self.url = url
+        self.tier = tier
+        self.api_key = api_key
+        self.alpha = alpha
+        self.latency = None  # EWMA seconds of successful calls
+        self.error_rate = 0.0  # EWMA of failures (0..1)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def name(self):
+        return f'{self.provider}/{self.model}'
+
+    def healthy(self, now):
+        return now >= self.open_until
+
+    def record(self, seconds, ok, now):
+        self.calls += 1
+        self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.latency = seconds if self.latency is None else self.latency + self.alpha * (seconds - self.latency)
+            self.consecutive_failures = 0
+            self.open_until = 0.0
+            return
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= Config.LLM_FAILURE_THRESHOLD:
+            self.open_until = now + Config.LLM_COOLDOWN_SECONDS
+
+    def request(self, task, prompt):
+        """Headers and JSON payload of a chat completion"""
+        settings = TASKS.get(task, TASKS['resume'])
+        payload = {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'temperature': settings['temperature'],
+        }
+        if settings.get('max_tokens'):
+            payload['max_tokens'] = settings['max_tokens']
+        headers = {'Authorization': f'Bearer {self.api_key}', 'Content-Type': 'application/json'}
+        return headers, payload
+
+    def stats(self, now):
+        return {
+            'route': self.name,
+            'url': self.url,
+            'tier': self.tier,
+            'healthy': self.healthy(now),
+            'ewma_latency_ms': round(self.latency * 1000, 1) if self.latency is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'calls': self.calls,
+            'failures': self.failures,
+        }
+
+
+def _score(route):
+    """Sort key: EWMA latency inflated by the error rate; untried routes go first
+    (to get a sample), routes that never succeeded go last"""
+    if route.latency is None:
+        return -1.0 if route.error_rate == 0 else float('inf')
+    return route.latency * (1 + 4 * route.error_rate)
+
+
+def _content(route, response):
+    if response.status_code != 200:
+        raise Exception(f"{route.name} API Error: {response.status_code} - {response.text[:200]}")
+    try:
+        return response.json()["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, ValueError) as e:
+        raise Exception(f"Failed to parse {route.name} response: {str(e)}")
+
+
+class LLMRouter:
+    """Chooses and calls routes; thread-safe"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.decisions = collections.deque(maxlen=50)
+        self._lock = threading.Lock()
+
+    def plan(self, task):
+        """Routes to try for task, in order
+
+        Healthy routes meeting the task's tier come first, fastest first (see
+        _score). Cooling-down routes follow, then lower tiers when downgrades
+        are allowed.
+        """
+        required = TIERS[TASKS.get(task, TASKS['resume'])['tier']]
+        now = time.time()
+        with self._lock:
+            configured = [route for route in self.routes if route.api_key and route.url]
+            qualified = [route for route in configured if TIERS.get(route.tier, 0) >= required]
+            lower = [route for route in configured if TIERS.get(route.tier, 0) < required]
+
+            def fastest(routes):
+                return sorted(routes, key=_score)
+
+            ordered = fastest([r for r in qualified if r.healthy(now)])
+            ordered += sorted((r for r in qualified if not r.healthy(now)), key=lambda r: r.open_until)
+            if Config.LLM_ALLOW_DOWNGRADE:
+                ordered += fastest([r for r in lower if r.healthy(now)])
+            return ordered
+
+    def available(self, task):
+        return bool(self.plan(task))
+
+    def _record(self, task, route, seconds, ok):
+        with self._lock:
+            route.record(seconds, ok, time.time())
+        ROUTE_REQUESTS.inc(task=task, provider=route.provider, model=route.model,
+                           outcome='success' if ok else 'error')
+
+    def _decided(self, task, attempts, chosen):
+        if chosen is not None and attempts and attempts[0][0] != chosen.name:
+            FAILOVERS.inc(task=task)
+        with self._lock:
+            self.decisions.append({
+                'time': round(time.time(), 3),
+                'task': task,
+                'route': chosen.name if chosen is not None else None,
+                'attempts': [{'route': name, 'outcome': outcome, 'ms': round(ms, 1)}
+                             for name, outcome, ms in attempts],
+            })
+
+    def complete(self, task, prompt, timeout=30):
+        """Send prompt to the best route for task, failing over until one answers
+
+        Args:
+            task: Key of TASKS, e.g. 'cover_letter'
+            prompt: Prompt text
+            timeout: Seconds for the whole attempt chain (each call gets what is left)
+
+        Returns:
+            str: Generated content
+
+        Raises:
+            Exception: When no route is configured or every route failed
+        """
+        requests = AI_SDKS.get('requests')
+        chain = _AttemptChain(self, task, timeout)
+        for route, remaining in chain.routes():
+            headers, payload = route.request(task, prompt)
+            start = time.perf_counter()
+            try:
+                with timed('llm'):
+                    response = requests.post(route.url, json=payload, headers=headers, timeout=remaining)
+                content = _content(route, response)
+            except Exception as e:
+                chain.failed(route, time.perf_counter() - start, e)
+                continue
+            chain.succeeded(route, time.perf_counter() - start)
+            return content
+        raise chain.exhausted()
+
+    async def complete_async(self, client, task, prompt, timeout=30):
+        """complete() over a shared httpx.AsyncClient (ASGI mode)"""
+        chain = _AttemptChain(self, task, timeout)
+        for route, remaining in chain.routes():
+            headers, payload = route.request(task, prompt)
+            start = time.perf_counter()
+            try:
+                with timed('llm'):
+                    response = await client.post(route.url, json=payload, headers=headers, timeout=remaining)
+                content = _content(route, response)
+            except Exception as e:
+                chain.failed(route, time.perf_counter() - start, e)
+                continue
+            chain.succeeded(route, time.perf_counter() - start)
+            return content
+        raise chain.exhausted()
+
+    def stats(self):
+        """Per-route health plus the most recent routing decisions"""
+        now = time.time()
+        with self._lock:
+            return {
+                'routes': [route.stats(now) for route in self.routes],
+                'decisions': list(self.decisions),
+            }
+
+
+
+class _AttemptChain:
+    """Bookkeeping of one complete() call, shared by the sync and async paths:
+    the plan and deadline, per-attempt records and the final routing decision"""
+
+    def __init__(self, router, task, timeout):
+        self.router = router
+        self.task = task
+        self.deadline = time.monotonic() + timeout
+        self.attempts = []
+        self.errors = []
+
+    def routes(self):
+        """Yield (route, seconds left) in plan order until the deadline passes"""
+        for route in self.router.plan(self.task):
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield route, remaining
+
+    def failed(self, route, seconds, error):
+        self.router._record(self.task, route, seconds, False)
+        self.attempts.append((route.name, 'error', seconds * 1000))
+        self.errors.append(f"{route.name}: {error}")
+
+    def succeeded(self, route, seconds):
+        self.router._record(self.task, route, seconds, True)
+        self.attempts.append((route.name, 'success', seconds * 1000))
+        self.router._decided(self.task, self.attempts, route)
+
+    def exhausted(self):
+        """Record that no route answered and return the exception to raise"""
+        self.router._decided(self.task, self.attempts, None)
+        return Exception(f"No LLM route answered {self.task}: {'; '.join(self.errors) or 'no route configured'}")
+
+def build_router():
+    """Router for the configured routes (LLM_ROUTES JSON replaces the built-in list)
+
+    Each LLM_ROUTES entry has provider, model, url, tier and optionally
+    api_key_env, the environment variable holding its key (default GROQ_API_KEY).
+    """
+    specs = default_routes()
+    if Config.LLM_ROUTES:
+        try:
+            specs = json.loads(Config.LLM_ROUTES)
+        except ValueError as e:
+            print(f"Ignoring invalid LLM_ROUTES: {e}")
+    routes = []
+    for spec in specs:
+        key_env = spec.get('api_key_env')
+        api_key = os.getenv(key_env, '') if key_env else Config.GROQ_API_KEY
+        routes.append(Route(spec['provider'], spec['model'], spec['url'], spec.get('tier', 'standard'),
+                            api_key, Config.LLM_EWMA_ALPHA))
+    return LLMRouter(routes)
+
+
+ROUTER = build_router()
+
+
+def _route_gauge(field):
+    def read():
+        now = time.time()
+        values = {}
+        for route in ROUTER.routes:
+            stats = route.stats(now)
+            value = stats[field]
+            if field == 'ewma_latency_ms':
+                value = value / 1000 if value is not None else None
+            elif field == 'healthy':
+                value = 1 if value else 0
+            if value is not None:
+                values[(route.provider, route.model)] = value
+        return values
+    return read
+
+
+REGISTRY.gauge('resume_llm_route_latency_seconds', 'EWMA latency of successful calls per route',
+               ('provider', 'model'), callback=_route_gauge('ewma_latency_ms'))
+REGISTRY.gauge('resume_llm_route_error_rate', 'EWMA error rate per route', ('provider', 'model'),
+               callback=_route_gauge('error_rate'))
+REGISTRY.gauge('resume_llm_route_healthy', 'Route in rotation (0 = cooling down after errors)',
+               ('provider', 'model'), callback=_route_gauge('healthy'))
@@ -0,0 +1,282 @@
+"""
+Memory high-water tracking for export and AI endpoints
+MEMORY_TRACKING=rss records process RSS growth around each /api/ai request.
+MEMORY_TRACKING=tracemalloc also traces Python allocations. That gives the peak
+allocated per endpoint and per export format, plus the allocation sites whose
+retained memory grew most across each format's high-water render. Results feed /metrics and
+GET /api/debug/memory, so worker memory limits can be sized from data
+
+tracemalloc has one global peak counter per process. With several requests
+running in threads of one worker, a peak includes their overlapping allocations,
+so read it as an upper bound. tracemalloc also slows allocation-heavy code
+noticeably, so enable it for sizing runs rather than permanently
+"""
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from backend.config import Config
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# Nesting limit per thread (request -> format is two levels)
+_MAX_DEPTH = 16
+
+# Bytes; 256 KB to 1 GB
+MEMORY_BUCKETS = tuple(2 ** power for power in range(18, 31))
+
+# Allocation sites that only reflect the measurement itself
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+def max_rss():
+    """Highest resident set size of this process so far, in bytes (None if unknown)"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def current_rss():
+    """Current resident set size in bytes (falls back to the high-water mark off Linux)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return max_rss()
+
+
+class _Frame:
+    """One measured block: its starting traced size and the highest peak seen"""
+    __slots__ = ('scope', 'key', 'start', 'peak', 'rss_start', 'snapshot')
+
+    def __init__(self, scope, key, start, rss_start, snapshot):
+        self.scope = scope
+        self.key = key
+        self.start = start
+        self.peak = start
+        self.rss_start = rss_start
+        self.snapshot = snapshot
+
+
+class MemoryTracker:
+    """Per-endpoint and per-format memory high-water marks"""
+
+    def __init__(self, mode='off', frames=5, top_sites=10):
+        self.mode = mode
+        self.frames = frames
+        self.top_sites = top_sites
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def enabled(self):
+        return self.mode in ('rss', 'tracemalloc')
+
+    def start(self):
+        """Begin tracing allocations when the mode asks for it"""
+        if self.mode == 'tracemalloc' and not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, scope, key, attribute=False):
+        """Start measuring a block; pair with end()
+
+        Args:
+            scope: 'endpoint' or 'format'
+            key: Endpoint name or export format
+            attribute: Snapshot allocations so the top growth sites can be reported
+
+        Returns:
+            _Frame: Handle for end(), or None when tracking is off
+        """
+        if not self.enabled:
+            return None
+        stack = self._stack()
+        start = None
+        snapshot = None
+        if tracemalloc.is_tracing():
+            start, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Keep the enclosing block's peak before resetting the shared counter
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            if attribute:
+                snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        frame = _Frame(scope, key, start, current_rss(), snapshot)
+        if len(stack) >= _MAX_DEPTH:
+            del stack[0]  # a response that was never closed
+        stack.append(frame)
+        return frame
+
+    def end(self, frame):
+        """Finish a block started with begin() and record its high-water mark"""
+        if frame is None:
+            return
+        stack = self._stack()
+        if frame in stack:
+            stack.remove(frame)
+        peak_bytes = None
+        sites = None
+        if frame.start is not None and tracemalloc.is_tracing():
+            peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            peak_bytes = peak - frame.start
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            if frame.snapshot is not None and self._is_new_peak(frame.scope, frame.key, peak_bytes):
+                sites = self._top_sites(frame.snapshot)
+        rss_growth = current_rss() - frame.rss_start
+        self._record(frame.scope, frame.key, peak_bytes, rss_growth, sites)
+
+    @contextmanager
+    def measure(self, scope, key, attribute=False):
+        """Context manager form of begin()/end()"""
+        frame = self.begin(scope, key, attribute)
+        try:
+            yield
+        finally:
+            self.end(frame)
+
+    def _is_new_peak(self, scope, key, peak_bytes):
+        with self._lock:
+            stats = self._stats.get((scope, key))
+        return stats is None or stats['top_sites'] is None or peak_bytes >= (stats['peak_bytes'] or 0)
+
+    def _top_sites(self, before):
+        after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        sites = []
+        for stat in after.compare_to(before, 'lineno')[:self.top_sites]:
+            frame = stat.traceback[0]
+            sites.append({
+                'site': f'{frame.filename}:{frame.lineno}',
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+            })
+        return sites
+
+    def _record(self, scope, key, peak_bytes, rss_growth, sites):
+        with self._lock:
+            stats = self._stats.get((scope, key))
+            if stats is None:
+                stats = self._stats[(scope, key)] = {
+                    'count': 0, 'peak_bytes': None, 'total_peak_bytes': 0, 'last_peak_bytes': None,
+                    'rss_growth_max': 0, 'top_sites': None,
+                }
+            stats['count'] += 1
+            stats['rss_growth_max'] = max(stats['rss_growth_max'], rss_growth)
+            if peak_bytes is not None:
+                stats['last_peak_bytes'] = peak_bytes
+                stats['total_peak_bytes'] += peak_bytes
+                if stats['peak_bytes'] is None or peak_bytes >= stats['peak_bytes']:
+                    stats['peak_bytes'] = peak_bytes
+                    if sites is not None:
+                        stats['top_sites'] = sites
+        if peak_bytes is not None:
+            from backend.services.metrics import REGISTRY
+            histogram = REGISTRY.get('resume_memory_peak_bytes')
+            if histogram is not None:
+                histogram.observe(peak_bytes, scope=scope, key=key)
+
+    def high_water(self):
+        """{(scope, key): peak bytes} for the metrics gauge"""
+        with self._lock:
+            return {scope_key: stats['peak_bytes'] for scope_key, stats in self._stats.items()
+                    if stats['peak_bytes'] is not None}
+
+    def rss_growth(self):
+        with self._lock:
+            return {scope_key: stats['rss_growth_max'] for scope_key, stats in self._stats.items()}
+
+    def report(self, include_heap=False):
+        """Everything recorded so far, grouped by scope
+
+        Args:
+            include_heap: Add the current top allocation sites of the whole heap
+
+        Returns:
+            dict: mode, process RSS, traced totals, and per-endpoint/per-format stats
+        """
+        with self._lock:
+            items = [(scope_key, dict(stats)) for scope_key, stats in self._stats.items()]
+        report = {
+            'mode': self.mode,
+            'rss_bytes': current_rss(),
+            'max_rss_bytes': max_rss(),
+            'endpoints': {},
+            'formats': {},
+        }
+        if tracemalloc.is_tracing():
+            current, _ = tracemalloc.get_traced_memory()
+            report['traced_bytes'] = current
+        for (scope, key), stats in sorted(items):
+            count = stats.pop('count')
+            total = stats.pop('total_peak_bytes')
+            stats['requests'] = count
+            stats['mean_peak_bytes'] = int(total / count) if stats['peak_bytes'] is not None and count else None
+            report['formats' if scope == 'format' else 'endpoints'][key] = stats
+        if include_heap and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+            report['heap_top_sites'] = [
+                {'site': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+                 'size': stat.size, 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:self.top_sites]
+            ]
+        return report
+
+
+TRACKER = MemoryTracker(Config.MEMORY_TRACKING, Config.MEMORY_TRACE_FRAMES)
+
+
+def track_memory(scope, key, attribute=False):
+    """Measure a block with the process tracker (no-op when MEMORY_TRACKING is off)"""
+    return TRACKER.measure(scope, key, attribute)
+
+
+def init_app(app):
+    """Track every /api/ai request and publish the results as metrics"""
+    from flask import g, request
+    from backend.services.metrics import REGISTRY
+
+    TRACKER.start()
+    app.extensions['memory_tracker'] = TRACKER
+
+    REGISTRY.histogram('resume_memory_peak_bytes', 'Peak Python allocation per endpoint/format (tracemalloc)',
+                       ('scope', 'key'), MEMORY_BUCKETS)
+    REGISTRY.gauge('resume_memory_high_water_bytes', 'Highest peak allocation seen per endpoint/format',
+                   ('scope', 'key'), callback=TRACKER.high_water)
+    REGISTRY.gauge('resume_memory_rss_growth_max_bytes', 'Largest RSS growth across one endpoint/format',
+                   ('scope', 'key'), callback=TRACKER.rss_growth)
+    REGISTRY.gauge('resume_process_rss_bytes', 'Resident set size of this worker', callback=current_rss)
+    REGISTRY.gauge('resume_process_max_rss_bytes', 'Highest resident set size of this worker',
+                   callback=lambda: max_rss() or 0)
+
+    @app.before_request
+    def _begin_memory():
+        if request.blueprint == 'ai':
+            g._memory_frame = TRACKER.begin('endpoint', request.endpoint)
+
+    @app.after_request
+    def _end_memory(response):
+        frame = g.pop('_memory_frame', None)
+        if frame is not None:
+            # Streamed bodies are produced after this hook: measure until the response closes
+            response.call_on_close(lambda: TRACKER.end(frame))
+        return response
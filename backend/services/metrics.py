@@ -0,0 +1,323 @@
+"""
+Request and stage metrics
+Counters, histograms and gauges kept in process memory and rendered in the
+Prometheus text exposition format at /metrics. Code paths wrap expensive stages
+(LLM calls, PDF autofit and build, DOCX save, match scoring, session loads) in
+timed(); each observation feeds a histogram and, inside a request, the
+Server-Timing header of the response
+
+Every gunicorn worker keeps its own registry, so a scrape sees the worker that
+answered it; sum the series across scrapes (or run one worker) for totals
+
+/metrics is only served when METRICS_TOKEN is set, and scrapes must send it as
+a bearer token; without a token the route answers 404
+"""
+import bisect
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import Response, g, has_request_context, request
+
+from backend.config import Config
+
+# Seconds; covers fast cache hits up to slow LLM calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Named metric with a fixed set of label names"""
+
+    TYPE = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        try:
+            key = tuple([str(labels[name]) for name in self.labelnames])
+        except KeyError:
+            key = None
+        if key is None or len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return key
+
+    def samples(self):
+        """Yield (suffix, label values, extra label, value) tuples"""
+        raise NotImplementedError
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.TYPE}']
+        for suffix, values, extra, value in self.samples():
+            lines.append(
+                f'{self.name}{suffix}{_format_labels(self.labelnames, values, extra)} {_format_value(value)}'
+            )
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    TYPE = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for values, value in items:
+            yield '', values, None, value
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values (plus their sum and count)"""
+
+    TYPE = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        for values, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                yield '_bucket', values, f'le="{_format_value(float(bound))}"', cumulative
+            yield '_sum', values, None, total
+            yield '_count', values, None, count
+
+
+class Gauge(_Metric):
+    """Current value, either set directly or read from a callback at scrape time
+
+    A callback returns a number, or a dict of {label value tuple: number} when
+    the gauge has labels.
+    """
+
+    TYPE = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        if self.callback is not None:
+            try:
+                result = self.callback()
+            except Exception as e:
+                print(f"Metric {self.name} callback failed: {e}")
+                return
+            items = sorted(result.items()) if isinstance(result, dict) else [((), result)]
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        for values, value in items:
+            yield '', values, None, value
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name, documentation, labelnames=(), callback=None):
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """Prometheus text exposition of every registered metric"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    'resume_http_requests_total', 'HTTP requests by endpoint, method and status',
+    ('endpoint', 'method', 'status')
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    'resume_http_request_duration_seconds', 'Time until the response headers are ready',
+    ('endpoint', 'method')
+)
+STAGE_LATENCY = REGISTRY.histogram(
+    'resume_stage_duration_seconds', 'Duration of instrumented stages (llm, pdf_autofit, docx_save, ...)',
+    ('stage',)
+)
+STAGE_ERRORS = REGISTRY.counter(
+    'resume_stage_errors_total', 'Instrumented stages that raised', ('stage',)
+)
+
+
+def record_timing(stage, seconds):
+    """Add a stage duration to the current request's Server-Timing breakdown"""
+    if not has_request_context():
+        return
+    timings = g.setdefault('_server_timings', {})
+    total, count = timings.get(stage, (0.0, 0))
+    timings[stage] = (total + seconds, count + 1)
+
+
+@contextmanager
+def timed(stage):
+    """Time a block as one observation of the given stage
+
+    Example:
+        with timed('llm'):
+            response = requests.post(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(stage=stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_LATENCY.observe(elapsed, stage=stage)
+        record_timing(stage, elapsed)
+
+
+def server_timing_header(timings, total_seconds):
+    """Format {stage: (seconds, count)} as a Server-Timing header value"""
+    entries = []
+    for stage, (seconds, count) in timings.items():
+        entry = f'{stage};dur={seconds * 1000:.2f}'
+        if count > 1:
+            entry += f';desc="{count}x"'
+        entries.append(entry)
+    entries.append(f'total;dur={total_seconds * 1000:.2f}')
+    return ', '.join(entries)
+
+
+def _register_default_gauges():
+    """Cache and pool gauges, read at scrape time"""
+    def profile_cache():
+        from backend.services.profile_repository import get_profile_repository
+        return get_profile_repository().cached()
+
+    def database_pool():
+        from backend.services.database import get_database
+        stats = get_database().pool_stats()
+        return {('open',): stats['open'], ('idle',): stats['idle']}
+
+    def backends_loaded():
+        from backend.services.backend_registry import AI_SDKS, FORMAT_BACKENDS
+        loaded = {}
+        for registry in (FORMAT_BACKENDS, AI_SDKS):
+            for key, state in registry.status().items():
+                loaded[(registry.name, key)] = 1 if state['loaded'] else 0
+        return loaded
+
+    def static_assets():
+        from flask import current_app
+        manifest = current_app.extensions.get('static_manifest')
+        return len(manifest.assets) if manifest is not None else 0
+
+    REGISTRY.gauge('resume_profile_cache_entries', 'Profile snapshots cached in this worker',
+                   callback=profile_cache)
+    REGISTRY.gauge('resume_db_pool_connections', 'SQLite connections in this worker pool',
+                   ('state',), callback=database_pool)
+    REGISTRY.gauge('resume_backend_loaded', 'Lazy backends imported in this worker (1 = loaded)',
+                   ('registry', 'backend'), callback=backends_loaded)
+    REGISTRY.gauge('resume_static_assets', 'Frontend files held in the static manifest',
+                   callback=static_assets)
+
+
+def init_app(app):
+    """Record per-request metrics, add Server-Timing headers and serve /metrics"""
+    _register_default_gauges()
+
+    @app.before_request
+    def _start_timer():
+        g._request_start = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        start = g.pop('_request_start', None)
+        if start is None:
+            return response
+        elapsed = time.perf_counter() - start
+        endpoint = request.endpoint or '<unmatched>'
+        HTTP_LATENCY.observe(elapsed, endpoint=endpoint, method=request.method)
+        HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        if Config.SERVER_TIMING:
+            response.headers['Server-Timing'] = server_timing_header(g.pop('_server_timings', {}), elapsed)
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        # Route health and traffic are not public: no token configured, no endpoint
+        if not Config.METRICS_TOKEN:
+            return Response('Not Found\n', status=404, mimetype='text/plain')
+        expected = f'Bearer {Config.METRICS_TOKEN}'
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), expected):
+            return Response('Unauthorized\n', status=401, mimetype='text/plain')
+        return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,358 @@
+"""
+Direct canvas writer for PDF export
+Fast path that skips Platypus: the resume is a fixed single-column layout, so
+each paragraph is broken into lines from cached word widths and drawn straight
+onto a ReportLab canvas. Line breaking, spacing and the auto-fit engine follow
+PDFExporter, so both backends put the same words on the same lines.
+Content that still overflows one page after auto-fit, and multi-page CV
+templates, are handed to Platypus
+"""
+import functools
+import io
+import re
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus.paragraph import split as split_words
+
+from backend.services import pdf_fonts
+from backend.services.metrics import REGISTRY, timed
+from backend.services.pdf_exporter import PDFExporter
+from backend.services.resume_document import Bullet, Entry, SkillGroup
+from backend.services.resume_exporter import ResumeExporter
+from backend.services.resume_templates import ResumeTemplates
+
+CANVAS_FALLBACKS = REGISTRY.counter(
+    'resume_pdf_canvas_fallbacks_total', 'Canvas PDF renders handed to Platypus because content overflowed the page'
+)
+
+# Page geometry of PDFExporter.new_doc: the auto-fit engine measures against the
+# margin box, while SimpleDocTemplate's frame pads it by 6pt on every side
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_MARGIN = 0.5 * inch
+_PADDING = 6
+_MEASURE_WIDTH = _PAGE_WIDTH - 2 * _MARGIN
+_MEASURE_HEIGHT = _PAGE_HEIGHT - 2 * _MARGIN
+_FRAME_X = _MARGIN + _PADDING
+_FRAME_WIDTH = _MEASURE_WIDTH - 2 * _PADDING
+_FRAME_TOP = _PAGE_HEIGHT - _MARGIN - _PADDING
+_FRAME_BOTTOM = _MARGIN + _PADDING
+_FUZZ = 1e-6
+
+# Layout details of PDFExporter.build_story
+_CONTACT_GAP = 7
+_RULE_THICKNESS = 0.5
+_RULE_COLOR = colors.HexColor("#1F4E79")
+
+# ParagraphStyle.spaceShrinkage: a line may overrun by this fraction of its spaces
+_SPACE_SHRINKAGE = 0.05
+
+# Style sheets by auto-fit parameters (read-only here)
+_styles = functools.lru_cache(maxsize=64)(PDFExporter.get_styles)
+
+
+def _words(text, bold=False, url=None):
+    return [(word, bold, url) for word in split_words(text.strip())]
+
+
+def compile_blocks(document):
+    """Flatten a ResumeDocument into layout blocks, mirroring PDFExporter.build_story
+
+    Returns:
+        list: ('text', style name, [(word, bold, url)]), ('gap', height) and ('rule',) tuples
+    """
+    blocks = [('text', 'NameStyle', _words(document.name.upper().title().strip()))]
+    if document.headline.strip():
+        blocks.append(('text', 'HeadlineStyle', _words(document.headline)))
+
+    contact = []
+    parts = [(part.strip(), None) for part in (document.phone or '[Your Phone]', document.email)]
+    parts.extend((link.label, link.url) for link in document.links)
+    for i, (text, url) in enumerate(parts):
+        if i:
+            contact.append(('|', False, None))
+        contact.extend(_words(text, url=url))
+    blocks.append(('text', 'CenteredNormal', contact))
+    blocks.append(('gap', _CONTACT_GAP))
+
+    if document.other_links:
+        blocks.append(('text', 'NormalStyle', _words(f"Additional Links: {' | '.join(document.other_links)}")))
+
+    for section in document.sections:
+        blocks.append(('text', 'HeadingStyle', _words(section.heading)))
+        blocks.append(('rule',))
+
+        text_style = 'SummaryStyle' if section.key == 'summary' else 'NormalStyle'
+        for item in section.items:
+            if isinstance(item, SkillGroup):
+                blocks.append(('text', 'NormalStyle',
+                               _words(item.label, bold=True) + _words(', '.join(item.items))))
+            elif isinstance(item, Entry):
+                if item.title is not None:
+                    title_text = re.sub(r'^[0-9]+\s+', '', item.title).lstrip('-•').strip()
+                    blocks.append(('text', 'ProjectTitleStyle', _words(title_text)))
+                for bullet in item.bullets:
+                    blocks.append(('text', 'ProjectDescriptionStyle', _words(f"• {bullet.text}")))
+            elif isinstance(item, Bullet):
+                blocks.append(('text', 'BulletStyle', _words(f"• {item.text}")))
+            else:
+                for line in item.lines():
+                    if line.startswith('-') or line.startswith('•'):
+                        blocks.append(('text', 'BulletStyle', _words(f"• {line.lstrip('-•').strip()}")))
+                    else:
+                        blocks.append(('text', text_style, _words(line)))
+    return blocks
+
+
+class _Widths(dict):
+    """Per-render string width cache keyed by (text, font, size)"""
+
+    def __missing__(self, key):
+        width = self[key] = stringWidth(*key)
+        return width
+
+
+def _split_word(text, font, size, start, max_width, widths):
+    """Pieces of an overlong word: the first continues at start, the rest fill whole lines"""
+    pieces = []
+    piece = ''
+    position = start
+    for char in text:
+        char_width = widths[char, font, size]
+        if position + char_width > max_width:
+            pieces.append(piece)
+            piece = ''
+            position = 0
+        piece += char
+        position += char_width
+    pieces.append(piece)
+    return pieces
+
+
+def break_lines(words, style, bold_font, max_width, widths):
+    """Greedy line breaking as Paragraph does it (spaceShrinkage, splitLongWords)
+
+    Returns:
+        list: (line width, [(word, font, width, following space width, url)]) per line
+    """
+    size = style.fontSize
+    lines = []
+    line = []
+    current = 0
+    shrink = 0
+    # Pieces of a split word are (word, bold, url, ends_line); the last one never splits again
+    pending = [(word, bold, url, None) for word, bold, url in reversed(words)]
+    while pending:
+        word, bold, url, ends_line = pending.pop()
+        font = bold_font if bold else style.fontName
+        width = widths[word, font, size]
+        space = widths[' ', font, size]
+        new = current + line[-1][3] + width if line else width
+
+        if ends_line:
+            if word:
+                line.append((word, font, width, space, url))
+                current = new
+            lines.append((current, line))
+            line, current, shrink = [], 0, 0
+            continue
+
+        if line and new <= max_width + _SPACE_SHRINKAGE * shrink:
+            line.append((word, font, width, space, url))
+            current = new
+            shrink += space
+            continue
+
+        if width > max_width and ends_line is None:
+            start = current + line[-1][3] if line else 0
+            pieces = _split_word(word, font, size, start, max_width, widths)
+            pending.append((pieces[-1], bold, url, False))
+            pending.extend((piece, bold, url, True) for piece in reversed(pieces[:-1]))
+            continue
+
+        if line:
+            lines.append((current, line))
+        line, current, shrink = [(word, font, width, space, url)], width, space
+    if line:
+        lines.append((current, line))
+    return lines
+
+
+def layout(blocks, styles, fonts, width, widths, breaks):
+    """Break every text block at width
+
+    Line breaks depend only on font and width, so the auto-fit iterations that
+    change spacing or leading reuse them from breaks.
+
+    Returns:
+        list: (block, style, lines, height, space before, space after) per block
+    """
+    laid_out = []
+    for block in blocks:
+        if block[0] == 'text':
+            style = styles[block[1]]
+            max_width = width - style.leftIndent - style.rightIndent
+            key = (id(block), style.fontName, style.fontSize, max_width)
+            lines = breaks.get(key)
+            if lines is None:
+                lines = breaks[key] = break_lines(block[2], style, fonts[1], max_width, widths)
+            laid_out.append((block, style, lines, len(lines) * style.leading, style.spaceBefore, style.spaceAfter))
+        elif block[0] == 'gap':
+            laid_out.append((block, None, None, block[1], 0, 0))
+        else:
+            laid_out.append((block, None, None, _RULE_THICKNESS, 0, styles['NormalStyle'].spaceAfter))
+    return laid_out
+
+
+def place(laid_out):
+    """Top edge of every block, stacked the way Frame.add stacks flowables
+
+    Space before a block overlaps the space after the previous one and is
+    dropped at the top of the frame.
+
+    Returns:
+        list: Top y per block, or None when the content overflows the page
+    """
+    tops = []
+    y = _FRAME_TOP
+    at_top = True
+    previous_after = 0
+    for block, style, lines, height, before, after in laid_out:
+        top = y if at_top else y - max(before - previous_after, 0)
+        if top - height < _FRAME_BOTTOM - _FUZZ:
+            return None
+        tops.append(top)
+        new_y = top - height - after
+        previous_after = after
+        if new_y != y:
+            at_top = False
+        y = new_y
+    return tops
+
+
+def _draw_text(text, style, lines, top):
+    """Add a paragraph's lines to the page text object; returns its link rectangles"""
+    links = []
+    size = style.fontSize
+    leading = style.leading
+    max_width = _FRAME_WIDTH - style.leftIndent - style.rightIndent
+    baseline = top - size
+    text.setFillColor(style.textColor)
+    bullet = getattr(style, 'bulletText', None)
+    if bullet and lines:
+        text.setTextOrigin(_FRAME_X + style.bulletIndent, baseline)
+        text.setFont(style.bulletFontName, style.bulletFontSize)
+        text.textOut(bullet)
+    for line_width, words in lines:
+        x = _FRAME_X + style.leftIndent
+        if style.alignment == TA_CENTER:
+            x += (max_width - line_width) / 2
+        text.setTextOrigin(x, baseline)
+        # One textOut per run of words sharing a font
+        run, run_font = [], None
+        for word, font, width, space, url in words:
+            if font != run_font:
+                if run:
+                    text.textOut(' '.join(run) + ' ')
+                text.setFont(font, size)
+                run, run_font = [], font
+            run.append(word)
+            if url:
+                links.append((url, (x, baseline - size / 8, x + width, baseline - size / 8 + leading)))
+            x += width + space
+        text.textOut(' '.join(run))
+        baseline -= leading
+    return links
+
+
+def draw(canvas, laid_out, tops):
+    """Draw placed blocks onto the current canvas page"""
+    text = canvas.beginText()
+    links = []
+    for (block, style, lines, height, before, after), top in zip(laid_out, tops):
+        if block[0] == 'text':
+            links.extend(_draw_text(text, style, lines, top))
+        elif block[0] == 'rule':
+            y = top - height
+            canvas.saveState()
+            canvas.setLineWidth(_RULE_THICKNESS)
+            canvas.setLineCap(1)
+            canvas.setStrokeColor(_RULE_COLOR)
+            canvas.line(_FRAME_X, y, _FRAME_X + min(_MEASURE_WIDTH, _FRAME_WIDTH), y)
+            canvas.restoreState()
+    canvas.drawText(text)
+    # Adjacent words of one link share a single annotation
+    merged = []
+    for url, rect in links:
+        if merged and merged[-1][0] == url and merged[-1][1][1] == rect[1]:
+            merged[-1] = (url, merged[-1][1][:2] + rect[2:])
+        else:
+            merged.append((url, rect))
+    for url, rect in merged:
+        canvas.linkURL(url, rect, relative=1)
+
+
+class CanvasPDFWriter:
+    """Canvas backend for ResumeExporter (Config.PDF_BACKEND = "canvas")"""
+
+    @staticmethod
+    def generate(user, profile, template_name, document=None):
+        """
+        Generate the single-page PDF resume by drawing precomputed lines on a canvas.
+        Same auto-fit engine and output layout as PDFExporter.generate.
+        """
+        export_user, export_profile = ResumeExporter.normalize(user, profile)
+        if document is None:
+            document = ResumeTemplates.generate_document(template_name, export_user, export_profile)
+        fonts = pdf_fonts.faces(ResumeTemplates.get_template_specs(document.template).get('font'))
+        if PDFExporter.multi_page(document.template):
+            # Multi-page CVs are paginated by Platypus
+            return PDFExporter.generate_cv(document, fonts)
+
+        widths = _Widths()
+        breaks = {}
+        compiled = {}
+
+        def blocks_of(document):
+            # Only content compression replaces the document, so compile each one once
+            if id(document) not in compiled:
+                compiled[id(document)] = (document, compile_blocks(document))
+            return compiled[id(document)][1]
+
+        def measure(document, font_size, leading, section_spacing):
+            styles = _styles(font_size, leading, section_spacing, fonts)
+            laid_out = layout(blocks_of(document), styles, fonts, _MEASURE_WIDTH, widths, breaks)
+            return sum(item[3] for item in laid_out)
+
+        document, font_size, leading, section_spacing = PDFExporter.autofit(
+            document, template_name, export_user, export_profile, measure, _MEASURE_HEIGHT
+        )
+
+        with timed('pdf_build'):
+            styles = _styles(font_size, leading, section_spacing, fonts)
+            laid_out = layout(blocks_of(document), styles, fonts, _FRAME_WIDTH, widths, breaks)
+            tops = place(laid_out)
+            if tops is not None:
+                buffer = io.BytesIO()
+                canvas = Canvas(buffer, pagesize=letter)
+                draw(canvas, laid_out, tops)
+                canvas.showPage()
+                canvas.save()
+                return buffer.getvalue(), 'application/pdf'
+
+        # Still more than a page: let Platypus paginate it
+        CANVAS_FALLBACKS.inc()
+        buffer = io.BytesIO()
+        return PDFExporter.render(PDFExporter.new_doc(buffer), buffer, document, fonts,
+                                  font_size, leading, section_spacing)
+
+    @staticmethod
+    def warm():
+        """Load the font registry and build the default style sheet for every family"""
+        pdf_fonts.load()
+        for font_name in set(pdf_fonts.TEMPLATE_FONTS):
+            _styles(11, 14, 6, pdf_fonts.faces(font_name))
@@ -0,0 +1,399 @@
+"""
+PDF resume export
+Single-page ReportLab rendering with the auto-fit loop, plus a multi-page CV
+mode for templates marked multi_page; kept apart from the other exporters so
+reportlab is only imported when a PDF is first requested
+"""
+import io
+import re
+from xml.sax.saxutils import escape
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import (SimpleDocTemplate, BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer,
+                                HRFlowable)
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from backend.config import Config
+from backend.services.resume_exporter import ResumeExporter
+from backend.services.resume_templates import ResumeTemplates
+from backend.services.resume_document import Bullet, Entry, SkillGroup
+from backend.services.metrics import timed
+from backend.services import pdf_fonts
+
+
+class PDFExporter:
+    """ReportLab backend for ResumeExporter"""
+
+    @staticmethod
+    def generate(user, profile, template_name, document=None):
+        """
+        Generate a single-page PDF resume using an AI auto-fit engine.
+        The layout is dynamically adjusted to ensure all content fits on exactly one page.
+        """
+        export_user, export_profile = ResumeExporter.normalize(user, profile)
+
+        # Compile the document model once; only content compression rebuilds it
+        if document is None:
+            document = ResumeTemplates.generate_document(template_name, export_user, export_profile)
+
+        # Registered faces for the template's font (loads the font registry on first use)
+        fonts = pdf_fonts.faces(ResumeTemplates.get_template_specs(document.template).get('font'))
+
+        if PDFExporter.multi_page(document.template):
+            return PDFExporter.generate_cv(document, fonts)
+
+        buffer = io.BytesIO()
+        doc = PDFExporter.new_doc(buffer)
+
+        def measure(document, font_size, leading, section_spacing):
+            # Estimate total height by simulating content layout
+            styles = PDFExporter.get_styles(font_size, leading, section_spacing, fonts)
+            story = PDFExporter.build_story(document, styles, doc.width)
+            total_height = 0
+            for flowable in story:
+                w, h = flowable.wrap(doc.width, doc.height)
+                total_height += h
+            return total_height
+
+        document, font_size, leading, section_spacing = PDFExporter.autofit(
+            document, template_name, export_user, export_profile, measure, doc.height
+        )
+
+        return PDFExporter.render(doc, buffer, document, fonts, font_size, leading, section_spacing)
+
+    @staticmethod
+    def multi_page(template_name):
+        """True when the template renders as a multi-page CV instead of an auto-fitted page"""
+        return Config.PDF_CV_MODE and ResumeTemplates.get_template_specs(template_name).get('multi_page', False)
+
+    @staticmethod
+    def generate_cv(document, fonts):
+        """
+        Generate a multi-page CV: no auto-fit shrinking or content compression,
+        the template's own size, line spacing and margins, a running header from
+        page 2 and page numbers.
+        The story is built and laid out one section item at a time, so only the
+        current item's flowables are alive however long the CV is.
+        """
+        specs = ResumeTemplates.get_template_specs(document.template)
+        buffer = io.BytesIO()
+        doc = CVDocTemplate(buffer, document, fonts, specs.get('margins') or {})
+        # The template's own type size and line spacing (no auto-fit shrinking)
+        font_size = specs.get('size', 11)
+        styles = PDFExporter.get_styles(font_size, font_size * specs.get('spacing', 1.0), 6, fonts)
+
+        with timed('pdf_build'):
+            doc.build_incrementally(PDFExporter.story_chunks(document, styles, doc.width, keep_headings=True))
+        return buffer.getvalue(), 'application/pdf'
+
+    @staticmethod
+    def new_doc(buffer):
+        """Letter-size document template with half-inch margins writing into buffer"""
+        return SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            topMargin=0.5 * inch,
+            bottomMargin=0.5 * inch,
+            leftMargin=0.5 * inch,
+            rightMargin=0.5 * inch
+        )
+
+    @staticmethod
+    def render(doc, buffer, document, fonts, font_size, leading, section_spacing):
+        """Final build with the auto-fit parameters; returns (PDF bytes, content type)"""
+        styles = PDFExporter.get_styles(font_size, leading, section_spacing, fonts)
+        story = PDFExporter.build_story(document, styles, doc.width)
+
+        with timed('pdf_build'):
+            doc.build(story)
+        buffer.seek(0)
+        return buffer.getvalue(), 'application/pdf'
+
+    @staticmethod
+    def autofit(document, template_name, export_user, export_profile, measure, usable_height):
+        """
+        Auto-fit engine shared by the PDF backends: shrink spacing, leading and
+        font size, then compress content, until the resume fits the page.
+
+        Args:
+            document: Compiled ResumeDocument
+            template_name: Template name (content compression recompiles the document)
+            export_user: Normalized user
+            export_profile: Normalized profile snapshot
+            measure: callable(document, font_size, leading, section_spacing) returning the content height
+            usable_height: Height available on the page
+
+        Returns:
+            tuple: (document, font_size, leading, section_spacing) to render with
+        """
+        from backend.services.ai_content_compressor import AIContentCompressor
+
+        # Initial parameters for the auto-fit engine
+        font_size = 11
+        leading = 14
+        section_spacing = 6
+        compressed_summary = False
+        compressed_projects = False
+
+        for iteration in range(10):
+            with timed('pdf_autofit'):
+                total_height = measure(document, font_size, leading, section_spacing)
+
+            # Check if content fits
+            if total_height <= usable_height:
+                # Check if utilization is good (95-99%)
+                utilization = total_height / usable_height
+                if utilization >= 0.95:
+                    break  # Perfect fit found
+                elif utilization >= 0.90:
+                    break  # Good enough fit
+                # If too much whitespace (<90%), don't increase spacing to avoid overflow
+
+            # PRIORITY 1: Reduce section spacing
+            if section_spacing > 2:
+                section_spacing -= 0.5
+                continue
+
+            # PRIORITY 2: Reduce paragraph spacing
+            # Handled in styles generation, reduce spaceAfter values
+            if section_spacing > 2:
+                section_spacing -= 0.5
+                continue
+
+            # PRIORITY 3: Reduce leading
+            if leading > font_size + 1:
+                leading -= 0.5
+                continue
+
+            # PRIORITY 4: Reduce font size
+            if font_size > 8:
+                font_size -= 0.5
+                leading = font_size + 1.5  # Maintain minimum leading
+                continue
+
+            # PRIORITY 5: Compress summary to max 3 lines
+            if not compressed_summary and export_profile.summary:
+                export_profile = export_profile.replace(
+                    summary=AIContentCompressor.compress_summary(export_profile.summary)
+                )
+                compressed_summary = True
+                document = ResumeTemplates.generate_document(template_name, export_user, export_profile)
+                continue
+
+            # PRIORITY 6: Limit projects to 2 bullets each
+            if not compressed_projects and export_profile.projects:
+                export_profile = export_profile.replace(
+                    projects=AIContentCompressor.compress_projects(export_profile.projects)
+                )
+                compressed_projects = True
+                document = ResumeTemplates.generate_document(template_name, export_user, export_profile)
+                continue
+
+            # If we reach here, content should fit
+            break
+
+        return document, font_size, leading, section_spacing
+
+    @staticmethod
+    def get_styles(font_size, leading, section_spacing, fonts=pdf_fonts.TIMES):
+        """Returns a dictionary of ParagraphStyle objects for PDF generation.
+
+        fonts is the (regular, bold) pair from pdf_fonts.faces().
+        """
+        styles = getSampleStyleSheet()
+        
+        base_font_name, bold_font_name = fonts
+        
+        return {
+            'NameStyle': ParagraphStyle(
+                'NameStyle', parent=styles['Normal'], fontName=bold_font_name,
+                fontSize=16, leading=19, textColor=colors.HexColor("#1F4E79"),
+                alignment=TA_CENTER, spaceAfter=6
+            ),
+            'HeadlineStyle': ParagraphStyle(
+                'HeadlineStyle', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=12, leading=14, alignment=TA_CENTER, spaceAfter=4
+            ),
+            'HeadingStyle': ParagraphStyle(
+                'HeadingStyle', parent=styles['Normal'], fontName=bold_font_name,
+                fontSize=font_size + 1, leading=leading + 1, textColor=colors.HexColor("#1F4E79"),
+                spaceBefore=section_spacing, spaceAfter=3
+            ),
+            'SummaryStyle': ParagraphStyle(
+                'SummaryStyle', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=font_size, leading=leading, spaceAfter=3
+            ),
+            'NormalStyle': ParagraphStyle(
+                'NormalStyle', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=font_size, leading=leading, spaceAfter=2
+            ),
+            'ProjectTitleStyle': ParagraphStyle(
+                'ProjectTitleStyle', parent=styles['Normal'], fontName=bold_font_name,
+                fontSize=font_size, leading=leading, textColor=colors.black,
+                spaceBefore=4, spaceAfter=2
+            ),
+            'ProjectDescriptionStyle': ParagraphStyle(
+                'ProjectDescriptionStyle', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=font_size, leading=leading, bulletText='•', leftIndent=12,
+                spaceAfter=3
+            ),
+            'BulletStyle': ParagraphStyle(
+                'BulletStyle', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=font_size - 1, leading=leading - 1, leftIndent=15,
+                bulletIndent=5, spaceAfter=1
+            ),
+            'CenteredNormal': ParagraphStyle(
+                'CenteredNormal', parent=styles['Normal'], fontName=base_font_name,
+                fontSize=font_size, leading=leading, alignment=TA_CENTER,
+                textColor=colors.HexColor("#4472C4")
+            )
+        }
+    
+    @staticmethod
+    def build_story(document, styles, usable_width):
+        """Build the PDF story (list of flowables) from a ResumeDocument."""
+        return [flowable for chunk in PDFExporter.story_chunks(document, styles, usable_width) for flowable in chunk]
+
+    @staticmethod
+    def story_chunks(document, styles, usable_width, keep_headings=False):
+        """
+        Yield the PDF story in small lists of flowables: the header block, then one
+        list per section item. A section heading and its rule come in the same list
+        as the section's first item; keep_headings keeps them (and entry titles) on
+        the page of the content that follows.
+        """
+        header = [Paragraph(escape(document.name.upper().title().strip()), styles['NameStyle'])]
+        if document.headline.strip():
+            header.append(Paragraph(escape(document.headline.strip()), styles['HeadlineStyle']))
+
+        contact_parts = [escape(part.strip()) for part in (document.phone or '[Your Phone]', document.email)]
+        for link in document.links:
+            contact_parts.append(f'<a href="{escape(link.url)}">{link.label}</a>')
+        header.append(Paragraph(' | '.join(contact_parts), styles['CenteredNormal']))
+
+        header.append(Spacer(1, 7))
+
+        normal_style = styles['NormalStyle']
+        if document.other_links:
+            header.append(Paragraph(escape(f"Additional Links: {' | '.join(document.other_links)}"), normal_style))
+        yield header
+
+        for section in document.sections:
+            heading = Paragraph(escape(section.heading), styles['HeadingStyle'])
+            rule = HRFlowable(width=usable_width, thickness=0.5, color=colors.HexColor("#1F4E79"), spaceBefore=0, spaceAfter=normal_style.spaceAfter)
+            if keep_headings:
+                heading.keepWithNext = rule.keepWithNext = 1
+            chunk = [heading, rule]
+
+            text_style = styles['SummaryStyle'] if section.key == 'summary' else normal_style
+            for item in section.items:
+                if isinstance(item, SkillGroup):
+                    # Bold label + normal skill list
+                    chunk.append(Paragraph(f"<b>{escape(item.label)}</b> {escape(', '.join(item.items))}", normal_style))
+                elif isinstance(item, Entry):
+                    if item.title is not None:
+                        # Project title WITHOUT bullet; drop leading numbering if present
+                        title_text = re.sub(r'^[0-9]+\s+', '', item.title).lstrip('-•').strip()
+                        title = Paragraph(escape(title_text), styles['ProjectTitleStyle'])
+                        if keep_headings:
+                            title.keepWithNext = 1
+                        chunk.append(title)
+                    for bullet in item.bullets:
+                        chunk.append(Paragraph(f"• {escape(bullet.text)}", styles['ProjectDescriptionStyle']))
+                elif isinstance(item, Bullet):
+                    chunk.append(Paragraph(f"• {escape(item.text)}", styles['BulletStyle']))
+                else:
+                    for line in item.lines():
+                        if line.startswith('-') or line.startswith('•'):
+                            clean_line = line.lstrip('-•').strip()
+                            chunk.append(Paragraph(f"• {escape(clean_line)}", styles['BulletStyle']))
+                        else:
+                            chunk.append(Paragraph(escape(line), text_style))
+                yield chunk
+                chunk = []
+            if chunk:
+                yield chunk
+
+    @staticmethod
+    def warm():
+        """Load the font registry, build a style sheet and lay out a paragraph per family"""
+        pdf_fonts.load()
+        for font_name in set(pdf_fonts.TEMPLATE_FONTS):
+            styles = PDFExporter.get_styles(11, 14, 6, pdf_fonts.faces(font_name))
+            Paragraph('<b>Warmup</b> text', styles['NormalStyle']).wrap(500, 100)
+
+
+class CVDocTemplate(BaseDocTemplate):
+    """Letter pages with the template's margins; page 1 opens with the resume header,
+    later pages carry a running header (name and headline), every page a page number"""
+
+    def __init__(self, buffer, document, fonts, margins):
+        BaseDocTemplate.__init__(
+            self,
+            buffer,
+            pagesize=letter,
+            topMargin=margins.get('top', 1) * inch,
+            bottomMargin=margins.get('bottom', 1) * inch,
+            leftMargin=margins.get('left', 1) * inch,
+            rightMargin=margins.get('right', 1) * inch
+        )
+        self.resume_name = document.name.upper().title().strip()
+        self.resume_headline = document.headline.strip()
+        self.fonts = fonts
+        self._chunks = iter(())
+        self._story = []
+        self.addPageTemplates([
+            PageTemplate(id='first', frames=[self._body_frame()], onPage=self._page_number,
+                         autoNextPageTemplate='later'),
+            PageTemplate(id='later', frames=[self._body_frame()], onPage=self._running_header),
+        ])
+
+    def _body_frame(self):
+        return Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='body')
+
+    def _page_number(self, canvas, doc):
+        canvas.saveState()
+        canvas.setFont(self.fonts[0], 9)
+        canvas.setFillColor(colors.HexColor("#595959"))
+        canvas.drawCentredString(self.pagesize[0] / 2, self.bottomMargin / 2, f"Page {doc.page}")
+        canvas.restoreState()
+
+    def _running_header(self, canvas, doc):
+        top = self.pagesize[1] - self.topMargin / 2
+        right = self.leftMargin + self.width
+        canvas.saveState()
+        canvas.setFillColor(colors.HexColor("#1F4E79"))
+        canvas.setFont(self.fonts[1], 9)
+        canvas.drawString(self.leftMargin, top, self.resume_name)
+        if self.resume_headline:
+            canvas.setFont(self.fonts[0], 9)
+            canvas.drawRightString(right, top, self.resume_headline)
+        canvas.setStrokeColor(colors.HexColor("#1F4E79"))
+        canvas.setLineWidth(0.5)
+        canvas.line(self.leftMargin, top - 4, right, top - 4)
+        canvas.restoreState()
+        self._page_number(canvas, doc)
+
+    def build_incrementally(self, chunks):
+        """
+        build() fed from an iterator of flowable lists: build() lays out the
+        story list in place and afterFlowable() tops it up from chunks, so each
+        list is created only when the layout reaches it.
+        """
+        self._chunks = iter(chunks)
+        self._story = []
+        self._top_up()
+        self.build(self._story)
+
+    def _top_up(self):
+        # Pull while empty or ending in a keepWithNext flowable, so a heading is
+        # always grouped with the content that follows it
+        while not self._story or getattr(self._story[-1], 'keepWithNext', 0):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return
+            self._story.extend(chunk)
+
+    def afterFlowable(self, flowable):
+        self._top_up()
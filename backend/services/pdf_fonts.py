@@ -0,0 +1,110 @@
+"""
+Font registry for the PDF templates
+Each template in RESUME_FORMATS names a font (Calibri, Consolas, Garamond, ...).
+Those are not redistributable, so each is mapped to a bundled open-license
+equivalent (DejaVu, assets/fonts). The fonts are parsed and registered with
+ReportLab once per process, which also caches their glyph metrics. ReportLab
+embeds only the glyphs a PDF actually uses (subsets), so files stay small
+
+Nothing is loaded at import or app start-up. With WARMUP_BACKENDS the gunicorn
+warmup loads the fonts (PDFExporter.warm); otherwise the first PDF render in a
+worker loads them synchronously, so every PDF uses its template's font. Only
+if loading fails are PDFs rendered in the built-in Times faces (degraded())
+"""
+import os
+import threading
+import time
+
+from backend.config import Config
+from backend.services.metrics import REGISTRY
+
+FONT_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'fonts')
+
+# Bundled families: registered name -> (regular file, bold file)
+FAMILIES = {
+    'ResumeSans': ('DejaVuSans.ttf', 'DejaVuSans-Bold.ttf'),
+    'ResumeSerif': ('DejaVuSerif.ttf', 'DejaVuSerif-Bold.ttf'),
+    'ResumeMono': ('DejaVuSansMono.ttf', 'DejaVuSansMono-Bold.ttf'),
+}
+
+# Built-in PDF faces: never embedded, always available
+TIMES = ('Times-Roman', 'Times-Bold')
+
+# Template font -> family rendering it (Times New Roman is a built-in face)
+TEMPLATE_FONTS = {
+    'Calibri': 'ResumeSans',
+    'Segoe UI': 'ResumeSans',
+    'Arial': 'ResumeSans',
+    'Consolas': 'ResumeMono',
+    'Garamond': 'ResumeSerif',
+    'Times New Roman': 'Times',
+}
+
+FONT_FALLBACKS = REGISTRY.counter(
+    'resume_pdf_font_fallbacks_total', 'PDFs rendered in Times because the bundled fonts failed to load'
+)
+
+_LOCK = threading.Lock()
+_STATE = {'loaded': False, 'load_ms': None, 'error': None}
+
+
+def _register():
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    for family, (regular, bold) in FAMILIES.items():
+        pdfmetrics.registerFont(TTFont(family, os.path.join(FONT_DIR, regular)))
+        pdfmetrics.registerFont(TTFont(f'{family}-Bold', os.path.join(FONT_DIR, bold)))
+        # <b> inside a Paragraph switches to the bold face
+        pdfmetrics.registerFontFamily(family, normal=family, bold=f'{family}-Bold',
+                                      italic=family, boldItalic=f'{family}-Bold')
+
+
+def load():
+    """Register the bundled fonts in this process (idempotent, thread-safe)
+
+    Returns:
+        float: Milliseconds the registration took, or None if it failed or fonts are disabled
+    """
+    if Config.PDF_FONTS != 'bundled':
+        return None
+    with _LOCK:
+        if _STATE['loaded']:
+            return _STATE['load_ms']
+        if _STATE['error']:
+            return None
+        start = time.perf_counter()
+        try:
+            _register()
+        except Exception as e:
+            _STATE['error'] = str(e)
+            print(f"Loading PDF fonts failed, using Times: {e}")
+            return None
+        _STATE['load_ms'] = (time.perf_counter() - start) * 1000
+        _STATE['loaded'] = True
+        return _STATE['load_ms']
+
+
+def degraded():
+    """True when bundled fonts are configured but failed to load
+
+    PDFs rendered in this state use Times and must not be cached as artifacts.
+    """
+    return Config.PDF_FONTS == 'bundled' and _STATE['error'] is not None
+
+
+def faces(font_name):
+    """(regular, bold) ReportLab font names for a template font
+
+    Loads the bundled fonts on first use; returns the built-in Times faces if
+    they are disabled (PDF_FONTS=times) or failed to load.
+    """
+    family = TEMPLATE_FONTS.get(font_name, 'Times')
+    if family == 'Times':
+        return TIMES
+    if not _STATE['loaded']:
+        if load() is None:
+            if Config.PDF_FONTS == 'bundled':
+                FONT_FALLBACKS.inc()
+            return TIMES
+    return family, f'{family}-Bold'
@@ -1,7 +1,12 @@
 from backend.services.grok_service import generate_portfolio_with_grok
+from backend.services.hedged_generation import hedged_generate
 
-def generate_portfolio(user, data):
-    """Generate portfolio using user data and AI enhancement"""
+def generate_portfolio(user, data, budget=None):
+    """Generate portfolio using user data and AI enhancement
+
+    Returns:
+        dict: content, source ('ai' or 'template') and upgrade_id (see hedged_generation)
+    """
     if not user:
         raise ValueError("User data is required to generate portfolio")
 
@@ -9,9 +14,9 @@ def generate_portfolio(user, data):
     use_ai = data.get('use_ai', True) if data else True
 
     if use_ai:
-        return generate_ai_enhanced_portfolio(user, data)
+        return generate_ai_enhanced_portfolio(user, data, budget)
     else:
-        return generate_basic_portfolio(user, data)
+        return {'content': generate_basic_portfolio(user, data), 'source': 'template', 'upgrade_id': None}
 
 def generate_basic_portfolio(user, data):
     """Generate basic portfolio from user data"""
@@ -33,24 +38,20 @@ def generate_basic_portfolio(user, data):
     portfolio += f"Contact: {user.email}\n"
     return portfolio
 
-def generate_ai_enhanced_portfolio(user, data):
-    """Generate AI-enhanced portfolio"""
+def portfolio_inputs(user):
+    """Profile dictionary for the portfolio prompt"""
     # Prepare user profile data
     profile = user.profile if user.profile else None
     
-    skills = profile.skills.split(',') if profile and profile.skills else []
-    skills = [s.strip() for s in skills if s.strip()]
+    skills = list(profile.skills_list) if profile else []
     
-    projects = profile.projects.split('|') if profile and profile.projects else []
-    projects = [p.strip() for p in projects if p.strip()]
+    projects = list(profile.projects_list) if profile else []
     
-    experience = profile.experience.split('|') if profile and profile.experience else []
-    experience = [e.strip() for e in experience if e.strip()]
+    experience = list(profile.experience_list) if profile else []
     
-    education = profile.education.split('|') if profile and profile.education else []
-    education = [e.strip() for e in education if e.strip()]
+    education = list(profile.education_list) if profile else []
     
-    profile_data = {
+    return {
         "name": user.name,
         "email": user.email,
         "headline": profile.headline if profile and profile.headline else "",
@@ -61,11 +62,15 @@ def generate_ai_enhanced_portfolio(user, data):
         "education": education
     }
 
-    try:
-        # Use Grok API for professional portfolio generation
-        portfolio = generate_portfolio_with_grok(profile_data)
-        return portfolio
+def generate_ai_enhanced_portfolio(user, data, budget=None):
+    """Generate AI-enhanced portfolio, falling back to the basic portfolio when
+    the AI misses the budget"""
+    profile_data = portfolio_inputs(user)
 
-    except Exception as e:
-        print(f"AI portfolio generation failed: {e}")
-        return generate_basic_portfolio(user, data)
+    return hedged_generate(
+        'portfolio',
+        getattr(user, 'id', None),
+        lambda timeout: generate_portfolio_with_grok(profile_data, timeout),
+        lambda: generate_basic_portfolio(user, data),
+        budget
+    )
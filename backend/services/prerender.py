@@ -0,0 +1,150 @@
+"""
+Write-time pre-rendering of resume artifacts
+When a profile is saved, a background job renders the user's last-used
+template in PRERENDER_FORMATS and the analysis resume-text snapshot into the
+ArtifactStore, so the first download after a save is served warm. Jobs run on
+a small pool of niced threads. A newer save of the same user cancels a job
+that has not started and stops a running one before its next artifact
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.config import Config
+from backend.services import pdf_fonts, semantic_matcher
+from backend.services.artifact_store import ArtifactStore
+from backend.services.metrics import REGISTRY
+from backend.services.profile_repository import get_profile_repository
+from backend.services.profile_snapshot import UserSnapshot
+from backend.services.resume_exporter import ResumeExporter
+from backend.services.resume_optimizer import ResumeOptimizer
+from backend.services.user_repository import get_user_repository
+
+PRERENDERS = REGISTRY.counter(
+    'resume_prerenders_total',
+    'Pre-rendered artifacts by kind and outcome (rendered, cancelled, failed, skipped)',
+    ('kind', 'outcome')
+)
+PRERENDER_LATENCY = REGISTRY.histogram(
+    'resume_prerender_duration_seconds', 'Time to pre-render one artifact', ('kind',)
+)
+
+# Artifact kind of the analysis resume-text snapshot
+ANALYZE_KIND = 'analyze'
+
+
+def _lower_priority():
+    """Pool initializer: renice the worker thread (Linux niceness is per thread)"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), Config.PRERENDER_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class PreRenderer:
+    """Schedules per-user pre-render jobs and replaces them on every save"""
+
+    def __init__(self, formats, workers=1):
+        self.formats = formats
+        self.workers = workers
+        self._jobs = {}  # user_id -> (profile version, Future)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+
+    def _pool(self):
+        """Worker pool, rebuilt after a fork"""
+        pid = os.getpid()
+        if self._executor is None or self._executor_pid != pid:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='prerender',
+                                                initializer=_lower_priority)
+            self._executor_pid = pid
+            self._jobs = {}
+        return self._executor
+
+    def schedule(self, user_id, version, template_name):
+        """Queue renders of profile version for user_id, cancelling the user's previous job
+
+        Returns:
+            Future: The queued job
+        """
+        with self._lock:
+            previous = self._jobs.get(user_id)
+            if previous is not None and previous[1].cancel():
+                PRERENDERS.inc(kind='job', outcome='cancelled')
+            future = self._pool().submit(self._run, user_id, version, template_name)
+            self._jobs[user_id] = (version, future)
+
+        def forget(done):
+            with self._lock:
+                if self._jobs.get(user_id, (None, None))[1] is done:
+                    del self._jobs[user_id]
+        future.add_done_callback(forget)
+        return future
+
+    def pending(self):
+        """Number of users with a queued or running job in this worker"""
+        with self._lock:
+            return len(self._jobs)
+
+    def _superseded(self, user_id, version):
+        """True once a newer save exists, here or in another worker"""
+        with self._lock:
+            job = self._jobs.get(user_id)
+        if job is not None and job[0] != version:
+            return True
+        return get_profile_repository().get(user_id).version != version
+
+    def _run(self, user_id, version, template_name):
+        """Render every artifact of one save; returns the kinds rendered"""
+        user_data = get_user_repository().get_by_id(user_id)
+        profile = get_profile_repository().get(user_id)
+        if user_data is None or profile.version != version or profile.is_empty:
+            PRERENDERS.inc(kind='job', outcome='cancelled')
+            return []
+        user = UserSnapshot(user_data['id'], user_data['name'], user_data['email'], profile)
+
+        rendered = []
+        export_user = export_profile = document = None
+        for kind in list(self.formats) + [ANALYZE_KIND]:
+            if self._superseded(user_id, version):
+                PRERENDERS.inc(kind=kind, outcome='cancelled')
+                break
+            start = time.perf_counter()
+            try:
+                if kind == ANALYZE_KIND:
+                    text = ResumeOptimizer.profile_resume_text(user)
+                    if semantic_matcher.available():
+                        # Warm the embedding cache for the analysis that usually follows
+                        semantic_matcher.get_embedder().embed_many(semantic_matcher.split_sections(text))
+                    ArtifactStore.put(user_id, kind, '', version, text.encode('utf-8'), 'text/plain')
+                else:
+                    if document is None:
+                        export_user, export_profile = ResumeExporter.normalize(user, profile)
+                        document = ResumeExporter.compile_document(user, profile, template_name)
+                    content, content_type = ResumeExporter.export_resume(
+                        export_user, export_profile, kind, template_name, None, document
+                    )
+                    if kind == 'pdf' and pdf_fonts.degraded():
+                        # Rendered in fallback Times: never serve it for the whole profile version
+                        PRERENDERS.inc(kind=kind, outcome='skipped')
+                        continue
+                    ArtifactStore.put(user_id, kind, template_name, version, content, content_type)
+            except Exception as e:
+                print(f"Pre-rendering {kind} for user {user_id} failed: {e}")
+                PRERENDERS.inc(kind=kind, outcome='failed')
+                continue
+            PRERENDER_LATENCY.observe(time.perf_counter() - start, kind=kind)
+            PRERENDERS.inc(kind=kind, outcome='rendered')
+            rendered.append(kind)
+        return rendered
+
+
+def init_app(app):
+    """Store a PreRenderer in app.extensions['prerenderer'] for the profile-save hook"""
+    formats = [f.strip().lower() for f in Config.PRERENDER_FORMATS.split(',') if f.strip()]
+    prerenderer = PreRenderer(formats, Config.PRERENDER_WORKERS)
+    app.extensions['prerenderer'] = prerenderer
+    REGISTRY.gauge('resume_prerender_pending', 'Users with a queued or running pre-render job in this worker',
+                   callback=prerenderer.pending)
@@ -0,0 +1,104 @@
+"""
+Server-side profile storage
+Profiles are stored once per user in the shared SQLite database as
+zlib-compressed JSON with a version number. Reads are served from a per-worker
+LRU cache of ProfileSnapshot objects; a cached entry is used only while its
+version still matches the row
+"""
+import json
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from backend.config import Config
+from backend.services.database import get_database
+from backend.services.profile_snapshot import ProfileSnapshot
+
+
+class ProfileRepository:
+    """Per-user profile store with a version-checked LRU cache"""
+
+    def __init__(self, database, cache_size=256):
+        self.database = database
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # user_id -> (version, ProfileSnapshot)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _encode(profile):
+        return zlib.compress(json.dumps(profile, separators=(',', ':')).encode('utf-8'))
+
+    @staticmethod
+    def _decode(data):
+        return json.loads(zlib.decompress(data).decode('utf-8'))
+
+    def _remember(self, user_id, version, snapshot):
+        with self._lock:
+            self._cache[user_id] = (version, snapshot)
+            self._cache.move_to_end(user_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def save(self, user_id, profile):
+        """Store the profile for a user, bump its version and snapshot it
+
+        Returns:
+            ProfileSnapshot: The saved profile, normalized
+        """
+        data = self._encode(profile)
+        with self.database.transaction() as conn:
+            row = conn.execute('SELECT version FROM profiles WHERE user_id = ?', (user_id,)).fetchone()
+            version = row[0] + 1 if row else 1
+            conn.execute(
+                'INSERT OR REPLACE INTO profiles (user_id, version, data, updated_at) VALUES (?, ?, ?, ?)',
+                (user_id, version, data, time.time())
+            )
+        snapshot = ProfileSnapshot(profile, version)
+        self._remember(user_id, version, snapshot)
+        return snapshot
+
+    def get(self, user_id):
+        """Return the user's ProfileSnapshot (an empty snapshot if none was saved)"""
+        with self._lock:
+            cached = self._cache.get(user_id)
+
+        with self.database.connection() as conn:
+            if cached is not None:
+                # Another worker may have saved since: compare versions (indexed, no blob read)
+                row = conn.execute('SELECT version FROM profiles WHERE user_id = ?', (user_id,)).fetchone()
+                if row is not None and row[0] == cached[0]:
+                    with self._lock:
+                        if user_id in self._cache:
+                            self._cache.move_to_end(user_id)
+                    return cached[1]
+            row = conn.execute('SELECT version, data FROM profiles WHERE user_id = ?', (user_id,)).fetchone()
+
+        if row is None:
+            return ProfileSnapshot()
+        snapshot = ProfileSnapshot(self._decode(row['data']), row['version'])
+        self._remember(user_id, row['version'], snapshot)
+        return snapshot
+
+    def cached(self):
+        """Number of snapshots currently held in this worker's cache"""
+        with self._lock:
+            return len(self._cache)
+
+    def version(self, user_id):
+        """Current profile version for a user (0 if none saved)"""
+        with self.database.connection() as conn:
+            row = conn.execute('SELECT version FROM profiles WHERE user_id = ?', (user_id,)).fetchone()
+        return row[0] if row else 0
+
+
+_REPOSITORY = None
+
+
+def get_profile_repository():
+    """Process-wide profile repository on the shared database"""
+    global _REPOSITORY
+    database = get_database()
+    if _REPOSITORY is None or _REPOSITORY.database is not database:
+        _REPOSITORY = ProfileRepository(database, Config.PROFILE_CACHE_SIZE)
+    return _REPOSITORY
@@ -0,0 +1,117 @@
+"""
+Immutable profile snapshot shared by every service
+A profile is normalized once when it is saved: all fields present as strings,
+list-valued fields pre-split and a content hash computed. Routes, generators and
+exporters all read the same slotted snapshot instead of rebuilding their own
+SimpleUser/SimpleProfile views and re-splitting the text on every request
+"""
+import hashlib
+import json
+
+PROFILE_FIELDS = (
+    'headline', 'phone', 'linkedin', 'github', 'email', 'leetcode', 'other_links',
+    'summary', 'skills', 'projects', 'experience', 'education', 'dob', 'languages', 'hobbies'
+)
+
+
+def _split(text, separator):
+    """Non-empty stripped parts of text split on separator"""
+    if not text:
+        return ()
+    return tuple(part.strip() for part in text.split(separator) if part.strip())
+
+
+class ProfileSnapshot:
+    """Read-only profile: raw fields, pre-split lists and a content hash
+
+    Attributes:
+        <field>: Every name in PROFILE_FIELDS, always a string ('' when unset)
+        skills_list: Skills split on ','
+        projects_list, experience_list, education_list: Entries split on '|'
+        other_links_list: Additional links, one per line
+        content_hash: Stable hash of the field values (cache key for derived data)
+        version: Profile version from the repository (0 when not stored)
+    """
+    __slots__ = PROFILE_FIELDS + (
+        'skills_list', 'projects_list', 'experience_list', 'education_list', 'other_links_list',
+        'content_hash', 'version'
+    )
+
+    def __init__(self, data=None, version=0):
+        data = data or {}
+        values = {field: data.get(field) or '' for field in PROFILE_FIELDS}
+        setter = object.__setattr__
+        for field, value in values.items():
+            setter(self, field, value)
+        setter(self, 'skills_list', _split(values['skills'], ','))
+        setter(self, 'projects_list', _split(values['projects'], '|'))
+        setter(self, 'experience_list', _split(values['experience'], '|'))
+        setter(self, 'education_list', _split(values['education'], '|'))
+        setter(self, 'other_links_list', _split(values['other_links'], '\n'))
+        canonical = json.dumps([values[field] for field in PROFILE_FIELDS], separators=(',', ':'))
+        setter(self, 'content_hash', hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16])
+        setter(self, 'version', version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ProfileSnapshot is immutable; use replace()')
+
+    def __delattr__(self, name):
+        raise AttributeError('ProfileSnapshot is immutable')
+
+    def __reduce__(self):
+        return ProfileSnapshot, (self.to_dict(), self.version)
+
+    def __eq__(self, other):
+        return isinstance(other, ProfileSnapshot) and other.content_hash == self.content_hash
+
+    def __hash__(self):
+        return hash(self.content_hash)
+
+    @property
+    def is_empty(self):
+        return not any(getattr(self, field) for field in PROFILE_FIELDS)
+
+    def replace(self, **changes):
+        """Return a new snapshot with some fields changed (e.g. a compressed summary)"""
+        data = self.to_dict()
+        data.update(changes)
+        return ProfileSnapshot(data, self.version)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in PROFILE_FIELDS}
+
+
+class UserSnapshot:
+    """Account fields plus the user's profile snapshot (None if no profile was saved)"""
+    __slots__ = ('id', 'name', 'email', 'profile')
+
+    def __init__(self, user_id, name, email, profile=None):
+        self.id = user_id
+        self.name = name
+        self.email = email
+        self.profile = profile
+
+
+def normalize(user, profile):
+    """Return the (UserSnapshot, ProfileSnapshot) pair the templates read
+
+    Args:
+        user: UserSnapshot or any object with name and email (id optional)
+        profile: ProfileSnapshot, profile dictionary, any object with the
+            PROFILE_FIELDS attributes, or None
+
+    Returns:
+        tuple: (UserSnapshot, ProfileSnapshot)
+    """
+    if not isinstance(profile, ProfileSnapshot):
+        if profile is not None and not isinstance(profile, dict):
+            profile = {field: getattr(profile, field, '') for field in PROFILE_FIELDS}
+        profile = ProfileSnapshot(profile)
+    if not isinstance(user, UserSnapshot):
+        user = UserSnapshot(
+            getattr(user, 'id', None),
+            getattr(user, 'name', '[Your Name]'),
+            getattr(user, 'email', profile.email or '[Your Email]'),
+            profile
+        )
+    return user, profile
@@ -0,0 +1,355 @@
+"""
+Per-user rate limiting and fair queueing for the /api/ai endpoints
+Each request is classified as llm (calls the language model), render (PDF/DOCX
+exports and bundles) or light (everything else) and takes tokens from the
+caller's bucket for that class, keyed by session['user_id'] (or the client
+address before login). Buckets refill continuously; an empty one answers 429
+with Retry-After
+
+llm and render buckets live in the shared SQLite database, so every gunicorn
+worker enforces the same limit. Each worker also remembers until when a bucket
+is empty and turns repeat requests away without touching the database. light
+buckets stay in worker memory
+
+A request that passes its bucket still needs one of the worker's slots for its
+class. While slots are free it runs at once; when they are all busy, waiting
+requests are admitted by weighted fair queueing (smallest virtual finish time
+first) rather than in arrival order, so one user's burst cannot queue ahead of
+everyone else's single request
+"""
+import heapq
+import itertools
+import math
+import random
+import sqlite3
+import threading
+import time
+
+from backend.config import Config
+from backend.services.database import get_database
+
+# Endpoints (blueprint view names) that call the language model
+LLM_ENDPOINTS = ('generate_cover_letter_endpoint', 'generate_portfolio_endpoint', 'analyze_resume_endpoint')
+RENDER_FORMATS = ('pdf', 'docx')
+
+# Fraction of shared-bucket writes that also purge idle rows
+_PURGE_PROBABILITY = 0.01
+# Memory buckets kept before idle (full) ones are dropped
+_MAX_MEMORY_BUCKETS = 10000
+
+
+def parse_rate(value):
+    """Parse '<requests>/<seconds>' into (capacity, tokens per second)
+
+    Example:
+        parse_rate('10/60') -> (10.0, 0.1666...): a burst of 10, then one every 6 s
+    """
+    count, _, seconds = str(value).partition('/')
+    capacity = float(count)
+    seconds = float(seconds or 1)
+    if capacity <= 0 or seconds <= 0:
+        raise ValueError(f"Invalid rate limit: {value}")
+    return capacity, capacity / seconds
+
+
+def _refill(tokens, updated, now, capacity, rate):
+    return min(capacity, tokens + max(0.0, now - updated) * rate)
+
+
+class MemoryBuckets:
+    """Token buckets in this worker's memory"""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, cost, capacity, rate, now):
+        """Take cost tokens if available
+
+        Returns:
+            tuple: (allowed, tokens left after the attempt)
+        """
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = _refill(tokens, updated, now, capacity, rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > _MAX_MEMORY_BUCKETS:
+                self._prune(now, capacity, rate)
+            return allowed, tokens
+
+    def _prune(self, now, capacity, rate):
+        for key, (tokens, updated) in list(self._buckets.items()):
+            if _refill(tokens, updated, now, capacity, rate) >= capacity:
+                del self._buckets[key]
+
+
+class SQLiteBuckets:
+    """Token buckets in the shared database (one row per user and class)"""
+
+    def take(self, key, cost, capacity, rate, now):
+        """Take cost tokens if available
+
+        Returns:
+            tuple: (allowed, tokens left after the attempt)
+        """
+        with get_database().transaction() as conn:
+            row = conn.execute('SELECT tokens, updated FROM rate_limits WHERE key = ?', (key,)).fetchone()
+            tokens = capacity if row is None else _refill(row['tokens'], row['updated'], now, capacity, rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            conn.execute(
+                'INSERT OR REPLACE INTO rate_limits (key, tokens, updated) VALUES (?, ?, ?)', (key, tokens, now)
+            )
+            if random.random() < _PURGE_PROBABILITY:
+                # A bucket idle for a day is full again under any sensible rate
+                conn.execute('DELETE FROM rate_limits WHERE updated < ?', (now - 86400,))
+        return allowed, tokens
+
+
+class _Waiter:
+    __slots__ = ('event', 'start', 'granted', 'cancelled')
+
+    def __init__(self, start):
+        self.event = threading.Event()
+        self.start = start
+        self.granted = False
+        self.cancelled = False
+
+
+class FairQueue:
+    """Weighted fair admission to a fixed number of concurrent slots
+
+    Every request gets a virtual finish time: it starts where its user's
+    previous request finished (or at the current virtual time, whichever is
+    later) and lasts cost / weight. Waiting requests are admitted in order of
+    finish time, so each user gets an equal share of the slots under
+    contention however many requests they queue.
+    """
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.active = 0
+        self._virtual_time = 0.0
+        self._finish = {}
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self):
+        with self._lock:
+            return sum(1 for _, _, waiter in self._waiting if not waiter.cancelled)
+
+    def acquire(self, user, cost=1.0, weight=1.0, timeout=None):
+        """Wait for a slot
+
+        Returns:
+            bool: True once a slot is held (release() it), False on timeout
+        """
+        with self._lock:
+            start = max(self._virtual_time, self._finish.get(user, 0.0))
+            finish = start + cost / weight
+            self._finish[user] = finish
+            if self.active < self.slots and not self._waiting:
+                self.active += 1
+                self._virtual_time = start
+                return True
+            waiter = _Waiter(start)
+            heapq.heappush(self._waiting, (finish, next(self._sequence), waiter))
+
+        if waiter.event.wait(timeout):
+            return True
+        with self._lock:
+            if waiter.granted:
+                return True
+            waiter.cancelled = True
+            # Give the user back the share this request never used
+            if self._finish.get(user) == finish:
+                self._finish[user] = start
+            return False
+
+    def release(self):
+        """Hand the slot to the waiter with the smallest finish time, or free it"""
+        with self._lock:
+            while self._waiting:
+                _, _, waiter = heapq.heappop(self._waiting)
+                if waiter.cancelled:
+                    continue
+                waiter.granted = True
+                self._virtual_time = max(self._virtual_time, waiter.start)
+                waiter.event.set()
+                return
+            self.active -= 1
+            if not self.active and len(self._finish) > 1024:
+                # Idle: users at or behind the virtual time carry no credit or debt
+                self._finish = {user: finish for user, finish in self._finish.items()
+                                if finish > self._virtual_time}
+
+
+class RateLimiter:
+    """Token buckets plus fair-queued slots per endpoint class"""
+
+    def __init__(self, limits, slots, store='sqlite', queue_timeout=10.0):
+        """
+        Args:
+            limits: {class: '<requests>/<seconds>'}
+            slots: {class: concurrent requests per worker (0 = unlimited)}
+            store: 'sqlite' (shared across workers) or 'memory' for llm/render buckets
+            queue_timeout: Seconds a request may wait for a slot before 429
+        """
+        self.limits = {cls: parse_rate(limit) for cls, limit in limits.items()}
+        self.queues = {cls: FairQueue(count) for cls, count in slots.items() if count > 0}
+        self.queue_timeout = queue_timeout
+        self.memory = MemoryBuckets()
+        self.shared = SQLiteBuckets() if store == 'sqlite' else self.memory
+        self._empty_until = {}
+        self._lock = threading.Lock()
+
+    def take(self, identity, cls, cost=1):
+        """Take tokens from identity's bucket for cls
+
+        Returns:
+            float: 0 when allowed, otherwise seconds until the request would be
+            allowed (for Retry-After)
+        """
+        if cls not in self.limits:
+            return 0.0
+        capacity, rate = self.limits[cls]
+        cost = min(cost, capacity)  # oversized requests still pass on a full bucket
+        key = f'{cls}:{identity}'
+        now = time.time()
+
+        # Tokens only come back with time, so a bucket seen empty stays empty until then
+        with self._lock:
+            empty_until = self._empty_until.get(key)
+        if empty_until is not None and now < empty_until:
+            return empty_until - now
+
+        store = self.memory if cls == 'light' else self.shared
+        try:
+            allowed, tokens = store.take(key, cost, capacity, rate, now)
+        except sqlite3.Error as e:
+            print(f"Rate limit store failed, allowing request: {e}")
+            return 0.0
+        if allowed:
+            return 0.0
+
+        wait = (cost - tokens) / rate
+        with self._lock:
+            self._empty_until[key] = now + wait
+            if len(self._empty_until) > _MAX_MEMORY_BUCKETS:
+                self._empty_until = {k: t for k, t in self._empty_until.items() if t > now}
+        return wait
+
+    def acquire_slot(self, identity, cls, cost=1):
+        """Wait (fairly) for a concurrency slot of cls
+
+        Returns:
+            FairQueue to release afterwards, None when cls is unlimited, or
+            False when the wait timed out
+        """
+        queue = self.queues.get(cls)
+        if queue is None:
+            return None
+        return queue if queue.acquire(identity, cost, timeout=self.queue_timeout) else False
+
+    def stats(self):
+        """{class: (active slots, waiting requests)} for this worker"""
+        return {cls: (queue.active, queue.waiting) for cls, queue in self.queues.items()}
+
+
+def classify(endpoint, data, args=None):
+    """Endpoint class and token cost of an /api/ai request
+
+    Args:
+        endpoint: Flask endpoint name, e.g. 'ai.generate_resume_endpoint'
+        data: Parsed JSON body (or {})
+        args: Query string arguments
+
+    Returns:
+        tuple: (class, cost)
+    """
+    name = (endpoint or '').rsplit('.', 1)[-1]
+    if name in LLM_ENDPOINTS:
+        return 'llm', 1
+    if name == 'generate_resume_endpoint':
+        export_format = data.get('format') or (args or {}).get('format') or 'txt'
+        return ('render' if str(export_format).lower() in RENDER_FORMATS else 'light'), 1
+    if name == 'generate_bundle_endpoint':
+        from backend.services.resume_bundle import ResumeBundle
+        pairs = ResumeBundle.plan(data.get('formats', ['pdf', 'docx', 'html']),
+                                  data.get('templates', ['professional']))
+        return 'render', max(1, len(pairs))
+    return 'light', 1
+
+
+def init_app(app):
+    """Limit every /api/ai request; the limiter is stored in app.extensions['rate_limiter']"""
+    from flask import g, jsonify, request, session
+    from backend.services.metrics import REGISTRY
+
+    limiter = RateLimiter(
+        {'llm': Config.RATE_LIMIT_LLM, 'render': Config.RATE_LIMIT_RENDER, 'light': Config.RATE_LIMIT_LIGHT},
+        {'llm': Config.RATE_LIMIT_SLOTS_LLM, 'render': Config.RATE_LIMIT_SLOTS_RENDER},
+        Config.RATE_LIMIT_STORE,
+        Config.RATE_LIMIT_QUEUE_TIMEOUT,
+    )
+    app.extensions['rate_limiter'] = limiter
+
+    rejected = REGISTRY.counter('resume_rate_limited_total', 'Requests answered 429 by class and reason',
+                                ('class', 'reason'))
+    queue_wait = REGISTRY.histogram('resume_fair_queue_wait_seconds', 'Time spent waiting for a slot',
+                                    ('class',))
+    REGISTRY.gauge('resume_fair_queue_waiting', 'Requests waiting for a slot in this worker', ('class',),
+                   callback=lambda: {(cls,): waiting for cls, (_, waiting) in limiter.stats().items()})
+
+    def too_many(cls, reason, seconds):
+        rejected.inc(**{'class': cls, 'reason': reason})
+        retry_after = max(1, int(math.ceil(seconds)))
+        response = jsonify({'error': 'Too many requests, please retry later', 'retry_after': retry_after})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+    @app.before_request
+    def _rate_limit():
+        if request.blueprint != 'ai':
+            return None
+        identity = session.get('user_id') or f'ip:{request.remote_addr}'
+        data = request.get_json(silent=True) if request.is_json else None
+        cls, cost = classify(request.endpoint, data if isinstance(data, dict) else {}, request.args)
+
+        wait = limiter.take(identity, cls, cost)
+        if wait > 0:
+            return too_many(cls, 'bucket', wait)
+
+        start = time.perf_counter()
+        slot = limiter.acquire_slot(identity, cls, cost)
+        if slot is None:
+            return None
+        queue_wait.observe(time.perf_counter() - start, **{'class': cls})
+        if slot is False:
+            return too_many(cls, 'queue', limiter.queue_timeout)
+        g._rate_limit_slot = slot
+        return None
+
+    @app.after_request
+    def _release_slot(response):
+        slot = g.pop('_rate_limit_slot', None)
+        if slot is not None:
+            if response.is_streamed:
+                # Streamed bodies (bundles) keep rendering until the response closes
+                response.call_on_close(slot.release)
+            else:
+                slot.release()
+        return response
+
+    @app.teardown_request
+    def _release_on_error(exc):
+        slot = g.pop('_rate_limit_slot', None)
+        if slot is not None:
+            slot.release()
@@ -0,0 +1,218 @@
+"""
+On-demand per-request profiling
+When PROFILING_ENABLED is set, a request can ask to be run under cProfile. It
+does so with a signed X-Profile-Token header, or with X-Profile-Request: 1 from
+a logged-in account listed in PROFILING_ADMIN_EMAILS. The profile is written to
+instance_path/profiles/<profile id>.prof, where the id is a fresh uuid
+(prefixed with the caller's X-Request-ID, if any), and returned in the
+X-Profile-Id response header. With profiling disabled no hook is installed at
+all, so normal requests pay nothing
+
+Issue a token (valid for PROFILING_TOKEN_TTL seconds):
+    python -m backend.services.request_profiler token
+"""
+import cProfile
+import os
+import pstats
+import re
+import uuid
+
+from flask import g, request, session
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from backend.config import Config
+
+TOKEN_HEADER = 'X-Profile-Token'
+ADMIN_HEADER = 'X-Profile-Request'
+ID_HEADER = 'X-Profile-Id'
+
+_PROFILE_ID = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+def _serializer():
+    return URLSafeTimedSerializer(Config.SECRET_KEY, salt='request-profiler')
+
+
+class RequestProfiler:
+    """cProfile hook for whitelisted requests plus access to the stored profiles"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @staticmethod
+    def issue_token():
+        """Signed token that enables profiling until PROFILING_TOKEN_TTL expires"""
+        return _serializer().dumps({'scope': 'profile'})
+
+    @staticmethod
+    def _valid_token(token):
+        try:
+            data = _serializer().loads(token, max_age=Config.PROFILING_TOKEN_TTL)
+        except BadSignature:
+            return False
+        return isinstance(data, dict) and data.get('scope') == 'profile'
+
+    @staticmethod
+    def _is_admin():
+        user_id = session.get('user_id')
+        if not user_id or not Config.PROFILING_ADMIN_EMAILS:
+            return False
+        from backend.services.user_repository import get_user_repository
+        user = get_user_repository().get_by_id(user_id)
+        return user is not None and user['email'].lower() in Config.PROFILING_ADMIN_EMAILS
+
+    @staticmethod
+    def authorized():
+        """True if the current request carries a valid token or comes from an admin"""
+        token = request.headers.get(TOKEN_HEADER)
+        if token:
+            return RequestProfiler._valid_token(token)
+        return RequestProfiler._is_admin()
+
+    @staticmethod
+    def requested():
+        """True if the current request asks to be profiled and is allowed to"""
+        token = request.headers.get(TOKEN_HEADER)
+        if token:
+            return RequestProfiler._valid_token(token)
+        if request.headers.get(ADMIN_HEADER) == '1':
+            return RequestProfiler._is_admin()
+        return False
+
+    def path(self, profile_id):
+        """File for a profile id, or None if the id is malformed"""
+        if not _PROFILE_ID.match(profile_id or ''):
+            return None
+        return os.path.join(self.directory, f'{profile_id}.prof')
+
+    def _prune(self):
+        """Keep only the newest PROFILING_MAX_FILES profiles"""
+        entries = self.list()
+        for entry in entries[Config.PROFILING_MAX_FILES:]:
+            for path in (self.path(entry['id']), os.path.join(self.directory, f"{entry['id']}.txt")):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def start(self):
+        """before_request: start profiling this request if it is whitelisted"""
+        if not RequestProfiler.requested():
+            return
+        # Always unique, so a repeated X-Request-ID never overwrites an earlier profile
+        profile_id = uuid.uuid4().hex
+        requested_id = request.headers.get('X-Request-ID', '')
+        if _PROFILE_ID.match(requested_id):
+            profile_id = f'{requested_id[:31]}-{profile_id}'
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except (ValueError, RuntimeError) as e:
+            # Another profiler is active (Python 3.12+ allows one per process)
+            print(f"Request profiling skipped: {e}")
+            return
+        g._request_profile = (profile_id, profiler)
+
+    def finish(self, response):
+        """after_request: stop once the body has been sent (covers streamed responses)"""
+        state = g.pop('_request_profile', None)
+        if state is None:
+            return response
+        profile_id, profiler = state
+        endpoint = request.endpoint or '<unmatched>'
+
+        def dump():
+            profiler.disable()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                profiler.dump_stats(self.path(profile_id))
+                with open(os.path.join(self.directory, f'{profile_id}.txt'), 'w') as f:
+                    f.write(endpoint)
+                self._prune()
+            except OSError as e:
+                print(f"Failed to write request profile {profile_id}: {e}")
+
+        response.call_on_close(dump)
+        response.headers[ID_HEADER] = profile_id
+        return response
+
+    def list(self):
+        """Stored profiles, newest first
+
+        Returns:
+            list: dicts with id, endpoint, created (epoch seconds) and size
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.prof'):
+                continue
+            profile_id = name[:-len('.prof')]
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            endpoint = None
+            try:
+                with open(os.path.join(self.directory, f'{profile_id}.txt')) as f:
+                    endpoint = f.read().strip()
+            except OSError:
+                pass
+            entries.append({'id': profile_id, 'endpoint': endpoint,
+                            'created': stat.st_mtime, 'size': stat.st_size})
+        entries.sort(key=lambda entry: entry['created'], reverse=True)
+        return entries
+
+    def summary(self, profile_id, limit=25, sort='cumulative'):
+        """Top functions of a stored profile
+
+        Args:
+            profile_id: Id from X-Profile-Id or list()
+            limit: Number of functions to return
+            sort: 'cumulative' or 'tottime'
+
+        Returns:
+            dict: total_calls, total_time and the top functions, or None if the
+                profile does not exist
+        """
+        path = self.path(profile_id)
+        if path is None or not os.path.exists(path):
+            return None
+        stats = pstats.Stats(path)
+        stats.sort_stats('tottime' if sort == 'tottime' else 'cumulative')
+        functions = []
+        for func in stats.fcn_list[:limit]:
+            primitive_calls, calls, total_time, cumulative_time, _ = stats.stats[func]
+            filename, line, name = func
+            functions.append({
+                'function': f'{filename}:{line}({name})' if line else name,
+                'calls': calls,
+                'primitive_calls': primitive_calls,
+                'tottime_ms': round(total_time * 1000, 3),
+                'cumtime_ms': round(cumulative_time * 1000, 3),
+            })
+        return {
+            'id': profile_id,
+            'total_calls': stats.total_calls,
+            'total_time_ms': round(stats.total_tt * 1000, 3),
+            'functions': functions,
+        }
+
+
+def init_app(app):
+    """Install the profiling hook (only called when PROFILING_ENABLED)"""
+    profiler = RequestProfiler(os.path.join(app.instance_path, 'profiles'))
+    app.extensions['request_profiler'] = profiler
+    app.before_request(profiler.start)
+    app.after_request(profiler.finish)
+    return profiler
+
+
+if __name__ == '__main__':
+    import sys
+    if sys.argv[1:] == ['token']:
+        print(RequestProfiler.issue_token())
+    else:
+        print(__doc__)
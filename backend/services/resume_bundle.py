@@ -0,0 +1,160 @@
+"""
+Multi-format resume bundle export
+Normalizes the profile and compiles each template's document model once, renders
+every requested format/template pair concurrently and streams a ZIP back as each
+artifact finishes, followed by a manifest with per-artifact timings
+"""
+import io
+import json
+import multiprocessing
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from backend.config import Config
+from backend.services.resume_exporter import ResumeExporter
+from backend.services.resume_templates import ResumeTemplates
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _render_artifact(user, profile, format_type, template_name, docx_backend, document):
+    """Worker entry point (must stay module-level so process pools can pickle it)"""
+    start = time.perf_counter()
+    content, content_type = ResumeExporter.export_resume(
+        user, profile, format_type, template_name, docx_backend, document
+    )
+    return content, content_type, (time.perf_counter() - start) * 1000
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink for ZipFile; bytes written are handed out by drain()"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ResumeBundle:
+    """Renders several formats/templates of one resume into a streamed ZIP"""
+
+    MAX_ARTIFACTS = 24
+
+    @staticmethod
+    def _executor():
+        """Shared pool: threads by default, or processes to spread renders across cores
+
+        Process pools use the forkserver start method: the worker already runs
+        prerender, rate-limiter and hedging threads, and forking a multithreaded
+        process can deadlock on locks those threads hold.
+        """
+        global _EXECUTOR
+        if _EXECUTOR is None:
+            with _EXECUTOR_LOCK:
+                if _EXECUTOR is None:
+                    workers = Config.BUNDLE_MAX_WORKERS or os.cpu_count() or 1
+                    if Config.BUNDLE_EXECUTOR == 'thread':
+                        _EXECUTOR = ThreadPoolExecutor(max_workers=workers)
+                    else:
+                        _EXECUTOR = ProcessPoolExecutor(
+                            max_workers=workers, mp_context=multiprocessing.get_context('forkserver')
+                        )
+        return _EXECUTOR
+
+    @staticmethod
+    def plan(formats, templates):
+        """Validate requested formats/templates and return (format, template) pairs
+
+        Unknown formats and templates are dropped; duplicates are removed while
+        preserving request order.
+
+        Returns:
+            list: (format, template) tuples, at most MAX_ARTIFACTS long
+        """
+        supported_formats = [f['format'] for f in ResumeExporter.get_supported_formats()]
+        valid_templates = ResumeTemplates.get_all_templates()
+
+        formats = [f.lower() for f in dict.fromkeys(formats or []) if isinstance(f, str)]
+        templates = [t.lower() for t in dict.fromkeys(templates or []) if isinstance(t, str)]
+        formats = [f for f in formats if f in supported_formats]
+        templates = [t for t in templates if t in valid_templates]
+
+        pairs = [(f, t) for t in templates for f in formats]
+        return pairs[:ResumeBundle.MAX_ARTIFACTS]
+
+    @staticmethod
+    def stream(user, profile, pairs, docx_backend=None):
+        """Render every (format, template) pair and yield ZIP archive chunks
+
+        Args:
+            user: User object with name and email
+            profile: ProfileSnapshot or profile dictionary
+            pairs: Output of plan()
+            docx_backend: 'python-docx' or 'ooxml'; None uses Config.DOCX_BACKEND
+
+        Yields:
+            bytes: Consecutive pieces of the ZIP archive
+        """
+        bundle_start = time.perf_counter()
+
+        # Normalize once: picklable user/profile snapshots and one compiled
+        # document model per template
+        export_user, export_profile = ResumeExporter.normalize(user, profile)
+        documents = {}
+        for _, template_name in pairs:
+            if template_name not in documents:
+                documents[template_name] = ResumeTemplates.generate_document(
+                    template_name, export_user, export_profile
+                )
+        prepare_ms = (time.perf_counter() - bundle_start) * 1000
+
+        extensions = {f['format']: f['extension'] for f in ResumeExporter.get_supported_formats()}
+        base_name = f"resume_{export_user.name.lower().replace(' ', '_')}"
+
+        executor = ResumeBundle._executor()
+        futures = {}
+        for format_type, template_name in pairs:
+            future = executor.submit(
+                _render_artifact, export_user, export_profile, format_type, template_name,
+                docx_backend, documents[template_name]
+            )
+            futures[future] = (format_type, template_name)
+
+        sink = _ZipStream()
+        manifest = {'artifacts': [], 'prepare_ms': round(prepare_ms, 2)}
+        with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for future in as_completed(futures):
+                format_type, template_name = futures[future]
+                filename = f"{base_name}_{template_name}{extensions[format_type]}"
+                entry = {'file': filename, 'format': format_type, 'template': template_name}
+                try:
+                    content, content_type, render_ms = future.result()
+                    archive.writestr(filename, content)
+                    entry.update({
+                        'content_type': content_type,
+                        'bytes': len(content),
+                        'render_ms': round(render_ms, 2),
+                    })
+                except Exception as e:
+                    entry['error'] = str(e)
+                entry['completed_ms'] = round((time.perf_counter() - bundle_start) * 1000, 2)
+                manifest['artifacts'].append(entry)
+                yield sink.drain()
+
+            manifest['total_ms'] = round((time.perf_counter() - bundle_start) * 1000, 2)
+            archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+        yield sink.drain()
@@ -0,0 +1,128 @@
+"""
+Structured resume document model
+Templates compile a profile into these typed, slotted objects once; every exporter
+(TXT, PDF, HTML, DOCX) renders from the model instead of re-parsing template text
+"""
+
+SECTION_DIVIDER = '─' * 70
+
+
+class Link:
+    """Labelled profile link (LinkedIn, GitHub, ...) with a normalized absolute URL"""
+    __slots__ = ('label', 'url', 'display')
+
+    def __init__(self, label, url, display=None):
+        self.label = label
+        self.url = url
+        self.display = display or url
+
+    @staticmethod
+    def absolute(url):
+        """Prefix scheme-less URLs with https:// so they work as hyperlinks"""
+        url = url.strip()
+        if not url.startswith('http'):
+            return 'https://' + url
+        return url
+
+
+class TextBlock:
+    """Free text; may span several lines (summary, education, detail lines)"""
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def lines(self):
+        """Non-empty stripped lines of the block"""
+        return [line.strip() for line in self.text.split('\n') if line.strip()]
+
+    def to_text(self):
+        return self.text
+
+
+class Bullet:
+    """Single bullet point; text is stored without the bullet glyph"""
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def to_text(self):
+        return f"• {self.text}"
+
+
+class Entry:
+    """Titled entry (e.g. a project) with its bullet points; title may be None"""
+    __slots__ = ('title', 'bullets')
+
+    def __init__(self, title, bullets=None):
+        self.title = title
+        self.bullets = bullets if bullets is not None else []
+
+    def to_text(self):
+        lines = [f"__TITLE__{self.title}"] if self.title is not None else []
+        lines.extend(bullet.to_text() for bullet in self.bullets)
+        return '\n'.join(lines)
+
+
+class SkillGroup:
+    """Labelled skill list rendered as 'Label: a, b, c'"""
+    __slots__ = ('label', 'items')
+
+    def __init__(self, label, items):
+        self.label = label
+        self.items = items
+
+    def to_text(self):
+        return f"__SKILL_LABEL__{self.label}__/SKILL_LABEL__ {', '.join(self.items)}"
+
+
+class Section:
+    """Resume section: key from RESUME_FORMATS sections_order, titles and content nodes"""
+    __slots__ = ('key', 'title', 'heading', 'items')
+
+    def __init__(self, key, title, heading, items=None):
+        self.key = key
+        self.title = title
+        self.heading = heading
+        self.items = items if items is not None else []
+
+    def to_text(self):
+        body = '\n'.join(item.to_text() for item in self.items)
+        return f"\n{self.title}\n{SECTION_DIVIDER}\n{body}"
+
+
+class ResumeDocument:
+    """Complete resume: header fields plus ordered sections"""
+    __slots__ = ('template', 'name', 'headline', 'phone', 'email', 'links', 'other_links', 'sections')
+
+    def __init__(self, template, name, headline, phone, email, links=None, other_links=None, sections=None):
+        self.template = template
+        self.name = name
+        self.headline = headline
+        self.phone = phone
+        self.email = email
+        self.links = links if links is not None else []
+        self.other_links = other_links if other_links is not None else []
+        self.sections = sections if sections is not None else []
+
+    def contact_parts(self):
+        """Phone (or placeholder), email and link labels in display order"""
+        parts = [self.phone or '[Your Phone]', self.email]
+        parts.extend(link.label for link in self.links)
+        return parts
+
+    def section(self, key):
+        """Return the section with the given key, or None"""
+        for section in self.sections:
+            if section.key == key:
+                return section
+        return None
+
+    def to_text(self):
+        """Plain-text rendering (also the format used as LLM fallback output)"""
+        parts = [f"{self.name.upper()}\n{self.headline}\n{' | '.join(self.contact_parts())}"]
+        if self.other_links:
+            parts.append(f"Additional Links: {' | '.join(self.other_links)}")
+        parts.extend(section.to_text() for section in self.sections)
+        return '\n'.join(parts)
@@ -1,7 +1,8 @@
 from backend.services.resume_templates import ResumeTemplates
 from backend.services.grok_service import generate_resume_with_grok
+from backend.services.hedged_generation import hedged_generate
 
-def generate_resume(user, data):
+def generate_resume(user, data, budget=None):
     """Generate resume using user data and selected template
 
     Args:
@@ -9,9 +10,11 @@ def generate_resume(user, data):
         data: Dictionary containing:
             - template: Template name (default: 'professional')
             - use_ai: Use AI generation (default: True)
+        budget: Seconds to wait for the AI before answering with the template
 
     Returns:
-        Formatted resume string
+        dict: content, source ('ai' or 'template') and upgrade_id (set when the
+        AI resume will be stored for later, see hedged_generation)
     """
     if not user:
         raise ValueError("User data is required to generate resume")
@@ -21,7 +24,7 @@ def generate_resume(user, data):
 
     if use_ai:
         # Use AI to generate optimized resume
-        resume = generate_ai_enhanced_resume(user, data)
+        resume = generate_ai_enhanced_resume(user, data, budget)
     else:
         # Generate resume using template
         template_name = data.get('template', 'professional') if data else 'professional'
@@ -31,27 +34,28 @@ def generate_resume(user, data):
         if template_name not in valid_templates:
             template_name = 'professional'
         
-        resume = ResumeTemplates.generate_from_template(template_name, user, user.profile)
+        resume = {
+            'content': ResumeTemplates.generate_from_template(template_name, user, user.profile),
+            'source': 'template',
+            'upgrade_id': None,
+        }
 
     return resume
 
-def generate_ai_enhanced_resume(user, data):
-    """Generate AI-enhanced resume content using Grok API"""
+def generate_ai_enhanced_resume(user, data, budget=None):
+    """Generate AI-enhanced resume content using Grok API, falling back to the
+    professional template when the AI misses the budget"""
     # Prepare user profile data for Grok
     profile = user.profile if user.profile else None
     
     # Extract and format data from profile
-    skills = profile.skills.split(',') if profile and profile.skills else []
-    skills = [s.strip() for s in skills if s.strip()]
+    skills = list(profile.skills_list) if profile else []
     
-    projects = profile.projects.split('|') if profile and profile.projects else []
-    projects = [p.strip() for p in projects if p.strip()]
+    projects = list(profile.projects_list) if profile else []
     
-    experience = profile.experience.split('|') if profile and profile.experience else []
-    experience = [e.strip() for e in experience if e.strip()]
+    experience = list(profile.experience_list) if profile else []
     
-    education = profile.education.split('|') if profile and profile.education else []
-    education = [e.strip() for e in education if e.strip()]
+    education = list(profile.education_list) if profile else []
     
     profile_data = {
         "name": user.name,
@@ -64,12 +68,10 @@ def generate_ai_enhanced_resume(user, data):
         "education": education
     }
 
-    try:
-        # Use Grok API for professional resume generation
-        resume = generate_resume_with_grok(profile_data)
-        return resume
-
-    except Exception as e:
-        print(f"AI resume generation failed: {e}")
-        # Fallback to template
-        return ResumeTemplates.generate_from_template('professional', user, user.profile)
+    return hedged_generate(
+        'resume',
+        getattr(user, 'id', None),
+        lambda timeout: generate_resume_with_grok(profile_data, timeout),
+        lambda: ResumeTemplates.generate_from_template('professional', user, user.profile),
+        budget
+    )
@@ -3,9 +3,12 @@ AI Resume Optimization Service
 Analyzes resume against job descriptions using NLP techniques
 """
 import re
+import time
 from collections import Counter
-from groq import Groq
 from backend.config import Config
+from backend.services import semantic_matcher
+from backend.services.llm_router import ROUTER
+from backend.services.metrics import record_timing
 
 class ResumeOptimizer:
     """Resume optimization using TF-IDF and Cosine Similarity"""
@@ -57,6 +60,22 @@ class ResumeOptimizer:
         top_keywords = [word for word, _ in freq.most_common(num_keywords)]
         return top_keywords
     
+    @staticmethod
+    def profile_resume_text(user):
+        """Resume text analyzed when the client sends none: one line per profile section"""
+        profile = user.profile
+        if not profile:
+            return ''
+        resume_parts = [
+            f"Name: {user.name}",
+            f"Headline: {profile.headline or ''}",
+            f"Summary: {profile.summary or ''}",
+            f"Skills: {profile.skills or ''}",
+            f"Projects: {profile.projects or ''}",
+            f"Education: {profile.education or ''}"
+        ]
+        return '\n'.join([part for part in resume_parts if part])
+    
     @staticmethod
     def calculate_match_score(resume_text, job_description_text):
         """
@@ -68,7 +87,11 @@ class ResumeOptimizer:
             
         Returns:
             Dictionary containing:
-            - match_score: Percentage match (0-100)
+            - match_score: Percentage match (0-100), keyword and semantic scores blended
+            - keyword_score: Keyword-overlap component (0-100)
+            - semantic_score: Semantic component (0-100, None without NumPy)
+            - related_keywords: Missing keywords with a close variant in the resume
+            - semantic_ms: Time spent on the semantic component
             - missing_keywords: Skills in JD but not in resume
             - overlapping_keywords: Skills in both
             - suggestions: Improvement recommendations
@@ -111,6 +134,19 @@ class ResumeOptimizer:
         # Weighted match score
         match_score = int(0.4 * match_score_base + 0.6 * keyword_score)
         match_score = min(100, max(0, match_score))
+        keyword_match_score = match_score
+        
+        # Semantic component: credits paraphrases and variants ("Postgres" vs "PostgreSQL")
+        start = time.perf_counter()
+        resume_words = {word for word in resume_clean.split()
+                        if word not in ResumeOptimizer.STOP_WORDS and len(word) > 2}
+        semantic = semantic_matcher.semantic_match(resume_text, job_description_text, missing, resume_words)
+        semantic_seconds = time.perf_counter() - start
+        if semantic is not None:
+            record_timing('semantic_match', semantic_seconds)
+            weight = Config.SEMANTIC_WEIGHT
+            match_score = int(round((1 - weight) * keyword_match_score + weight * semantic['semantic_score']))
+            match_score = min(100, max(0, match_score))
         
         # Generate suggestions
         suggestions = ResumeOptimizer.generate_suggestions(
@@ -122,6 +158,10 @@ class ResumeOptimizer:
         
         return {
             'match_score': match_score,
+            'keyword_score': keyword_match_score,
+            'semantic_score': semantic['semantic_score'] if semantic else None,
+            'related_keywords': semantic['related_keywords'] if semantic else {},
+            'semantic_ms': round(semantic_seconds * 1000, 2),
             'missing_keywords': sorted(list(missing))[:10],  # Top 10 missing
             'overlapping_keywords': sorted(list(overlapping))[:10],  # Top 10 overlapping
             'suggestions': suggestions
@@ -187,10 +227,10 @@ class ResumeOptimizer:
     
     @staticmethod
     def generate_ai_suggestion(resume_text, jd_text, missing_keywords, found_keywords):
-        """Generate AI-powered suggestion using Groq"""
+        """Generate AI-powered suggestion through the LLM router (standard tier)"""
+        if not ROUTER.available('suggestion'):
+            return None  # no key: skip the doomed API round trip
         try:
-            client = Groq(api_key=Config.GROQ_API_KEY)
-            
             prompt = f"""
             Based on this job description and resume, provide one specific, actionable suggestion to improve the resume's match.
 
@@ -206,16 +246,7 @@ class ResumeOptimizer:
             Give a concise, professional suggestion (1-2 sentences) on how to improve the resume.
             """
             
-            response = client.chat.completions.create(
-                model="llama3-8b-8192",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=150,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
+            return ROUTER.complete('suggestion', prompt, timeout=30).strip()
             
         except Exception as e:
             print(f"AI suggestion generation failed: {e}")
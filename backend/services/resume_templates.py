@@ -4,8 +4,10 @@ Integrates AIResumeEnhancer for professional content generation and MS Word comp
 """
 try:
     from .ai_resume_enhancer import AIResumeEnhancer
+    from .backend_registry import FORMAT_BACKENDS
 except ImportError:
     from ai_resume_enhancer import AIResumeEnhancer
+    from backend_registry import FORMAT_BACKENDS
 
 
 class ResumeTemplates:
@@ -25,8 +27,11 @@ class ResumeTemplates:
         Format: Calibri 11pt, 1.15 spacing, centered margins
         Optimized for: Corporate, Finance, Business roles
         Section Order: Summary → Experience → Skills → Education → Projects
+
+        Returns:
+            ResumeDocument: Compiled document model (render with .to_text() or an exporter)
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('professional', user, profile)
+        return AIResumeEnhancer.build_resume_document('professional', user, profile)
     
     @staticmethod
     def modern(user, profile):
@@ -36,7 +41,7 @@ class ResumeTemplates:
         Optimized for: Creative, Marketing, Tech roles
         Section Order: Summary → Skills → Experience → Projects → Education
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('modern', user, profile)
+        return AIResumeEnhancer.build_resume_document('modern', user, profile)
     
     @staticmethod
     def simple(user, profile):
@@ -46,7 +51,7 @@ class ResumeTemplates:
         Optimized for: All industries (maximum ATS compatibility)
         Section Order: Summary → Experience → Education → Skills → Projects
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('simple', user, profile)
+        return AIResumeEnhancer.build_resume_document('simple', user, profile)
     
     @staticmethod
     def technical(user, profile):
@@ -56,7 +61,7 @@ class ResumeTemplates:
         Optimized for: Software Development, Engineering, Tech roles
         Section Order: Summary → SKILLS FIRST → Experience → Projects → Education
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('technical', user, profile)
+        return AIResumeEnhancer.build_resume_document('technical', user, profile)
     
     @staticmethod
     def academic(user, profile):
@@ -66,7 +71,7 @@ class ResumeTemplates:
         Optimized for: Academic, Research, Education roles
         Section Order: EDUCATION FIRST → Experience → Projects → Skills → Summary
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('academic', user, profile)
+        return AIResumeEnhancer.build_resume_document('academic', user, profile)
     
     @staticmethod
     def detailed(user, profile):
@@ -76,7 +81,7 @@ class ResumeTemplates:
         Optimized for: Executive, Senior roles, detailed accomplishments
         Section Order: Summary → Experience → Skills → Projects → Education
         """
-        return AIResumeEnhancer.format_resume_ms_word_standard('detailed', user, profile)
+        return AIResumeEnhancer.build_resume_document('detailed', user, profile)
     
     @staticmethod
     def get_all_templates():
@@ -100,6 +105,21 @@ class ResumeTemplates:
         
         return template_dict
     
+    @staticmethod
+    def generate_document(template_name, user, profile):
+        """Compile a profile into the structured ResumeDocument for a template
+        
+        Args:
+            template_name: Name of the template to use (unknown names use 'professional')
+            user: User object with name and email
+            profile: Profile object with all fields
+            
+        Returns:
+            ResumeDocument: Sections, entries, bullets and links shared by every exporter
+        """
+        template_func = _TEMPLATE_DISPATCH.get(template_name.lower(), ResumeTemplates.professional)
+        return template_func(user, profile)
+    
     @staticmethod
     def generate_from_template(template_name, user, profile):
         """Generate resume from specified template with AI enhancement
@@ -120,20 +140,10 @@ class ResumeTemplates:
         Returns:
             str: Generated resume string with AI enhancements
         """
-        templates = {
-            'professional': ResumeTemplates.professional,
-            'modern': ResumeTemplates.modern,
-            'simple': ResumeTemplates.simple,
-            'technical': ResumeTemplates.technical,
-            'academic': ResumeTemplates.academic,
-            'detailed': ResumeTemplates.detailed
-        }
-        
-        template_func = templates.get(template_name.lower(), ResumeTemplates.professional)
-        return template_func(user, profile)
+        return ResumeTemplates.generate_document(template_name, user, profile).to_text()
     
     @staticmethod
-    def export_as_docx(template_name, user, profile, output_path):
+    def export_as_docx(template_name, user, profile, output, backend=None, document=None):
         """Export resume as MS Word (.docx) file with professional formatting
         
         Generates professionally formatted Word documents with:
@@ -146,16 +156,27 @@ class ResumeTemplates:
             template_name: Template to use
             user: User object with name and email
             profile: Profile object with all content
-            output_path: Path where .docx file will be saved
+            output: Path where .docx file will be saved, or a writable binary
+                stream such as ``io.BytesIO`` to render fully in memory
+            backend: 'python-docx' or 'ooxml' (direct XML writer); defaults to
+                Config.DOCX_BACKEND
+            document: Prebuilt ResumeDocument; compiled from the profile if omitted
             
         Returns:
             bool: True if export successful, False otherwise
         """
-        return AIResumeEnhancer.generate_word_document(
+        if backend is None:
+            from backend.config import Config
+            backend = Config.DOCX_BACKEND
+
+        # Both writers are imported (and python-docx loaded) on first use
+        writer = FORMAT_BACKENDS.get('ooxml' if backend == 'ooxml' else 'python-docx')
+        return writer.generate_word_document(
             template_name.lower(),
             user,
             profile,
-            output_path
+            output,
+            document
         )
     
     @staticmethod
@@ -207,6 +228,12 @@ class ResumeTemplates:
         return AIResumeEnhancer.categorize_skills(skills_str)
 
 
+# Template name -> ResumeTemplates method, built once instead of per call
+_TEMPLATE_DISPATCH = {
+    name: getattr(ResumeTemplates, name) for name in AIResumeEnhancer.RESUME_FORMATS
+}
+
+
 def get_template_icon(template_id):
     """Get emoji icon for template"""
     icons = {
@@ -86,13 +86,13 @@ class ResumeTemplates:
         return template_func(user, profile)
     
     @staticmethod
-    def export_as_docx(template_name, user, profile, output_path):
-        """Export resume as MS Word (.docx) file with proper formatting"""
+    def export_as_docx(template_name, user, profile, output):
+        """Export resume as MS Word (.docx) file to a path or writable stream"""
         return AIResumeEnhancer.generate_word_document(
             template_name.lower(),
             user,
             profile,
-            output_path
+            output
         )
     
     @staticmethod
@@ -0,0 +1,232 @@
+"""
+Semantic resume/job-description similarity on the CPU
+Texts are embedded with feature hashing: every word and its character 3-5
+grams (plus a small table of domain concepts) are hashed into a fixed-size
+signed vector. "Postgres" and "PostgreSQL" share most of their n-grams, and
+"REST APIs" and "backend services" share a concept, so both pairs score
+without a trained model, a download or a GPU
+
+Vectors are cached by content hash, one per resume section and one per job
+description sentence; all pairs are then compared in a single matrix product.
+NumPy is imported on first use through the backend registry, never at worker
+start-up. It is listed in requirements.txt; if it is missing anyway the
+analysis falls back to keywords only and a warning is printed once
+"""
+import hashlib
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+from backend.config import Config
+from backend.services.backend_registry import NUMERIC_LIBS
+from backend.services.metrics import REGISTRY
+
+_WORD = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+_SENTENCE = re.compile(r'(?<=[.!?;])\s+|\n+|\s+[-*•]\s+')
+
+# Words that mean the same thing in resumes and job ads but share no n-grams
+CONCEPTS = {
+    'backend': ('backend', 'server', 'api', 'apis', 'rest', 'restful', 'microservice',
+                'microservices', 'services', 'endpoints', 'grpc'),
+    'frontend': ('frontend', 'react', 'vue', 'angular', 'ui', 'javascript', 'typescript', 'css'),
+    'database': ('database', 'databases', 'sql', 'postgres', 'postgresql', 'mysql', 'sqlite', 'mongodb',
+                 'redis', 'nosql', 'rdbms'),
+    'cloud': ('cloud', 'aws', 'gcp', 'azure', 'kubernetes', 'k8s', 'docker', 'containers', 'terraform'),
+    'delivery': ('ci', 'cd', 'pipeline', 'pipelines', 'deployment', 'deploy', 'devops', 'jenkins'),
+    'data': ('etl', 'data', 'analytics', 'spark', 'airflow', 'warehouse', 'pandas', 'bigquery'),
+    'ml': ('ml', 'machine', 'learning', 'ai', 'model', 'models', 'pytorch', 'tensorflow', 'nlp'),
+    'leadership': ('led', 'lead', 'leadership', 'managed', 'mentored', 'mentoring', 'owner', 'ownership'),
+    'testing': ('testing', 'tests', 'tdd', 'pytest', 'qa', 'unit', 'integration'),
+    'scale': ('scale', 'scalable', 'scalability', 'performance', 'latency', 'throughput'),
+}
+_CONCEPT_OF = {word: concept for concept, words in CONCEPTS.items() for word in words}
+
+# Function words carry no meaning and would make every pair of sentences look alike
+_STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'of', 'on', 'or', 'our', 'that', 'the', 'this', 'to', 'was', 'we', 'were', 'will', 'with', 'you', 'your',
+))
+
+# Relative weights of the feature kinds in a text vector
+_WORD_WEIGHT = 1.0
+_NGRAM_WEIGHT = 0.35
+_CONCEPT_WEIGHT = 0.8
+
+
+_NUMPY = {'checked': False, 'module': None}
+
+
+def _numpy():
+    """The numpy module, imported on first call (None if it is not installed)"""
+    if not _NUMPY['checked']:
+        try:
+            _NUMPY['module'] = NUMERIC_LIBS.get('numpy')
+        except ImportError:
+            print("NumPy is not installed; resume analysis falls back to keyword matching only")
+        _NUMPY['checked'] = True
+    return _NUMPY['module']
+
+
+def available():
+    """True when the semantic component is enabled and NumPy is installed"""
+    return Config.SEMANTIC_MATCH_ENABLED and _numpy() is not None
+
+
+def split_sentences(text):
+    """Job description sentences and bullet points worth embedding"""
+    parts = (part.strip(' \t-*•') for part in _SENTENCE.split(text or ''))
+    return [part for part in parts if len(_WORD.findall(part.lower())) >= 2]
+
+
+def split_sections(text):
+    """Resume sections: one per non-empty line ("Skills: ...", a bullet, ...)"""
+    return [line.strip() for line in (text or '').splitlines() if _WORD.search(line.lower())]
+
+
+def _features(text):
+    """Hashable features of a text: words, their character n-grams and concepts"""
+    features = []
+    for word in _WORD.findall(text.lower()):
+        if word in _STOP_WORDS:
+            continue
+        features.append(('w:' + word, _WORD_WEIGHT))
+        padded = f'<{word}>'
+        for n in (3, 4, 5):
+            for i in range(len(padded) - n + 1):
+                features.append(('g:' + padded[i:i + n], _NGRAM_WEIGHT))
+        concept = _CONCEPT_OF.get(word)
+        if concept:
+            features.append(('c:' + concept, _CONCEPT_WEIGHT))
+    return features
+
+
+class HashedEmbedder:
+    """Feature-hashing text embedder with an LRU cache keyed by content hash"""
+
+    def __init__(self, dim=None, cache_size=None):
+        self.dim = dim or Config.SEMANTIC_DIM
+        self.cache_size = cache_size or Config.SEMANTIC_CACHE_SIZE
+        self._cache = OrderedDict()  # blake2b(text) -> unit vector
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, text):
+        np = _numpy()
+        features = _features(text)
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if not features:
+            return vector
+        indices = np.empty(len(features), dtype=np.int64)
+        weights = np.empty(len(features), dtype=np.float32)
+        for i, (feature, weight) in enumerate(features):
+            h = zlib.crc32(feature.encode('utf-8'))
+            indices[i] = h % self.dim
+            # Signed hashing: collisions cancel out instead of piling up
+            weights[i] = weight if (h >> 31) & 1 else -weight
+        vector += np.bincount(indices, weights=weights, minlength=self.dim).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed(self, text):
+        """Unit-length vector for text (cached)"""
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return vector
+            self.misses += 1
+        vector = self._embed(text)
+        with self._lock:
+            self._cache[key] = vector
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def embed_many(self, texts):
+        """Matrix with one unit row per text"""
+        np = _numpy()
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(text) for text in texts])
+
+
+_EMBEDDER = None
+_EMBEDDER_LOCK = threading.Lock()
+
+
+def get_embedder():
+    """Process-wide embedder (its cache is shared by all requests)"""
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        with _EMBEDDER_LOCK:
+            if _EMBEDDER is None:
+                _EMBEDDER = HashedEmbedder()
+    return _EMBEDDER
+
+
+def semantic_match(resume_text, job_description_text, missing_keywords=(), resume_words=(), embedder=None):
+    """Semantic coverage of the job description by the resume
+
+    Every JD sentence is compared with every resume section (one matrix
+    product); a sentence counts as covered by its best-matching section.
+
+    Args:
+        resume_text: Resume text (one section per line)
+        job_description_text: Job description text
+        missing_keywords: JD keywords absent from the resume, checked for close variants
+        resume_words: Resume words the variants are looked up in
+        embedder: HashedEmbedder to use (default: the shared, cached one)
+
+    Returns:
+        dict: semantic_score (0-100), related_keywords ({missing keyword: resume word})
+        and covered_sentences/total_sentences, or None when NumPy is unavailable
+    """
+    if not available():
+        return None
+    np = _numpy()
+    embedder = embedder or get_embedder()
+    sentences = split_sentences(job_description_text)
+    sections = split_sections(resume_text)
+    if not sentences or not sections:
+        return {'semantic_score': 0, 'related_keywords': {}, 'covered_sentences': 0,
+                'total_sentences': len(sentences)}
+
+    similarity = embedder.embed_many(sentences) @ embedder.embed_many(sections).T
+    best = np.clip(similarity.max(axis=1), 0.0, 1.0)
+    # Hashed vectors of unrelated text sit near 0 and paraphrases around 0.5,
+    # so stretch [floor, ceiling] onto 0-100
+    floor, ceiling = Config.SEMANTIC_FLOOR, Config.SEMANTIC_CEILING
+    coverage = np.clip((best - floor) / (ceiling - floor), 0.0, 1.0)
+
+    related = {}
+    missing = sorted(missing_keywords)
+    # Variants share their first letters (postgres/postgresql, deploy/deployment);
+    # comparing only those keeps the matrix small on long resumes
+    prefixes = {keyword[:2] for keyword in missing}
+    found = sorted(word for word in resume_words if word[:2] in prefixes)
+    if missing and found:
+        keyword_similarity = embedder.embed_many(missing) @ embedder.embed_many(found).T
+        for i, j in enumerate(keyword_similarity.argmax(axis=1)):
+            if missing[i] != found[j] and keyword_similarity[i, j] >= Config.SEMANTIC_KEYWORD_THRESHOLD:
+                related[missing[i]] = found[j]
+
+    return {
+        'semantic_score': int(round(float(coverage.mean()) * 100)),
+        'related_keywords': related,
+        'covered_sentences': int((best >= ceiling).sum()),
+        'total_sentences': len(sentences),
+    }
+
+
+def _cache_lookups():
+    if _EMBEDDER is None:
+        return {}
+    return {('hit',): _EMBEDDER.hits, ('miss',): _EMBEDDER.misses}
+
+
+REGISTRY.gauge('resume_semantic_cache_lookups', 'Embedding cache lookups since start by result',
+               ('result',), callback=_cache_lookups)
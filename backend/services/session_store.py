@@ -0,0 +1,151 @@
+"""
+Server-side sessions
+The session cookie carries only a random opaque id; session data lives in the
+shared SQLite database. Data is loaded on first access, so requests that never
+touch the session (static files, public endpoints) cost no database round trip
+"""
+import random
+import secrets
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+
+from backend.services.database import get_database
+from backend.services.metrics import timed
+
+_SERIALIZER = TaggedJSONSerializer()
+
+# Fraction of session writes that also purge expired rows
+_PURGE_PROBABILITY = 0.01
+
+
+class ServerSideSession(SessionMixin):
+    """Session dictionary loaded lazily from the store by its id"""
+
+    def __init__(self, sid=None, loader=None):
+        self.sid = sid
+        self._loader = loader
+        self._data = None if loader else {}
+        self.modified = False
+        self.accessed = False
+        self.rotate = False
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    @property
+    def data(self):
+        self.accessed = True
+        if self._data is None:
+            self._data = self._loader(self.sid) or {}
+            if not self._data:
+                self.sid = None  # unknown or expired id: start a fresh session
+        return self._data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __setitem__(self, key, value):
+        self.data[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self.data[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def clear(self):
+        """Empty the session; the next save issues a new id (prevents session fixation)"""
+        self.data.clear()
+        self.modified = True
+        self.rotate = True
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Stores session data in the database under an opaque cookie id"""
+
+    @staticmethod
+    def _load(sid):
+        with timed('session_load'):
+            with get_database().connection() as conn:
+                row = conn.execute(
+                    'SELECT data FROM sessions WHERE id = ? AND expires > ?', (sid, time.time())
+                ).fetchone()
+            if row is None:
+                return None
+            return _SERIALIZER.loads(row['data'])
+
+    @staticmethod
+    def _store(sid, data, expires):
+        with get_database().connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO sessions (id, data, expires) VALUES (?, ?, ?)',
+                (sid, _SERIALIZER.dumps(data), expires)
+            )
+            if random.random() < _PURGE_PROBABILITY:
+                conn.execute('DELETE FROM sessions WHERE expires <= ?', (time.time(),))
+
+    @staticmethod
+    def _delete(sid):
+        with get_database().connection() as conn:
+            conn.execute('DELETE FROM sessions WHERE id = ?', (sid,))
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid:
+            return ServerSideSession()
+        return ServerSideSession(sid, ServerSideSessionInterface._load)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        # Never touched during this request: nothing to load or write
+        if not session.loaded:
+            return
+
+        if session.rotate and session.sid:
+            ServerSideSessionInterface._delete(session.sid)
+            session.sid = None
+
+        if not session:
+            if session.modified and session.sid:
+                ServerSideSessionInterface._delete(session.sid)
+            if session.modified:
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+            return
+
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+            session.modified = True
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        lifetime = app.permanent_session_lifetime.total_seconds()
+        ServerSideSessionInterface._store(session.sid, dict(session), time.time() + lifetime)
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
@@ -0,0 +1,212 @@
+"""
+Manifest-driven static file serving for the frontend build
+The build directory is scanned once at startup into an in-memory manifest:
+content, strong ETag and content type for every file, plus the .gz/.br
+variants the build ships. Missing gzip/brotli variants are compressed on the
+first request that asks for them and kept. Source maps are not served.
+Requests are answered from the manifest without touching the disk
+
+Precompress a build (run by build.sh after npm run build):
+    python -m backend.services.static_assets frontend/build
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+import threading
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Build tools put a content hash in the filename (main.3f2a9c1e.js,
+# main.3f2a9c1e.chunk.css); such files never change and can be cached forever
+_HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.(chunk\.)?[A-Za-z0-9]+$')
+
+# Source maps expose the original sources and are large; they are neither held
+# in memory nor served
+_SKIPPED_SUFFIXES = ('.map',)
+
+_COMPRESSIBLE_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'application/xml',
+    'image/svg+xml', 'application/manifest+json'
+)
+
+
+class StaticAsset:
+    """One file of the build: identity bytes plus lazily compressed variants"""
+    __slots__ = ('content_type', 'etag', 'cache_control', 'encodings', 'variants', 'lock')
+
+    def __init__(self, content_type, etag, cache_control, encodings, variants):
+        self.content_type = content_type
+        self.etag = etag
+        self.cache_control = cache_control
+        self.encodings = encodings
+        self.variants = variants
+        self.lock = threading.Lock()
+
+    def variant(self, encoding):
+        """Bytes for encoding, compressing on first use; None if it saves nothing
+
+        Args:
+            encoding: 'identity' or one of self.encodings
+
+        Returns:
+            bytes or None
+        """
+        if encoding in self.variants:
+            return self.variants[encoding]
+        with self.lock:
+            if encoding not in self.variants:
+                identity = self.variants['identity']
+                encoded = _compress(identity, encoding)
+                # Keep only variants that actually save bytes
+                self.variants[encoding] = encoded if len(encoded) < len(identity) else None
+        return self.variants[encoding]
+
+
+def _compress(content, encoding):
+    """gzip (level 9, fixed mtime) or brotli (quality 11) encoding of content"""
+    if encoding == 'br':
+        return brotli.compress(content, quality=11)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+class StaticManifest:
+    """In-memory index of a static directory with content negotiation"""
+
+    IMMUTABLE = 'public, max-age=31536000, immutable'
+    REVALIDATE = 'no-cache'
+    MIN_COMPRESS_BYTES = 512
+
+    def __init__(self, root, index='index.html'):
+        self.root = root
+        self.index = index
+        self.assets = {}
+        self.scan()
+
+    def scan(self):
+        """(Re)build the manifest from the files under root"""
+        assets = {}
+        if os.path.isdir(self.root):
+            for directory, _, filenames in os.walk(self.root):
+                for filename in filenames:
+                    if filename.endswith(('.gz', '.br')):
+                        continue  # picked up as variants of their source file
+                    if filename.endswith(_SKIPPED_SUFFIXES):
+                        continue
+                    full_path = os.path.join(directory, filename)
+                    relative = os.path.relpath(full_path, self.root).replace(os.sep, '/')
+                    assets[relative] = StaticManifest._load(full_path, relative)
+        self.assets = assets
+        return self
+
+    @staticmethod
+    def _load(full_path, relative):
+        with open(full_path, 'rb') as f:
+            content = f.read()
+
+        content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/javascript':
+            content_type += '; charset=utf-8'
+
+        variants = {'identity': content}
+        encodings = ()
+        if len(content) >= StaticManifest.MIN_COMPRESS_BYTES and content_type.startswith(_COMPRESSIBLE_TYPES):
+            for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+                encoded = StaticManifest._precompressed(full_path + suffix)
+                if encoded is not None:
+                    variants[encoding] = encoded if len(encoded) < len(content) else None
+                    encodings += (encoding,)
+                elif encoding == 'gzip' or brotli is not None:
+                    encodings += (encoding,)
+
+        name = relative.rsplit('/', 1)[-1]
+        cache_control = StaticManifest.IMMUTABLE if _HASHED_NAME.search(name) else StaticManifest.REVALIDATE
+        etag = hashlib.sha256(content).hexdigest()[:20]
+        return StaticAsset(content_type, etag, cache_control, encodings, variants)
+
+    @staticmethod
+    def _precompressed(path):
+        """Variant shipped by the build next to the source file, if any"""
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+        return None
+
+    def lookup(self, path):
+        """Return the asset for path, falling back to index.html for client-side routes"""
+        path = path.lstrip('/')
+        asset = self.assets.get(path)
+        if asset is None and not path.endswith(_SKIPPED_SUFFIXES):
+            asset = self.assets.get(self.index)
+        return asset
+
+    def respond(self, request, path):
+        """Build the response for path, honouring Accept-Encoding and If-None-Match
+
+        Args:
+            request: Current Flask request
+            path: Path relative to the build root
+
+        Returns:
+            Response: 200 with the best encoding, 304, or 404 when nothing matches
+        """
+        asset = self.lookup(path)
+        if asset is None:
+            return Response('Not Found', status=404, mimetype='text/plain')
+
+        encoding = 'identity'
+        body = None
+        accept = request.accept_encodings
+        for candidate in asset.encodings:
+            if accept[candidate] > 0:
+                body = asset.variant(candidate)
+                if body is not None:
+                    encoding = candidate
+                    break
+
+        # Strong ETag per representation: compressed bytes differ from identity
+        etag = asset.etag if encoding == 'identity' else f'{asset.etag}-{encoding}'
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body if body is not None else asset.variants['identity'],
+                                content_type=asset.content_type)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = asset.cache_control
+        if asset.encodings:
+            response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+    def precompress(self):
+        """Write .gz (and .br with brotli installed) next to every compressible file
+
+        Returns:
+            int: Number of variant files written
+        """
+        written = 0
+        for relative, asset in self.assets.items():
+            full_path = os.path.join(self.root, relative)
+            for encoding in asset.encodings:
+                suffix = '.br' if encoding == 'br' else '.gz'
+                if os.path.exists(full_path + suffix):
+                    continue
+                encoded = asset.variant(encoding)
+                if encoded is not None:
+                    with open(full_path + suffix, 'wb') as f:
+                        f.write(encoded)
+                    written += 1
+        return written
+
+
+if __name__ == '__main__':
+    root = sys.argv[1] if len(sys.argv) > 1 else os.path.join('frontend', 'build')
+    print(f"Precompressed {StaticManifest(root).precompress()} variants under {root}")
@@ -0,0 +1,68 @@
+"""
+User repository backed by SQLite
+Users live in the shared SQLite database (see database.py) so every gunicorn
+worker sees the same accounts and they survive restarts. Lookups go through the
+primary key or the unique email index
+"""
+import sqlite3
+import time
+
+from backend.services.database import get_database
+
+_USER_COLUMNS = 'id, name, email, password_hash'
+
+
+class UserRepository:
+    """Thread-safe user store with primary-key and email lookups"""
+
+    def __init__(self, database):
+        self.database = database
+
+    @staticmethod
+    def _row(row):
+        return dict(row) if row is not None else None
+
+    def create_user(self, name, email, password_hash):
+        """Insert a user; ids are assigned by SQLite so concurrent registrations never collide
+
+        Returns:
+            dict: The new user (id, name, email, password_hash), or None if the
+                email is already registered
+        """
+        with self.database.connection() as conn:
+            try:
+                cursor = conn.execute(
+                    'INSERT INTO users (name, email, password_hash, created_at) VALUES (?, ?, ?, ?)',
+                    (name, email, password_hash, time.time())
+                )
+            except sqlite3.IntegrityError:
+                return None
+        return {'id': cursor.lastrowid, 'name': name, 'email': email, 'password_hash': password_hash}
+
+    def get_by_id(self, user_id):
+        """Return the user with this id, or None"""
+        with self.database.connection() as conn:
+            row = conn.execute(f'SELECT {_USER_COLUMNS} FROM users WHERE id = ?', (user_id,)).fetchone()
+        return self._row(row)
+
+    def get_by_email(self, email):
+        """Return the user registered with this email, or None"""
+        with self.database.connection() as conn:
+            row = conn.execute(f'SELECT {_USER_COLUMNS} FROM users WHERE email = ?', (email,)).fetchone()
+        return self._row(row)
+
+    def count(self):
+        with self.database.connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM users').fetchone()[0]
+
+
+_REPOSITORY = None
+
+
+def get_user_repository():
+    """Process-wide repository on the shared database"""
+    global _REPOSITORY
+    database = get_database()
+    if _REPOSITORY is None or _REPOSITORY.database is not database:
+        _REPOSITORY = UserRepository(database)
+    return _REPOSITORY
@@ -0,0 +1,17 @@
+"""
+Shared fixtures: every test that touches storage gets its own SQLite database
+"""
+import pytest
+
+from backend.config import Config
+from backend.services import database as database_module
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Fresh, migrated database that get_database() returns for the test's duration"""
+    monkeypatch.setattr(Config, 'DATABASE_URL', f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(database_module, '_DATABASE', None)
+    db = database_module.get_database()
+    yield db
+    db.close()
@@ -0,0 +1,56 @@
+"""
+The direct OOXML writer must render every template exactly as python-docx does
+"""
+import io
+
+import pytest
+from docx import Document
+
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.profile_snapshot import UserSnapshot
+from backend.services.resume_templates import ResumeTemplates
+from benchmarks.synthetic import make_user
+
+
+def _render(backend, template, user, profile):
+    buffer = io.BytesIO()
+    ResumeTemplates.export_as_docx(template, user, profile, buffer, backend)
+    return buffer.getvalue()
+
+
+def _describe(content):
+    """What a reader sees: page margins plus per-paragraph style, alignment, spacing and runs"""
+    doc = Document(io.BytesIO(content))
+    section = doc.sections[0]
+    layout = (section.top_margin, section.bottom_margin, section.left_margin, section.right_margin)
+    paragraphs = []
+    for p in doc.paragraphs:
+        runs = tuple(
+            (r.text, r.bold, r.font.size, str(r.font.color.rgb) if r.font.color.type else None)
+            for r in p.runs
+        )
+        spacing = (p.paragraph_format.space_after, p.paragraph_format.line_spacing)
+        paragraphs.append((p.style.name, p.alignment, spacing, runs))
+    return layout, paragraphs
+
+
+@pytest.mark.parametrize('size', ['sparse', 'typical'])
+@pytest.mark.parametrize('template', list(AIResumeEnhancer.RESUME_FORMATS))
+def test_ooxml_matches_python_docx(template, size):
+    user, profile = make_user(size)
+    expected = _describe(_render('python-docx', template, user, profile))
+    actual = _describe(_render('ooxml', template, user, profile))
+    assert actual == expected
+
+
+@pytest.mark.parametrize('char', ['\x00', '\x01', '\x0b', '\x1f'])
+def test_ooxml_rejects_control_characters_like_python_docx(char):
+    user, profile = make_user('sparse')
+    profile = profile.replace(summary=f'Backend{char}engineer')
+    user = UserSnapshot(user.id, user.name, user.email, profile)
+
+    with pytest.raises(ValueError) as expected:
+        _render('python-docx', 'professional', user, profile)
+    with pytest.raises(ValueError) as actual:
+        _render('ooxml', 'professional', user, profile)
+    assert str(actual.value) == str(expected.value)
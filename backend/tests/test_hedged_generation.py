@@ -0,0 +1,98 @@
+"""
+Hedged AI generation: template fallback past the budget, upgrades stored for later
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.config import Config
+from backend.services.hedged_generation import (UpgradeStore, hedged_generate, hedged_generate_async,
+                                                request_budget)
+
+
+@pytest.fixture(autouse=True)
+def no_reserve(monkeypatch):
+    monkeypatch.setattr(Config, 'GENERATION_FALLBACK_RESERVE_MS', 0.0)
+
+
+def _wait_for_upgrade(upgrade_id, user_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        upgrade = UpgradeStore.get(upgrade_id, user_id)
+        if upgrade['status'] != 'pending' or time.monotonic() > deadline:
+            return upgrade
+        time.sleep(0.01)
+
+
+def test_fast_llm_answer_is_returned(database):
+    result = hedged_generate('resume', 1, lambda timeout: 'AI text', lambda: 'template text', budget=2.0)
+
+    assert result == {'content': 'AI text', 'source': 'ai', 'upgrade_id': None}
+
+
+def test_llm_call_gets_the_hard_deadline_as_timeout(database, monkeypatch):
+    monkeypatch.setattr(Config, 'GENERATION_DEADLINE_MS', 5000.0)
+    timeouts = []
+    hedged_generate('resume', 1, lambda timeout: timeouts.append(timeout) or 'AI text', lambda: 'template',
+                    budget=2.0)
+
+    assert 4.0 < timeouts[0] <= 5.0
+
+
+def test_slow_llm_falls_back_and_stores_an_upgrade(database):
+    release = threading.Event()
+
+    def slow_llm(timeout):
+        release.wait(5)
+        return 'AI text'
+
+    start = time.monotonic()
+    result = hedged_generate('resume', 1, slow_llm, lambda: 'template text', budget=0.05)
+    assert time.monotonic() - start < 1.0
+    assert result['source'] == 'template' and result['content'] == 'template text'
+    assert UpgradeStore.get(result['upgrade_id'], 1)['status'] == 'pending'
+
+    release.set()
+    upgrade = _wait_for_upgrade(result['upgrade_id'], 1)
+    assert upgrade['status'] == 'ready' and upgrade['content'] == 'AI text'
+    # Upgrades are private to their owner
+    assert UpgradeStore.get(result['upgrade_id'], 2) is None
+
+
+def test_llm_error_falls_back_without_an_upgrade(database):
+    def failing_llm(timeout):
+        raise RuntimeError('provider down')
+
+    result = hedged_generate('resume', 1, failing_llm, lambda: 'template text', budget=2.0)
+
+    assert result == {'content': 'template text', 'source': 'template', 'upgrade_id': None}
+
+
+def test_async_slow_llm_falls_back_and_stores_an_upgrade(database):
+    async def slow_llm(timeout):
+        await asyncio.sleep(0.2)
+        return 'AI text'
+
+    async def run_blocking(func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def scenario():
+        result = await hedged_generate_async('cover_letter', 1, slow_llm, lambda: 'template text', 0.02,
+                                             run_blocking)
+        await asyncio.sleep(0.5)
+        return result
+
+    result = asyncio.run(scenario())
+    assert result['source'] == 'template'
+    upgrade = UpgradeStore.get(result['upgrade_id'], 1)
+    assert upgrade['status'] == 'ready' and upgrade['content'] == 'AI text'
+
+
+def test_request_budget_is_capped_by_the_deadline(monkeypatch):
+    monkeypatch.setattr(Config, 'GENERATION_DEADLINE_MS', 3000.0)
+
+    assert request_budget({'latency_budget_ms': 1500}) == 1.5
+    assert request_budget({}, {'X-Latency-Budget-Ms': '99999'}) == 3.0
+    assert request_budget({'latency_budget_ms': 'soon'}) == min(Config.GENERATION_BUDGET_MS, 3000.0) / 1000
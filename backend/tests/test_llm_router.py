@@ -0,0 +1,128 @@
+"""
+LLM router: latency ordering, failover and cooldown of failing routes
+"""
+import asyncio
+
+import pytest
+
+from backend.config import Config
+from backend.services import llm_router
+from backend.services.llm_router import LLMRouter, Route
+
+
+class _Response:
+    def __init__(self, status_code, content=None):
+        self.status_code = status_code
+        self.text = content or 'error'
+        self._content = content
+
+    def json(self):
+        return {'choices': [{'message': {'content': self._content}}]}
+
+
+class _FakeRequests:
+    """Stands in for the requests module: answers per route URL and records the calls"""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def post(self, url, json, headers, timeout):
+        self.calls.append(url)
+        return self.answers[url]
+
+
+class _FakeAsyncClient(_FakeRequests):
+    """Stands in for httpx.AsyncClient"""
+
+    async def post(self, url, json, headers, timeout):
+        return _FakeRequests.post(self, url, json, headers, timeout)
+
+
+@pytest.fixture(autouse=True)
+def router_config(monkeypatch):
+    monkeypatch.setattr(Config, 'LLM_FAILURE_THRESHOLD', 2)
+    monkeypatch.setattr(Config, 'LLM_COOLDOWN_SECONDS', 60)
+    monkeypatch.setattr(Config, 'LLM_ALLOW_DOWNGRADE', False)
+
+
+def _fake_requests(monkeypatch, answers):
+    fake = _FakeRequests(answers)
+    monkeypatch.setattr(llm_router.AI_SDKS, 'get', lambda name: fake)
+    return fake
+
+
+def _route(name, tier='high'):
+    return Route('test', name, f'https://{name}.example/v1', tier, api_key='key')
+
+
+def test_route_cools_down_after_repeated_failures_and_recovers():
+    route = _route('a')
+    route.record(1.0, False, now=100.0)
+    assert route.healthy(100.0)
+
+    route.record(1.0, False, now=100.0)
+    assert not route.healthy(100.0)
+    assert route.healthy(160.0)
+
+    route.record(0.5, True, now=160.0)
+    assert route.consecutive_failures == 0 and route.healthy(160.0)
+
+
+def test_fastest_healthy_route_is_tried_first():
+    slow, fast = _route('slow'), _route('fast')
+    slow.record(2.0, True, now=0)
+    fast.record(0.2, True, now=0)
+
+    assert LLMRouter([slow, fast]).plan('resume') == [fast, slow]
+
+
+def test_failing_route_fails_over_then_moves_behind_healthy_ones(monkeypatch):
+    primary, backup = _route('primary'), _route('backup')
+    primary.latency, backup.latency = 0.1, 0.5
+    fake = _fake_requests(monkeypatch, {primary.url: _Response(500), backup.url: _Response(200, 'from backup')})
+    router = LLMRouter([primary, backup])
+
+    assert router.complete('resume', 'prompt') == 'from backup'
+    assert router.complete('resume', 'prompt') == 'from backup'
+    assert fake.calls == [primary.url, backup.url] * 2
+
+    # Two consecutive failures: primary cools down and is tried last
+    assert router.plan('resume') == [backup, primary]
+    fake.calls.clear()
+    assert router.complete('resume', 'prompt') == 'from backup'
+    assert fake.calls == [backup.url]
+
+
+def test_tasks_only_use_routes_of_their_tier(monkeypatch):
+    high, standard = _route('high'), _route('standard', tier='standard')
+    router = LLMRouter([high, standard])
+
+    assert router.plan('resume') == [high]
+    assert standard in router.plan('suggestion')
+
+    monkeypatch.setattr(Config, 'LLM_ALLOW_DOWNGRADE', True)
+    assert router.plan('resume') == [high, standard]
+
+
+def test_error_when_every_route_fails(monkeypatch):
+    route = _route('only')
+    _fake_requests(monkeypatch, {route.url: _Response(503)})
+
+    with pytest.raises(Exception, match='No LLM route answered'):
+        LLMRouter([route]).complete('resume', 'prompt')
+    assert LLMRouter([]).available('resume') is False
+
+
+def test_async_path_fails_over_and_records_like_the_sync_path():
+    primary, backup = _route('primary'), _route('backup')
+    primary.latency, backup.latency = 0.1, 0.5
+    client = _FakeAsyncClient({primary.url: _Response(500), backup.url: _Response(200, 'from backup')})
+    router = LLMRouter([primary, backup])
+
+    assert asyncio.run(router.complete_async(client, 'resume', 'prompt')) == 'from backup'
+    assert client.calls == [primary.url, backup.url]
+    assert (primary.failures, backup.calls) == (1, 1)
+    decision = router.stats()['decisions'][-1]
+    assert decision['route'] == backup.name
+    assert [attempt['outcome'] for attempt in decision['attempts']] == ['error', 'success']
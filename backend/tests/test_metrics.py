@@ -0,0 +1,31 @@
+"""
+/metrics is private: served only with a configured token
+"""
+import pytest
+from flask import Flask
+
+from backend.config import Config
+from backend.services import metrics
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    metrics.init_app(app)
+    return app.test_client()
+
+
+def test_metrics_not_served_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(Config, 'METRICS_TOKEN', '')
+
+    assert client.get('/metrics').status_code == 404
+
+
+def test_metrics_require_the_bearer_token(client, monkeypatch):
+    monkeypatch.setattr(Config, 'METRICS_TOKEN', 'secret')
+
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    response = client.get('/metrics', headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+    assert 'resume_http_requests_total' in response.text
@@ -0,0 +1,36 @@
+"""
+The canvas PDF writer must produce the same pages and lines as Platypus
+"""
+import io
+
+import pytest
+
+from backend.services import pdf_fonts
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.pdf_canvas_writer import CanvasPDFWriter
+from backend.services.pdf_exporter import PDFExporter
+from benchmarks.synthetic import make_user
+
+pypdf = pytest.importorskip('pypdf')
+
+
+@pytest.fixture(scope='module', autouse=True)
+def fonts():
+    pdf_fonts.load()
+
+
+def _text(content):
+    """Per-page extracted lines, whitespace-normalized (text positioning operators differ)"""
+    return [
+        [' '.join(line.split()) for line in page.extract_text().splitlines()]
+        for page in pypdf.PdfReader(io.BytesIO(content)).pages
+    ]
+
+
+@pytest.mark.parametrize('size', ['sparse', 'typical'])
+@pytest.mark.parametrize('template', list(AIResumeEnhancer.RESUME_FORMATS))
+def test_canvas_matches_platypus(template, size):
+    user, profile = make_user(size)
+    expected = _text(PDFExporter.generate(user, profile, template)[0])
+    actual = _text(CanvasPDFWriter.generate(user, profile, template)[0])
+    assert actual == expected
@@ -0,0 +1,47 @@
+"""
+Multi-page CV mode: the academic template keeps its own type size and spacing
+"""
+import collections
+import io
+import re
+
+import pytest
+
+from backend.config import Config
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.pdf_exporter import PDFExporter
+from benchmarks.synthetic import make_user
+
+pypdf = pytest.importorskip('pypdf')
+
+_TEXT_STATE = re.compile(rb'/F\d+ ([\d.]+) Tf ([\d.]+) TL')
+
+
+def _pages(content):
+    return pypdf.PdfReader(io.BytesIO(content)).pages
+
+
+def test_cv_body_uses_the_template_size_and_spacing():
+    spec = AIResumeEnhancer.RESUME_FORMATS['academic']
+    user, profile = make_user('huge')
+    pages = _pages(PDFExporter.generate(user, profile, 'academic')[0])
+
+    states = collections.Counter()
+    for page in pages:
+        states.update(_TEXT_STATE.findall(page.get_contents().get_data()))
+    (size, leading), _ = states.most_common(1)[0]
+
+    assert len(pages) > 1
+    assert float(size) == spec['size']
+    assert float(leading) == pytest.approx(spec['size'] * spec['spacing'])
+
+
+def test_cv_mode_off_auto_fits_the_template(monkeypatch):
+    user, profile = make_user('typical')
+    cv = PDFExporter.generate(user, profile, 'academic')[0]
+    monkeypatch.setattr(Config, 'PDF_CV_MODE', False)
+    fitted = PDFExporter.generate(user, profile, 'academic')[0]
+
+    assert len(_pages(fitted)) == 1
+    assert 'Page 1' not in _pages(fitted)[0].extract_text()
+    assert 'Page 1' in _pages(cv)[0].extract_text()
@@ -0,0 +1,93 @@
+"""
+Token buckets, the shared SQLite store and weighted fair queueing
+"""
+import threading
+import time
+
+import pytest
+
+from backend.services.rate_limiter import FairQueue, MemoryBuckets, RateLimiter, classify, parse_rate
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.001)
+
+
+def test_parse_rate():
+    assert parse_rate('10/60') == (10.0, 10.0 / 60)
+    with pytest.raises(ValueError):
+        parse_rate('0/60')
+
+
+def test_bucket_allows_a_burst_then_refills_over_time():
+    buckets = MemoryBuckets()
+    capacity, rate = 3.0, 1.0  # 3 requests, one more per second
+
+    assert [buckets.take('u', 1, capacity, rate, now=100.0)[0] for _ in range(4)] == [True, True, True, False]
+    assert buckets.take('u', 1, capacity, rate, now=100.5)[0] is False
+    assert buckets.take('u', 1, capacity, rate, now=101.0)[0] is True
+    # Other users have their own bucket
+    assert buckets.take('v', 1, capacity, rate, now=101.0)[0] is True
+
+
+def test_limiter_reports_retry_after_once_empty():
+    limiter = RateLimiter({'light': '2/10'}, {}, store='memory')
+
+    assert limiter.take('jane', 'light') == 0
+    assert limiter.take('jane', 'light') == 0
+    assert limiter.take('jane', 'light') == pytest.approx(5.0, abs=0.1)
+    assert limiter.take('john', 'light') == 0
+
+
+def test_shared_buckets_are_enforced_across_workers(database):
+    # Two limiters stand in for two gunicorn workers on the same database
+    worker_a = RateLimiter({'render': '3/60'}, {})
+    worker_b = RateLimiter({'render': '3/60'}, {})
+
+    assert worker_a.take('jane', 'render') == 0
+    assert worker_b.take('jane', 'render') == 0
+    assert worker_a.take('jane', 'render') == 0
+    assert worker_b.take('jane', 'render') > 0
+
+
+def test_fair_queue_admits_other_users_ahead_of_a_burst():
+    queue = FairQueue(slots=1)
+    assert queue.acquire('holder')
+
+    admitted = []
+    threads = []
+    for user in ('burst', 'burst', 'burst', 'single'):
+        waiting = queue.waiting
+        thread = threading.Thread(target=lambda u=user: queue.acquire(u) and admitted.append(u))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda: queue.waiting > waiting)
+
+    for expected in range(1, 5):
+        queue.release()
+        _wait_until(lambda: len(admitted) >= expected)
+    for thread in threads:
+        thread.join()
+
+    assert admitted == ['burst', 'single', 'burst', 'burst']
+
+
+def test_fair_queue_times_out_when_slots_stay_busy():
+    queue = FairQueue(slots=1)
+    assert queue.acquire('holder')
+
+    assert queue.acquire('jane', timeout=0.05) is False
+    assert queue.waiting == 0
+    queue.release()
+    assert queue.acquire('jane', timeout=0.05) is True
+
+
+def test_classify():
+    assert classify('ai.analyze_resume_endpoint', {}) == ('llm', 1)
+    assert classify('ai.generate_resume_endpoint', {'format': 'pdf'}) == ('render', 1)
+    assert classify('ai.generate_resume_endpoint', {'format': 'txt'}) == ('light', 1)
+    bundle = {'formats': ['pdf', 'docx'], 'templates': ['professional', 'modern']}
+    assert classify('ai.generate_bundle_endpoint', bundle) == ('render', 4)
@@ -0,0 +1,92 @@
+"""
+SQLite user repository and the version-checked profile cache
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.database import Database, PoolTimeout
+from backend.services.profile_repository import ProfileRepository
+from backend.services.user_repository import UserRepository
+
+
+def test_user_lookups_by_id_and_email(database):
+    users = UserRepository(database)
+    created = users.create_user('Jane Doe', 'jane@example.com', 'hash')
+
+    assert users.get_by_id(created['id']) == created
+    assert users.get_by_email('jane@example.com') == created
+    assert users.get_by_email('nobody@example.com') is None
+
+
+def test_duplicate_email_is_rejected(database):
+    users = UserRepository(database)
+    assert users.create_user('Jane', 'jane@example.com', 'hash') is not None
+    assert users.create_user('Other Jane', 'jane@example.com', 'hash') is None
+    assert users.count() == 1
+
+
+def test_concurrent_registrations_get_unique_ids(database):
+    users = UserRepository(database)
+    with ThreadPoolExecutor(8) as pool:
+        created = list(pool.map(lambda i: users.create_user(f'User {i}', f'u{i}@example.com', 'hash'), range(64)))
+
+    assert len({user['id'] for user in created}) == 64
+    assert users.count() == 64
+
+
+def test_cached_profile_is_reused_while_version_matches(database):
+    profiles = ProfileRepository(database)
+    profiles.save(1, {'summary': 'First'})
+
+    first = profiles.get(1)
+    assert profiles.get(1) is first
+    assert first.summary == 'First' and first.version == 1
+
+
+def test_save_in_another_worker_invalidates_cache(database):
+    # Two repositories on separate connections stand in for two gunicorn workers
+    worker_a = ProfileRepository(database)
+    worker_b = ProfileRepository(Database(database.path))
+
+    worker_a.save(1, {'summary': 'First'})
+    assert worker_b.get(1).summary == 'First'
+
+    worker_a.save(1, {'summary': 'Second'})
+    refreshed = worker_b.get(1)
+    assert refreshed.summary == 'Second'
+    assert refreshed.version == 2
+    worker_b.database.close()
+
+
+def test_cache_is_bounded(database):
+    profiles = ProfileRepository(database, cache_size=2)
+    for user_id in (1, 2, 3):
+        profiles.save(user_id, {'summary': f'User {user_id}'})
+
+    assert profiles.cached() == 2
+    assert profiles.get(1).summary == 'User 1'
+
+
+def test_exhausted_pool_times_out_instead_of_hanging(tmp_path):
+    database = Database(str(tmp_path / 'pool.db'), pool_size=1, pool_timeout=0.05)
+    with database.connection():
+        with pytest.raises(PoolTimeout):
+            with database.connection():
+                pass
+    # The connection went back to the pool and can be borrowed again
+    with database.connection() as conn:
+        assert conn.execute('SELECT 1').fetchone()[0] == 1
+    database.close()
+
+
+def test_close_keeps_borrowed_connections_counted(tmp_path):
+    database = Database(str(tmp_path / 'pool.db'), pool_size=2)
+    with database.connection():
+        with database.connection():
+            pass
+        database.close()  # closes the idle one; the borrowed one still counts
+        assert database.pool_stats()['open'] == 1
+    assert database.pool_stats() == {'open': 1, 'idle': 1, 'size': 2}
+    database.close()
+    assert database.pool_stats()['open'] == 0
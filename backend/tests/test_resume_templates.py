@@ -0,0 +1,27 @@
+"""
+Template rendering accepts any profile-like input, not only snapshots
+"""
+from types import SimpleNamespace
+
+from backend.services.resume_templates import ResumeTemplates
+
+USER = SimpleNamespace(name='Jane Doe', email='jane@example.com')
+PROFILE = {
+    'summary': 'Backend engineer.',
+    'skills': 'Python, SQL',
+    'linkedin': 'linkedin.com/in/jane',
+    'other_links': 'jane.dev\nblog.jane.dev',
+}
+
+
+def test_plain_object_profile():
+    text = ResumeTemplates.generate_from_template('professional', USER, SimpleNamespace(**PROFILE))
+
+    assert 'JANE DOE' in text
+    assert 'Python' in text
+    assert 'jane.dev' in text and 'blog.jane.dev' in text
+
+
+def test_dict_and_missing_profile():
+    assert 'blog.jane.dev' in ResumeTemplates.generate_from_template('professional', USER, PROFILE)
+    assert 'JANE DOE' in ResumeTemplates.generate_from_template('professional', USER, None)
@@ -0,0 +1,86 @@
+"""
+Server-side sessions: the cookie carries only an opaque id, data stays in the database
+"""
+import pytest
+from flask import Flask, session
+
+from backend.services.session_store import ServerSideSessionInterface
+
+
+@pytest.fixture
+def client(database):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.session_interface = ServerSideSessionInterface()
+
+    @app.route('/login/<name>')
+    def login(name):
+        session['user'] = name
+        return 'ok'
+
+    @app.route('/whoami')
+    def whoami():
+        return session.get('user', '')
+
+    @app.route('/switch/<name>')
+    def switch(name):
+        session.clear()
+        session['user'] = name
+        return 'ok'
+
+    @app.route('/logout')
+    def logout():
+        session.clear()
+        return 'ok'
+
+    @app.route('/public')
+    def public():
+        return 'ok'
+
+    return app.test_client()
+
+
+def _stored_ids(database):
+    with database.connection() as conn:
+        return [row['id'] for row in conn.execute('SELECT id FROM sessions')]
+
+
+def test_cookie_carries_only_an_opaque_id(client, database):
+    client.get('/login/jane')
+    cookie = client.get_cookie('session')
+
+    assert 'jane' not in cookie.value
+    assert _stored_ids(database) == [cookie.value]
+    assert client.get('/whoami').text == 'jane'
+
+
+def test_untouched_session_sets_no_cookie_and_stores_nothing(client, database):
+    response = client.get('/public')
+
+    assert 'Set-Cookie' not in response.headers
+    assert _stored_ids(database) == []
+
+
+def test_clear_deletes_the_stored_session(client, database):
+    client.get('/login/jane')
+    client.get('/logout')
+
+    assert _stored_ids(database) == []
+    assert client.get('/whoami').text == ''
+
+
+def test_clear_then_set_rotates_the_id(client, database):
+    client.get('/login/jane')
+    first = client.get_cookie('session').value
+    client.get('/switch/john')
+
+    rotated = client.get_cookie('session').value
+    assert rotated != first
+    assert _stored_ids(database) == [rotated]
+    assert client.get('/whoami').text == 'john'
+
+
+def test_unknown_id_starts_an_empty_session(client, database):
+    client.set_cookie('session', 'forged-or-expired')
+
+    assert client.get('/whoami').text == ''
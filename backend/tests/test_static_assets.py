@@ -0,0 +1,52 @@
+"""
+Static manifest: lazy compression, shipped variants and skipped source maps
+"""
+import gzip
+
+import pytest
+from flask import Flask, request
+
+from backend.services.static_assets import StaticManifest
+
+BUNDLE = b'console.log("resume builder");\n' * 100
+
+
+@pytest.fixture
+def build(tmp_path):
+    (tmp_path / 'index.html').write_bytes(b'<!doctype html><div id="root"></div>')
+    (tmp_path / 'main.3f2a9c1e.js').write_bytes(BUNDLE)
+    (tmp_path / 'main.3f2a9c1e.js.map').write_bytes(b'{"version": 3}' * 100)
+    return tmp_path
+
+
+def _get(manifest, path, encoding):
+    app = Flask(__name__)
+    with app.test_request_context(path, headers={'Accept-Encoding': encoding}):
+        return manifest.respond(request, path)
+
+
+def test_compresses_on_first_request_only(build):
+    manifest = StaticManifest(str(build))
+    asset = manifest.assets['main.3f2a9c1e.js']
+    assert set(asset.variants) == {'identity'}
+
+    response = _get(manifest, 'main.3f2a9c1e.js', 'gzip')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.get_data()) == BUNDLE
+    assert asset.variants['gzip'] is not None
+
+
+def test_source_maps_are_not_loaded_or_served(build):
+    manifest = StaticManifest(str(build))
+
+    assert 'main.3f2a9c1e.js.map' not in manifest.assets
+    assert _get(manifest, 'main.3f2a9c1e.js.map', 'identity').status_code == 404
+    assert _get(manifest, 'profile/edit', 'identity').get_data().startswith(b'<!doctype html>')
+
+
+def test_precompress_writes_variants_the_next_scan_uses(build):
+    assert StaticManifest(str(build)).precompress() >= 1
+    assert (build / 'main.3f2a9c1e.js.gz').exists()
+
+    asset = StaticManifest(str(build)).assets['main.3f2a9c1e.js']
+    assert gzip.decompress(asset.variants['gzip']) == BUNDLE
@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for the resume export pipeline
+
+Run individual scripts from the repository root, e.g.:
+    python -m benchmarks.bench_docx_export
+
+The regression suite (templates, exporters, compressor, optimizer) compares a
+run against benchmarks/baselines/suite.json:
+    python -m benchmarks.suite
+"""
@@ -0,0 +1,237 @@
+"""
+WSGI vs ASGI concurrency at a fixed memory budget
+
+Each deployment mode is first started with a single worker to measure how much
+memory a worker takes. It is then restarted with as many workers as fit in
+--memory-mb and driven with --concurrency clients that keep requesting cover
+letters (LLM-bound) for --duration seconds. The LLM is a local stub
+(benchmarks/llm_stub.py) with --stub-latency-ms latency.
+
+gthread workers can only hold workers x threads LLM calls in flight, while an
+ASGI worker holds one coroutine per waiting request. The report shows
+throughput, latency and the peak memory of the whole server process tree.
+
+Memory is read from /proc, so this benchmark runs on Linux only.
+
+Usage:
+    python -m benchmarks.bench_asgi --memory-mb 512 --concurrency 200 --duration 20
+    python -m benchmarks.bench_asgi --modes wsgi --wsgi-threads 16
+"""
+import argparse
+import asyncio
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+from benchmarks.llm_stub import LLMStub
+from benchmarks.load_test import percentile, wait_until_ready
+
+MODES = {
+    'wsgi': 'gunicorn -w {workers} -k gthread --threads {threads} -b 127.0.0.1:{port} app:app',
+    'asgi': 'uvicorn asgi:app --workers {workers} --host 127.0.0.1 --port {port} --log-level warning',
+}
+
+
+def tree_rss(pid):
+    """Resident memory (bytes) of pid and all its descendants"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    total = 0
+    pending = [pid]
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            pass
+        pending.extend(children.get(current, ()))
+    return total
+
+
+class Server:
+    """One server process tree started with the stub environment"""
+
+    def __init__(self, mode, workers, threads, port, env):
+        command = MODES[mode].format(workers=workers, threads=threads, port=port)
+        self.url = f'http://127.0.0.1:{port}'
+        self.process = subprocess.Popen(shlex.split(command), env=env,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.peak_rss = 0
+        self._sampling = False
+
+    def ready(self):
+        return wait_until_ready(self.url, 60)
+
+    def sample(self):
+        self.peak_rss = max(self.peak_rss, tree_rss(self.process.pid))
+        return self.peak_rss
+
+    def start_sampling(self, interval=0.25):
+        self._sampling = True
+
+        def loop():
+            while self._sampling:
+                self.sample()
+                time.sleep(interval)
+        threading.Thread(target=loop, daemon=True).start()
+
+    def stop(self):
+        self._sampling = False
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+async def _login(url):
+    async with httpx.AsyncClient(base_url=url) as client:
+        credentials = {'name': 'Bench User', 'email': 'bench@example.com', 'password': 'bench-password'}
+        await client.post('/register', data=credentials)
+        response = await client.post('/login', data=credentials)
+        if response.status_code != 302:
+            raise RuntimeError(f"Login failed with HTTP {response.status_code}")
+        await client.post('/profile', data={'headline': 'Engineer', 'skills': 'Python, SQL',
+                                            'summary': 'Backend engineer.'})
+        return dict(client.cookies)
+
+
+async def drive(url, concurrency, duration, timeout):
+    """Keep concurrency clients requesting cover letters for duration seconds
+
+    Returns:
+        dict: completed requests, errors, latencies (ms) and the peak in flight
+    """
+    cookies = await _login(url)
+    latencies = []
+    errors = {}
+    state = {'in_flight': 0, 'peak': 0}
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, cookies=cookies, limits=limits, timeout=timeout) as client:
+        async def user():
+            while time.perf_counter() < deadline:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+                start = time.perf_counter()
+                try:
+                    response = await client.post('/api/ai/generate-cover-letter',
+                                                 json={'job_title': 'Engineer', 'company_name': 'Example'})
+                    error = None if response.status_code == 200 else f'HTTP {response.status_code}'
+                except httpx.HTTPError as e:
+                    error = type(e).__name__
+                state['in_flight'] -= 1
+                if error is None:
+                    latencies.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors[error] = errors.get(error, 0) + 1
+                    await asyncio.sleep(0.05)
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+    return {'latencies': sorted(latencies), 'errors': errors, 'peak_in_flight': state['peak']}
+
+
+def run_mode(mode, args, env, port):
+    # One worker first: its memory decides how many fit in the budget
+    probe = Server(mode, 1, args.wsgi_threads, port, env)
+    try:
+        if not probe.ready():
+            print(f"{mode}: server did not start")
+            return None
+        asyncio.run(drive(probe.url, 4, 2, args.timeout))
+        single_rss = probe.sample()
+    finally:
+        probe.stop()
+
+    workers = max(1, int(args.memory_mb * 1024 * 1024 // single_rss))
+    if args.max_workers:
+        workers = min(workers, args.max_workers)
+    server = Server(mode, workers, args.wsgi_threads, port, env)
+    try:
+        if not server.ready():
+            print(f"{mode}: server with {workers} workers did not start")
+            return None
+        server.start_sampling()
+        start = time.perf_counter()
+        result = asyncio.run(drive(server.url, args.concurrency, args.duration, args.timeout))
+        elapsed = time.perf_counter() - start
+        server.sample()
+    finally:
+        server.stop()
+
+    latencies = result['latencies']
+    return {
+        'mode': mode,
+        'workers': workers,
+        'capacity': workers * args.wsgi_threads if mode == 'wsgi' else None,
+        'single_worker_mb': single_rss / 1024 / 1024,
+        'peak_mb': server.peak_rss / 1024 / 1024,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.50),
+        'p95_ms': percentile(latencies, 0.95),
+        'errors': result['errors'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', default='wsgi,asgi')
+    parser.add_argument('--memory-mb', type=float, default=512, help='Memory budget for the whole server')
+    parser.add_argument('--max-workers', type=int, default=0, help='Cap workers regardless of the budget')
+    parser.add_argument('--wsgi-threads', type=int, default=8, help='Threads per gthread worker')
+    parser.add_argument('--concurrency', type=int, default=200, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--stub-latency-ms', type=float, default=1000)
+    parser.add_argument('--port', type=int, default=5077)
+    args = parser.parse_args()
+
+    stub = LLMStub(latency_ms=args.stub_latency_ms, jitter_ms=args.stub_latency_ms / 10).start()
+    scratch = tempfile.TemporaryDirectory()
+    env = dict(os.environ)
+    env.update(stub.app_environment())
+    env['RATE_LIMIT_ENABLED'] = 'false'  # one shared bench user would hit its limits at once
+
+    rows = []
+    try:
+        for index, mode in enumerate(m.strip() for m in args.modes.split(',') if m.strip()):
+            env['DATABASE_URL'] = 'sqlite:///' + os.path.join(scratch.name, f'{mode}.db')
+            print(f"Running {mode}...")
+            row = run_mode(mode, args, env, args.port + index)
+            if row is not None:
+                rows.append(row)
+    finally:
+        stub.stop()
+        scratch.cleanup()
+
+    print(f"\nBudget {args.memory_mb:g} MB, {args.concurrency} clients, LLM latency {args.stub_latency_ms:g} ms")
+    print(f"{'mode':<6}{'workers':>8}{'in flight':>10}{'1 worker MB':>12}{'peak MB':>9}{'req/s':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}  errors")
+    for row in rows:
+        capacity = row['capacity'] if row['capacity'] is not None else 'async'
+        print(f"{row['mode']:<6}{row['workers']:>8}{capacity:>10}{row['single_worker_mb']:>12.1f}"
+              f"{row['peak_mb']:>9.1f}{row['throughput']:>8.1f}{row['p50_ms'] or 0:>9.0f}"
+              f"{row['p95_ms'] or 0:>9.0f}  {row['errors'] or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
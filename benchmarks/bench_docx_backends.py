@@ -0,0 +1,93 @@
+"""
+DOCX backend benchmark: python-docx object model vs. direct OOXML writer
+
+Checks that both backends produce visually equivalent documents for every
+template (paragraph text, styles, alignment, run formatting, page margins),
+then reports render time and peak allocation for each backend.
+
+Usage:
+    python -m benchmarks.bench_docx_backends --renders 100
+"""
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.resume_templates import ResumeTemplates
+from benchmarks.bench_docx_export import make_sample
+
+BACKENDS = ('python-docx', 'ooxml')
+
+
+def _render(backend, template, user, profile):
+    buffer = io.BytesIO()
+    ResumeTemplates.export_as_docx(template, user, profile, buffer, backend)
+    return buffer.getvalue()
+
+
+def _describe(content):
+    """Reduce a .docx to what a reader sees: margins plus per-paragraph formatting"""
+    doc = Document(io.BytesIO(content))
+    section = doc.sections[0]
+    layout = (section.top_margin, section.bottom_margin, section.left_margin, section.right_margin)
+    paragraphs = []
+    for p in doc.paragraphs:
+        runs = tuple(
+            (r.text, r.bold, r.font.size, str(r.font.color.rgb) if r.font.color.type else None)
+            for r in p.runs
+        )
+        spacing = (p.paragraph_format.space_after, p.paragraph_format.line_spacing)
+        paragraphs.append((p.style.name, p.alignment, spacing, runs))
+    return layout, paragraphs
+
+
+def check_parity(user, profile):
+    """Return a list of templates whose two renders differ"""
+    mismatches = []
+    for template in AIResumeEnhancer.RESUME_FORMATS:
+        expected = _describe(_render('python-docx', template, user, profile))
+        actual = _describe(_render('ooxml', template, user, profile))
+        if expected != actual:
+            mismatches.append(template)
+    return mismatches
+
+
+def _measure(backend, user, profile, renders):
+    _render(backend, 'professional', user, profile)
+    start = time.perf_counter()
+    for _ in range(renders):
+        _render(backend, 'professional', user, profile)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    _render(backend, 'professional', user, profile)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / renders * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--renders', type=int, default=100)
+    args = parser.parse_args()
+
+    user, profile = make_sample(dob='1990-01-02', hobbies='Chess',
+                                education='B.Sc. Computer Science\nState University, 2018')
+
+    mismatches = check_parity(user, profile)
+    if mismatches:
+        print(f"parity FAILED for templates: {', '.join(mismatches)}")
+        sys.exit(1)
+    print(f"parity OK for {len(AIResumeEnhancer.RESUME_FORMATS)} templates")
+
+    for backend in BACKENDS:
+        ms, peak_kb = _measure(backend, user, profile, args.renders)
+        print(f"{backend:>12}: {ms:6.2f} ms/render  peak {peak_kb:8.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+PDF backend benchmark: Platypus flowables vs. direct canvas writer
+
+Checks that both backends produce the same text for every template and
+synthetic profile (pages, lines and words as extracted by pypdf), then reports
+the median render time of each backend and the speed-up. Profiles that still
+overflow one page after auto-fit are rendered by Platypus on both paths.
+
+Requires pypdf for the parity check (pip install pypdf).
+
+Usage:
+    python -m benchmarks.bench_pdf_backends --renders 20 --seeds 3
+"""
+import argparse
+import io
+import statistics
+import sys
+import time
+
+from backend.services import pdf_fonts
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.pdf_canvas_writer import CanvasPDFWriter
+from backend.services.pdf_exporter import PDFExporter
+from benchmarks.synthetic import SIZES, make_user
+
+BACKENDS = (('platypus', PDFExporter), ('canvas', CanvasPDFWriter))
+
+
+def _text(content):
+    """Per-page extracted lines, whitespace-normalized (text positioning operators differ)"""
+    from pypdf import PdfReader
+
+    return [
+        [' '.join(line.split()) for line in page.extract_text().splitlines()]
+        for page in PdfReader(io.BytesIO(content)).pages
+    ]
+
+
+def check_parity(seeds):
+    """Return (template, size, seed) cases whose two renders differ"""
+    mismatches = []
+    for seed in range(seeds):
+        for size in SIZES:
+            user, profile = make_user(size, seed)
+            for template in AIResumeEnhancer.RESUME_FORMATS:
+                expected = _text(PDFExporter.generate(user, profile, template)[0])
+                actual = _text(CanvasPDFWriter.generate(user, profile, template)[0])
+                if expected != actual:
+                    mismatches.append((template, size, seed))
+    return mismatches
+
+
+def _measure(writer, user, profile, template, renders):
+    writer.generate(user, profile, template)
+    timings = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        writer.generate(user, profile, template)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--renders', type=int, default=20)
+    parser.add_argument('--seeds', type=int, default=3, help='Synthetic profiles per size in the parity check')
+    args = parser.parse_args()
+
+    pdf_fonts.load()
+    try:
+        mismatches = check_parity(args.seeds)
+    except ImportError:
+        print("pypdf is not installed; skipping the parity check")
+    else:
+        if mismatches:
+            print("parity FAILED for: " + ', '.join(f'{t}/{size}/seed {seed}' for t, size, seed in mismatches))
+            sys.exit(1)
+        print(f"parity OK for {len(AIResumeEnhancer.RESUME_FORMATS) * len(SIZES) * args.seeds} renders")
+
+    print(f"\n{'size':<9}{'template':<14}" + ''.join(f'{name:>11}' for name, _ in BACKENDS) + f"{'speed-up':>10}")
+    for size in SIZES:
+        user, profile = make_user(size)
+        for template in AIResumeEnhancer.RESUME_FORMATS:
+            ms = [_measure(writer, user, profile, template, args.renders) for _, writer in BACKENDS]
+            print(f"{size:<9}{template:<14}" + ''.join(f'{m:>8.1f} ms' for m in ms) + f"{ms[0] / ms[1]:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Multi-page CV benchmark: pages per second and peak memory
+
+Renders the academic template in CV mode for profiles with a growing number
+of publications (project entries). Reports pages, render time, pages per
+second and the tracemalloc peak. The same peak is measured for a build that
+first materializes the whole story (BaseDocTemplate.build), to show what the
+incremental section-by-section build saves.
+
+Usage:
+    python -m benchmarks.bench_pdf_cv --publications 25 100 400 --renders 3
+"""
+import argparse
+import io
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+
+from backend.services import pdf_fonts
+from backend.services.pdf_exporter import CVDocTemplate, PDFExporter
+from backend.services.profile_snapshot import ProfileSnapshot, UserSnapshot
+from backend.services.resume_exporter import ResumeExporter
+from backend.services.resume_templates import ResumeTemplates
+from benchmarks.synthetic import make_profile
+
+TEMPLATE = 'academic'
+_PAGE = re.compile(rb'/Type\s*/Page\b')
+
+
+def make_cv(publications):
+    """(user, profile) for the huge synthetic profile with publications as project entries"""
+    profile = make_profile('huge')
+    profile['projects'] = '\n'.join(
+        f'Publication {index + 1} - Doe J., Smith A., Lee K. Cache-aware scheduling for streaming '
+        f'workloads, part {index + 1}. Journal of Distributed Systems {index % 40 + 1}({index % 4 + 1}), '
+        f'20{10 + index % 15}.'
+        for index in range(publications)
+    )
+    snapshot = ProfileSnapshot(profile)
+    return UserSnapshot(1, 'Jane Doe', 'jane.doe@example.com', snapshot), snapshot
+
+
+def _whole_story(document, fonts):
+    """Same document through BaseDocTemplate.build with the full story in memory"""
+    specs = ResumeTemplates.get_template_specs(document.template)
+    buffer = io.BytesIO()
+    doc = CVDocTemplate(buffer, document, fonts, specs.get('margins') or {})
+    styles = PDFExporter.get_styles(specs['size'], specs['size'] * specs['spacing'], 6, fonts)
+    doc.build([flowable for chunk in PDFExporter.story_chunks(document, styles, doc.width, keep_headings=True)
+               for flowable in chunk])
+    return buffer.getvalue()
+
+
+def _peak_kib(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--publications', type=int, nargs='+', default=[25, 100, 400])
+    parser.add_argument('--renders', type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_fonts.load()
+    if not PDFExporter.multi_page(TEMPLATE):
+        print(f"The {TEMPLATE} template is not in multi-page CV mode (PDF_CV_MODE)")
+        return 1
+
+    print(f"{'publications':>12}{'pages':>7}{'ms':>9}{'pages/s':>9}{'peak KiB':>10}{'whole story':>13}")
+    for publications in args.publications:
+        user, profile = make_cv(publications)
+        export_user, export_profile = ResumeExporter.normalize(user, profile)
+        document = ResumeTemplates.generate_document(TEMPLATE, export_user, export_profile)
+        fonts = pdf_fonts.faces(ResumeTemplates.get_template_specs(TEMPLATE).get('font'))
+
+        content = PDFExporter.generate_cv(document, fonts)[0]
+        pages = len(_PAGE.findall(content))
+        timings = []
+        for _ in range(args.renders):
+            start = time.perf_counter()
+            PDFExporter.generate_cv(document, fonts)
+            timings.append(time.perf_counter() - start)
+        seconds = statistics.median(timings)
+
+        peak = _peak_kib(lambda: PDFExporter.generate_cv(document, fonts))
+        whole_peak = _peak_kib(lambda: _whole_story(document, fonts))
+        print(f"{publications:>12}{pages:>7}{seconds * 1000:>9.1f}{pages / seconds:>9.1f}{peak:>10.0f}{whole_peak:>13.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
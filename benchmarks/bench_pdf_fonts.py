@@ -0,0 +1,79 @@
+"""
+PDF template fonts: output size and render time per template
+
+Renders every template with the built-in Times faces and with the bundled
+fonts from the font registry (backend/services/pdf_fonts.py). It reports the
+PDF size, the embedded font subsets and the median render time for each. The
+one-off font registration time is reported separately, since it happens once
+per worker (gunicorn warmup or the first PDF render).
+
+Usage:
+    python -m benchmarks.bench_pdf_fonts --renders 20 --size typical
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+
+from backend.services import pdf_fonts
+from backend.services.ai_resume_enhancer import AIResumeEnhancer
+from backend.services.pdf_exporter import PDFExporter
+from benchmarks.synthetic import SIZES, make_user
+
+_SUBSET_FONT = re.compile(rb'/BaseFont\s*/([A-Z]{6}\+[A-Za-z0-9-]+)')
+
+
+def _render(user, profile, template, renders):
+    content = PDFExporter.generate(user, profile, template)[0]
+    timings = []
+    for _ in range(renders):
+        start = time.perf_counter()
+        PDFExporter.generate(user, profile, template)
+        timings.append((time.perf_counter() - start) * 1000)
+    return content, statistics.median(timings)
+
+
+def _embedded(content):
+    """Names of the embedded font subsets (prefix stripped)"""
+    return sorted({name.decode().split('+', 1)[1] for name in _SUBSET_FONT.findall(content)})
+
+
+def run(user, profile, renders):
+    """Rows of (template, font, Times bytes/ms, bundled bytes/ms, embedded subsets)"""
+    rows = []
+    for template, spec in AIResumeEnhancer.RESUME_FORMATS.items():
+        original = pdf_fonts.faces
+        pdf_fonts.faces = lambda font_name: pdf_fonts.TIMES
+        try:
+            times_pdf, times_ms = _render(user, profile, template, renders)
+        finally:
+            pdf_fonts.faces = original
+        bundled_pdf, bundled_ms = _render(user, profile, template, renders)
+        rows.append((template, spec['font'], len(times_pdf), times_ms, len(bundled_pdf), bundled_ms,
+                     _embedded(bundled_pdf)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--renders', type=int, default=20)
+    parser.add_argument('--size', choices=SIZES, default='typical', help='Synthetic profile size')
+    args = parser.parse_args()
+
+    load_ms = pdf_fonts.load()
+    if load_ms is None:
+        print("Bundled fonts are disabled or failed to load (PDF_FONTS)")
+        return 1
+    print(f"Font registration: {load_ms:.1f} ms (once per process, in warmup or the first PDF render)\n")
+
+    user, profile = make_user(args.size)
+    print(f"{'template':<14}{'font':<17}{'Times KB':>9}{'ms':>8}{'bundled KB':>11}{'ms':>8}  embedded subsets")
+    for template, font, times_size, times_ms, size, ms, embedded in run(user, profile, args.renders):
+        print(f"{template:<14}{font:<17}{times_size / 1024:>9.1f}{times_ms:>8.1f}{size / 1024:>11.1f}{ms:>8.1f}  "
+              f"{', '.join(embedded) or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Profile snapshot benchmark: per-request profile views vs. one ProfileSnapshot
+per profile version
+
+"legacy" repeats what every request used to do: copy the stored dictionary into
+fresh SimpleUser/SimpleProfile objects, apply defaults and re-split the skills,
+projects, experience and education text. "snapshot" reuses the ProfileSnapshot
+built once for the profile version and its pre-split lists.
+
+"view build" times only the in-process work. "with storage" adds the read: the
+legacy path fetches and decompresses the row on every request, the snapshot
+path asks the repository (version check, then the cached snapshot).
+
+Usage:
+    python -m benchmarks.bench_profile_snapshot --requests 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+# Point the repository at a scratch database before it is imported
+_TMP = tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_TMP.name, 'bench.db')
+
+from backend.services.profile_repository import get_profile_repository  # noqa: E402
+from backend.services.profile_snapshot import PROFILE_FIELDS, UserSnapshot  # noqa: E402
+from benchmarks.bench_docx_export import SAMPLE_PROFILE  # noqa: E402
+
+
+class _LegacyUser:
+    def __init__(self, name, email):
+        self.name = name
+        self.email = email
+
+
+class _LegacyProfile:
+    def __init__(self, data):
+        for field in PROFILE_FIELDS:
+            setattr(self, field, data.get(field, ''))
+
+
+def _legacy_request(user, stored):
+    simple_user = _LegacyUser(user['name'], user['email'])
+    profile = _LegacyProfile(dict(stored))
+    lists = []
+    for field, separator in (('skills', ','), ('projects', '|'), ('experience', '|'), ('education', '|')):
+        parts = getattr(profile, field).split(separator) if getattr(profile, field) else []
+        lists.append([part.strip() for part in parts if part.strip()])
+    return simple_user, profile, lists
+
+
+def _legacy_stored_request(user, repository):
+    with repository.database.connection() as conn:
+        row = conn.execute('SELECT data FROM profiles WHERE user_id = ?', (user['id'],)).fetchone()
+    return _legacy_request(user, repository._decode(row['data']))
+
+
+def _snapshot_request(user, profile):
+    snapshot = UserSnapshot(user['id'], user['name'], user['email'], profile)
+    return snapshot, (profile.skills_list, profile.projects_list,
+                      profile.experience_list, profile.education_list)
+
+
+def _per_request_us(func, requests):
+    func()
+    start = time.perf_counter()
+    for _ in range(requests):
+        func()
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    user = {'id': 1, 'name': 'Jane Doe', 'email': 'jane@example.com'}
+    repository = get_profile_repository()
+    repository.save(user['id'], SAMPLE_PROFILE)
+
+    profile = repository.get(user['id'])
+    rows = (
+        ('legacy',
+         _per_request_us(lambda: _legacy_request(user, SAMPLE_PROFILE), args.requests),
+         _per_request_us(lambda: _legacy_stored_request(user, repository), args.requests)),
+        ('snapshot',
+         _per_request_us(lambda: _snapshot_request(user, profile), args.requests),
+         _per_request_us(lambda: _snapshot_request(user, repository.get(user['id'])), args.requests)),
+    )
+
+    print(f"{'mode':<10}{'view build us':>16}{'with storage us':>18}")
+    for mode, build_us, stored_us in rows:
+        print(f"{mode:<10}{build_us:>16.2f}{stored_us:>18.2f}")
+
+
+if __name__ == '__main__':
+    main()
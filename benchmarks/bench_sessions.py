@@ -0,0 +1,104 @@
+"""
+Session storage benchmark: signed-cookie session carrying the profile vs.
+server-side session with the profile in the profile repository
+
+For each mode it logs in, stores a profile and then reports the Cookie header
+the browser uploads on every request. It also reports CPU time per request for
+a static asset, a session-free API call and a session-reading page.
+
+Usage:
+    python -m benchmarks.bench_sessions --requests 2000 --scale 4
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Point the app at a scratch database before it is imported
+_TMP = tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_TMP.name, 'bench.db')
+
+from flask.sessions import SecureCookieSessionInterface  # noqa: E402
+
+from app import app  # noqa: E402
+from backend.services.profile_repository import get_profile_repository  # noqa: E402
+from backend.services.session_store import ServerSideSessionInterface  # noqa: E402
+from backend.services.user_repository import get_user_repository  # noqa: E402
+from benchmarks.bench_docx_export import SAMPLE_PROFILE  # noqa: E402
+
+ENDPOINTS = (('static', '/'), ('templates', '/api/ai/templates'), ('dashboard', '/dashboard'))
+
+
+def _profile(scale):
+    """Sample profile with summary/projects/experience grown by non-repeating text"""
+    rng = random.Random(0)
+    vocabulary = sorted(set(' '.join(SAMPLE_PROFILE.values()).replace(',', ' ').split()))
+    profile = dict(SAMPLE_PROFILE)
+    for field in ('summary', 'projects', 'experience'):
+        extra = [' '.join(rng.choice(vocabulary) for _ in range(12)) for _ in range(scale)]
+        profile[field] = '\n'.join([profile[field]] + extra)
+    for field in ('leetcode', 'other_links', 'dob', 'hobbies'):
+        profile.setdefault(field, '')
+    return profile
+
+
+def _client(mode, email, profile):
+    app.session_interface = ServerSideSessionInterface() if mode == 'server' else SecureCookieSessionInterface()
+    client = app.test_client()
+    client.post('/register', data={'name': 'Jane Doe', 'email': email, 'password': 'secret1'})
+    client.post('/login', data={'email': email, 'password': 'secret1'})
+    if mode == 'server':
+        client.post('/profile', data=profile)
+    else:
+        # What profile_routes used to do: keep every field in the signed cookie
+        with client.session_transaction() as session:
+            session['profile'] = profile
+    return client
+
+
+def _cookie_header(client):
+    cookie = client.get_cookie('session')
+    return f'session={cookie.value}' if cookie else ''
+
+
+def _cpu_per_request(client, path, requests):
+    client.get(path)
+    start = time.process_time()
+    for _ in range(requests):
+        client.get(path)
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--scale', type=int, default=4, help='Repeat summary/projects/experience this many times')
+    args = parser.parse_args()
+
+    profile = _profile(args.scale)
+    print(f"Profile: {sum(len(v) for v in profile.values())} characters of field text\n")
+    print(f"{'mode':<8}{'cookie bytes':>14}" + ''.join(f"{name + ' us/req':>18}" for name, _ in ENDPOINTS))
+    for mode in ('cookie', 'server'):
+        client = _client(mode, f'{mode}@example.com', profile)
+        cookie_bytes = len(_cookie_header(client))
+        timings = [_cpu_per_request(client, path, args.requests) for _, path in ENDPOINTS]
+        print(f"{mode:<8}{cookie_bytes:>14}" + ''.join(f"{t:>18.1f}" for t in timings))
+
+    repository = get_profile_repository()
+    user_id = get_user_repository().get_by_email('server@example.com')['id']
+    repository.get(user_id)
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        repository.get(user_id)
+    hit_us = (time.perf_counter() - start) / args.requests * 1e6
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        repository._cache.clear()
+        repository.get(user_id)
+    miss_us = (time.perf_counter() - start) / args.requests * 1e6
+    print(f"\nProfile read: LRU hit {hit_us:.1f} us, miss (read + decompress) {miss_us:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
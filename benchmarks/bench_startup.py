@@ -0,0 +1,84 @@
+"""
+Worker cold-start benchmark
+
+Imports the Flask app in fresh interpreters under ``-X importtime`` and reports
+the cumulative import time of the app, our own modules and the heavy
+third-party packages. It then measures what the lazily loaded backends cost
+when first used (backend_registry.warmup()).
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5
+    python -m benchmarks.bench_startup --budget-ms 400   # exit 1 if app import exceeds it
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+WATCHED = ('app', 'flask', 'reportlab', 'docx', 'requests')
+
+_WARMUP_SNIPPET = (
+    "import json, time, app;"
+    "from backend.services.backend_registry import warmup;"
+    "start = time.perf_counter(); timings = warmup();"
+    "print(json.dumps({'total_ms': (time.perf_counter() - start) * 1000, 'timings': timings}))"
+)
+
+
+def _importtime(code):
+    """Run code in a fresh interpreter; return {module: cumulative microseconds}"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time:  self_us | cumulative_us | <indent>module"
+        _, cumulative_us, name = line.split('|')
+        modules[name.strip()] = int(cumulative_us)
+    return modules, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Slowest backend.* modules to list')
+    parser.add_argument('--budget-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    samples = [_importtime('import app')[0] for _ in range(args.runs)]
+
+    def median_ms(name):
+        values = [sample[name] for sample in samples if name in sample]
+        return statistics.median(values) / 1000 if values else None
+
+    print(f"Cold import of app.py, median of {args.runs} runs")
+    print(f"{'module':<45}{'cumulative ms':>15}")
+    for name in WATCHED:
+        value = median_ms(name)
+        print(f"{name:<45}{'not imported' if value is None else f'{value:.1f}':>15}")
+
+    ours = sorted({name for sample in samples for name in sample if name.startswith('backend')},
+                  key=lambda name: -(median_ms(name) or 0))
+    print("\nSlowest backend modules")
+    for name in ours[:args.top]:
+        print(f"{name:<45}{median_ms(name):>15.1f}")
+
+    _, output = _importtime(_WARMUP_SNIPPET)
+    warm = json.loads(output.strip().splitlines()[-1])
+    print(f"\nDeferred to first use (warmup total {warm['total_ms']:.1f} ms)")
+    for registry, timings in warm['timings'].items():
+        for key, ms in timings.items():
+            print(f"{registry + ':' + key:<45}{ms:>15.1f}")
+
+    app_ms = median_ms('app')
+    if args.budget_ms is not None and app_ms > args.budget_ms:
+        print(f"\nFAIL: app import {app_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
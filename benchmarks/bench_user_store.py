@@ -0,0 +1,176 @@
+"""
+User store benchmark: legacy in-memory dict vs. SQLite UserRepository
+
+1. Session lookup: the old get_user_from_session scan over every user vs. a
+   primary-key lookup.
+2. Concurrent registration + login from many threads. Reports throughput and
+   integrity: duplicate ids and accounts missing afterwards.
+3. Several processes (standing in for gunicorn workers) register into one
+   database; every account must be visible to all of them afterwards.
+
+Password hashing uses a cheap pbkdf2 setting by default so the numbers reflect
+the store rather than the KDF; pass --hash-method scrypt for realistic totals.
+
+Usage:
+    python -m benchmarks.bench_user_store --users 5000 --threads 16
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from backend.services.database import Database
+from backend.services.user_repository import UserRepository
+
+
+def _legacy_lookup(users, user_id):
+    for email, user_data in users.items():
+        if user_data['id'] == user_id:
+            return user_data
+    return None
+
+
+def _seed(repository, users):
+    """Insert the legacy dict's accounts with their ids (the old store never persisted anything)"""
+    with repository.database.transaction() as conn:
+        conn.executemany(
+            'INSERT INTO users (id, name, email, password_hash, created_at) VALUES (?, ?, ?, ?, ?)',
+            [(user['id'], user['name'], email, user['password_hash'], time.time()) for email, user in users.items()]
+        )
+
+
+def bench_lookup(count, lookups, repository):
+    legacy = {}
+    for i in range(count):
+        email = f'lookup{i}@example.com'
+        legacy[email] = {'id': i + 1, 'name': f'User {i}', 'email': email, 'password_hash': 'x'}
+    _seed(repository, legacy)
+
+    ids = [random.randint(1, count) for _ in range(lookups)]
+    start = time.perf_counter()
+    for user_id in ids:
+        _legacy_lookup(legacy, user_id)
+    legacy_us = (time.perf_counter() - start) / lookups * 1e6
+
+    start = time.perf_counter()
+    for user_id in ids:
+        repository.get_by_id(user_id)
+    repository_us = (time.perf_counter() - start) / lookups * 1e6
+
+    print(f"Session lookup with {count} users ({lookups} lookups)")
+    print(f"  legacy dict scan   {legacy_us:10.1f} us/lookup")
+    print(f"  repository (PK)    {repository_us:10.1f} us/lookup")
+
+
+def _register_and_login(store, index, hash_method):
+    email = f'user{index}@example.com'
+    password = f'password{index}'
+    start = time.perf_counter()
+    store.register(f'User {index}', email, generate_password_hash(password, method=hash_method))
+    user = store.lookup(email)
+    ok = user is not None and check_password_hash(user['password_hash'], password)
+    return ok, (time.perf_counter() - start) * 1000
+
+
+class _LegacyStore:
+    """The old auth_routes logic: id = len(users) + 1 without locking"""
+
+    def __init__(self):
+        self.users = {}
+
+    def register(self, name, email, password_hash):
+        user_id = len(self.users) + 1
+        time.sleep(0)  # yield like a real request would between read and write
+        self.users[email] = {'id': user_id, 'name': name, 'email': email, 'password_hash': password_hash}
+
+    def lookup(self, email):
+        return self.users.get(email)
+
+    def ids(self):
+        return [user['id'] for user in self.users.values()]
+
+
+class _RepositoryStore:
+    def __init__(self, repository):
+        self.repository = repository
+
+    def register(self, name, email, password_hash):
+        self.repository.create_user(name, email, password_hash)
+
+    def lookup(self, email):
+        return self.repository.get_by_email(email)
+
+    def ids(self):
+        with self.repository.database.connection() as conn:
+            return [row[0] for row in conn.execute("SELECT id FROM users WHERE email LIKE 'user%'")]
+
+
+def bench_concurrent(label, store, users, threads, hash_method):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(lambda i: _register_and_login(store, i, hash_method), range(users)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(ms for _, ms in results)
+    failures = sum(1 for ok, _ in results if not ok)
+    ids = store.ids()
+    duplicates = len(ids) - len(set(ids))
+    print(f"  {label:<18} {users / elapsed:8.0f} users/s  p50 {statistics.median(latencies):6.2f} ms  "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:6.2f} ms  failed logins {failures}  "
+          f"duplicate ids {duplicates}")
+
+
+def _worker_register(path, worker, count, hash_method):
+    repository = UserRepository(Database(path))
+    for i in range(count):
+        email = f'worker{worker}-{i}@example.com'
+        repository.create_user(f'Worker {worker}', email, generate_password_hash('password', method=hash_method))
+    return repository.count()
+
+
+def bench_processes(path, processes, per_process, hash_method):
+    start = time.perf_counter()
+    with multiprocessing.get_context('spawn').Pool(processes) as pool:
+        pool.starmap(_worker_register, [(path, w, per_process, hash_method) for w in range(processes)])
+    elapsed = time.perf_counter() - start
+
+    repository = UserRepository(Database(path))
+    visible = sum(
+        1 for w in range(processes) for i in range(per_process)
+        if repository.get_by_email(f'worker{w}-{i}@example.com')
+    )
+    print(f"Cross-process registration: {processes} processes x {per_process} users in {elapsed:.2f} s, "
+          f"{visible}/{processes * per_process} visible from a fresh connection")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--hash-method', default='pbkdf2:sha256:1000')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = UserRepository(Database(os.path.join(tmp, 'lookup.db')))
+        bench_lookup(args.users, args.lookups, repository)
+
+        print(f"\nConcurrent register + login: {args.users} users, {args.threads} threads")
+        bench_concurrent('legacy dict', _LegacyStore(), args.users, args.threads, args.hash_method)
+        repository = UserRepository(Database(os.path.join(tmp, 'concurrent.db')))
+        bench_concurrent('repository', _RepositoryStore(repository), args.users, args.threads, args.hash_method)
+
+        print()
+        bench_processes(os.path.join(tmp, 'shared.db'), args.processes, args.users // args.processes,
+                        args.hash_method)
+
+
+if __name__ == '__main__':
+    main()
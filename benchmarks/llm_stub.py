@@ -0,0 +1,135 @@
+"""
+Local stand-in for the Grok/Groq chat-completions APIs
+
+Answers any POST ending in /chat/completions with a canned OpenAI-style
+completion after a configurable delay, so load tests exercise the app's LLM
+code paths without network calls or API costs.
+
+Point the app at it with:
+    GROK_API_URL=http://127.0.0.1:8099/v1/chat/completions
+    GROQ_BASE_URL=http://127.0.0.1:8099
+    GROQ_API_KEY=stub
+
+Usage:
+    python -m benchmarks.llm_stub --port 8099 --latency-ms 800 --jitter-ms 200 --error-rate 0.01
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_REPLY = (
+    "Jane Doe\nSenior Backend Engineer\n\nSUMMARY\nEngineer with experience building reliable APIs "
+    "and data pipelines.\n\nSKILLS\nPython, Flask, PostgreSQL, Docker\n\nEXPERIENCE\n- Led the migration "
+    "to Kubernetes, cutting deploy time by 60%\n- Built REST APIs serving 10k requests per second"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            payload = {}
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send(404, {'error': {'message': f'Unknown path {self.path}'}})
+            return
+
+        settings = self.server.settings
+        delay = max(0.0, random.gauss(settings['latency_ms'], settings['jitter_ms'])) / 1000
+        time.sleep(delay)
+        with self.server.lock:
+            self.server.calls += 1
+        if random.random() < settings['error_rate']:
+            self._send(503, {'error': {'message': 'stub overloaded', 'type': 'server_error'}})
+            return
+
+        self._send(200, {
+            'id': f'chatcmpl-stub-{self.server.calls}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': _REPLY},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': 200, 'completion_tokens': 80, 'total_tokens': 280},
+        })
+
+
+class LLMStub:
+    """Threaded stub server; start() runs it in the background"""
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=500, jitter_ms=100, error_rate=0.0):
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.settings = {'latency_ms': latency_ms, 'jitter_ms': jitter_ms, 'error_rate': error_rate}
+        self.server.lock = threading.Lock()
+        self.server.calls = 0
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def calls(self):
+        return self.server.calls
+
+    def app_environment(self):
+        """Environment variables that route the app's LLM calls to this stub"""
+        return {
+            'GROK_API_URL': f'{self.base_url}/v1/chat/completions',
+            'GROQ_BASE_URL': self.base_url,
+            'GROQ_API_KEY': 'stub',
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency-ms', type=float, default=500)
+    parser.add_argument('--jitter-ms', type=float, default=100)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    stub = LLMStub(args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f"LLM stub listening on {stub.base_url}")
+    for key, value in stub.app_environment().items():
+        print(f"  {key}={value}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
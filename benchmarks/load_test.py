@@ -0,0 +1,322 @@
+"""
+End-to-end load test: scripted user sessions against a running app
+
+Each simulated user registers, logs in, saves a profile through the real form
+posts, exports a few resume formats, analyzes the resume against a job
+description and sometimes asks for a cover letter. Sessions arrive as a Poisson
+process at the configured rate (open loop). A slow server therefore builds a
+queue instead of quietly lowering the offered load.
+
+The report gives throughput, p50/p95/p99 latency and the error rate per
+endpoint, plus how long sessions waited for a free user slot.
+
+With --start-server the server command is launched with its LLM calls routed to
+a local stub (benchmarks/llm_stub.py) and a scratch database, e.g. to compare
+worker classes:
+
+    python -m benchmarks.load_test --rate 2 --duration 60 \\
+        --start-server "gunicorn -c gunicorn.conf.py -w 1 -k gthread --threads 8 -b 127.0.0.1:5055 app:app" \\
+        --url http://127.0.0.1:5055
+
+Against an already running app (start benchmarks.llm_stub and point the app at
+it first):
+
+    python -m benchmarks.load_test --url http://127.0.0.1:5000 --stages 1:30,4:60,8:30
+"""
+import argparse
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.llm_stub import LLMStub
+from benchmarks.synthetic import SIZES, make_job_description, make_profile
+
+PROFILE_FIELDS = (
+    'headline', 'phone', 'linkedin', 'github', 'email', 'leetcode', 'other_links', 'summary',
+    'skills', 'projects', 'experience', 'education', 'dob', 'languages', 'hobbies'
+)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """Thread-safe latency and error collection per endpoint"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+        self.queue_delays = []
+        self.sessions = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, name, latency_ms, error=None):
+        with self._lock:
+            self.latencies[name].append(latency_ms)
+            if error is not None:
+                self.errors[name][error] += 1
+
+    def session(self, outcome, queue_delay_ms):
+        with self._lock:
+            self.sessions[outcome] += 1
+            self.queue_delays.append(queue_delay_ms)
+
+    def report(self, elapsed):
+        """Summary dictionary (endpoint stats are sorted by name)"""
+        with self._lock:
+            endpoints = {}
+            total_requests = 0
+            total_errors = 0
+            for name in sorted(self.latencies):
+                values = sorted(self.latencies[name])
+                errors = sum(self.errors[name].values())
+                total_requests += len(values)
+                total_errors += errors
+                endpoints[name] = {
+                    'requests': len(values),
+                    'throughput_rps': round(len(values) / elapsed, 3) if elapsed else None,
+                    'error_rate': round(errors / len(values), 4) if values else 0,
+                    'errors': dict(self.errors[name]),
+                    'p50_ms': round(percentile(values, 0.50), 2),
+                    'p95_ms': round(percentile(values, 0.95), 2),
+                    'p99_ms': round(percentile(values, 0.99), 2),
+                    'max_ms': round(values[-1], 2),
+                }
+            delays = sorted(self.queue_delays)
+            return {
+                'elapsed_s': round(elapsed, 2),
+                'requests': total_requests,
+                'throughput_rps': round(total_requests / elapsed, 3) if elapsed else None,
+                'error_rate': round(total_errors / total_requests, 4) if total_requests else 0,
+                'sessions': dict(self.sessions),
+                'queue_delay_p50_ms': round(percentile(delays, 0.50), 2) if delays else None,
+                'queue_delay_p95_ms': round(percentile(delays, 0.95), 2) if delays else None,
+                'endpoints': endpoints,
+            }
+
+
+class UserSession:
+    """One simulated user walking through the app"""
+
+    def __init__(self, base_url, index, run_id, rng, args, recorder):
+        self.base_url = base_url.rstrip('/')
+        self.email = f'load-{run_id}-{index}@example.com'
+        self.rng = rng
+        self.args = args
+        self.recorder = recorder
+        self.http = requests.Session()
+
+    def _call(self, name, method, path, expect, **kwargs):
+        start = time.perf_counter()
+        error = None
+        try:
+            response = self.http.request(method, self.base_url + path, allow_redirects=False,
+                                         timeout=self.args.timeout, **kwargs)
+            response.content  # include the body transfer in the latency
+            if response.status_code != expect:
+                error = f'HTTP {response.status_code}'
+        except requests.RequestException as e:
+            error = type(e).__name__
+        self.recorder.record(name, (time.perf_counter() - start) * 1000, error)
+        if error is not None:
+            raise RuntimeError(f'{name}: {error}')
+
+    def _think(self):
+        if self.args.think_ms > 0:
+            time.sleep(self.rng.expovariate(1000 / self.args.think_ms))
+
+    def run(self):
+        password = 'load-test-password'
+        self._call('register', 'POST', '/register', 302,
+                   data={'name': 'Load Tester', 'email': self.email, 'password': password})
+        self._call('login', 'POST', '/login', 302, data={'email': self.email, 'password': password})
+
+        profile = make_profile(self.rng.choice(self.args.sizes), seed=self.rng.randrange(1000))
+        self._call('profile', 'POST', '/profile', 302,
+                   data={field: profile.get(field, '') for field in PROFILE_FIELDS})
+        self._think()
+
+        formats = self.rng.sample(self.args.formats, min(self.args.exports, len(self.args.formats)))
+        for export_format in formats:
+            template = self.rng.choice(self.args.templates)
+            self._call(f'generate:{export_format}', 'POST', '/api/ai/generate-resume', 200,
+                       json={'format': export_format, 'template': template})
+            self._think()
+
+        self._call('analyze', 'POST', '/api/ai/analyze-resume', 200,
+                   json={'job_description': make_job_description(self.rng.randrange(1000))})
+
+        if self.rng.random() < self.args.cover_letter_rate:
+            self._think()
+            self._call('cover_letter', 'POST', '/api/ai/generate-cover-letter', 200,
+                       json={'job_title': 'Backend Engineer', 'company': 'Example Corp'})
+
+
+def parse_stages(args):
+    """[(sessions per second, seconds), ...] from --stages or --rate/--duration"""
+    if args.stages:
+        stages = []
+        for part in args.stages.split(','):
+            rate, seconds = part.split(':')
+            stages.append((float(rate), float(seconds)))
+        return stages
+    return [(args.rate, args.duration)]
+
+
+def arrivals(stages, rng):
+    """Yield arrival offsets (seconds from start) for a piecewise-constant Poisson process"""
+    stage_start = 0.0
+    for rate, seconds in stages:
+        offset = stage_start
+        while rate > 0:
+            offset += rng.expovariate(rate)
+            if offset >= stage_start + seconds:
+                break
+            yield offset
+        stage_start += seconds
+
+
+def wait_until_ready(base_url, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(base_url.rstrip('/') + '/api/ai/templates', timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    return False
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    run_id = uuid.uuid4().hex[:8]
+    recorder = Recorder()
+    stages = parse_stages(args)
+
+    def start_session(index, scheduled):
+        delay_ms = (time.perf_counter() - scheduled) * 1000
+        session = UserSession(args.url, index, run_id, random.Random(rng.random() + index), args, recorder)
+        try:
+            session.run()
+            recorder.session('completed', delay_ms)
+        except RuntimeError:
+            recorder.session('failed', delay_ms)
+
+    total_seconds = sum(seconds for _, seconds in stages)
+    print(f"Offered load: {', '.join(f'{rate:g}/s for {seconds:g}s' for rate, seconds in stages)} "
+          f"(up to {args.max_users} concurrent users)")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.max_users) as executor:
+        for index, offset in enumerate(arrivals(stages, rng)):
+            scheduled = start + offset
+            pause = scheduled - time.perf_counter()
+            if pause > 0:
+                time.sleep(pause)
+            executor.submit(start_session, index, scheduled)
+        print(f"All sessions started after {time.perf_counter() - start:.1f}s of {total_seconds:g}s; "
+              f"waiting for them to finish")
+    return recorder.report(time.perf_counter() - start)
+
+
+def print_report(report):
+    print(f"\n{report['requests']} requests in {report['elapsed_s']}s: "
+          f"{report['throughput_rps']} req/s, error rate {report['error_rate']:.2%}")
+    print(f"Sessions: {report['sessions']}; waiting for a user slot p50 {report['queue_delay_p50_ms']} ms, "
+          f"p95 {report['queue_delay_p95_ms']} ms")
+    print(f"\n{'endpoint':<18}{'requests':>9}{'req/s':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}"
+          f"{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in report['endpoints'].items():
+        print(f"{name:<18}{stats['requests']:>9}{stats['throughput_rps']:>8.2f}{stats['error_rate']:>8.1%}"
+              f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+    for name, stats in report['endpoints'].items():
+        if stats['errors']:
+            print(f"  {name} errors: {stats['errors']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='Base URL of the app')
+    parser.add_argument('--rate', type=float, default=1.0, help='New user sessions per second')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds of arrivals at --rate')
+    parser.add_argument('--stages', help='Piecewise load instead of --rate/--duration, e.g. 1:30,4:60')
+    parser.add_argument('--max-users', type=int, default=32, help='Concurrent user sessions (client threads)')
+    parser.add_argument('--formats', default='pdf,docx,txt', help='Export formats users pick from')
+    parser.add_argument('--exports', type=int, default=2, help='Exports per session')
+    parser.add_argument('--templates', default='professional,modern,technical')
+    parser.add_argument('--sizes', default='typical,typical,huge,sparse', help='Profile sizes users pick from')
+    parser.add_argument('--cover-letter-rate', type=float, default=0.3, help='Fraction of users asking for one')
+    parser.add_argument('--think-ms', type=float, default=500, help='Mean pause between user actions')
+    parser.add_argument('--timeout', type=float, default=60, help='Per-request timeout (seconds)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Write the report as JSON')
+    parser.add_argument('--start-server', help='Command that starts the app (run with the LLM stub env)')
+    parser.add_argument('--stub-latency-ms', type=float, default=800, help='LLM stub mean latency')
+    parser.add_argument('--stub-jitter-ms', type=float, default=200)
+    parser.add_argument('--stub-error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    args.formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+    args.templates = [t.strip() for t in args.templates.split(',') if t.strip()]
+    args.sizes = [s.strip() for s in args.sizes.split(',') if s.strip() in SIZES]
+
+    stub = None
+    server = None
+    scratch = None
+    try:
+        if args.start_server:
+            stub = LLMStub(latency_ms=args.stub_latency_ms, jitter_ms=args.stub_jitter_ms,
+                           error_rate=args.stub_error_rate).start()
+            scratch = tempfile.TemporaryDirectory()
+            env = dict(os.environ)
+            env.update(stub.app_environment())
+            env['DATABASE_URL'] = 'sqlite:///' + os.path.join(scratch.name, 'load.db')
+            print(f"LLM stub on {stub.base_url}; starting: {args.start_server}")
+            server = subprocess.Popen(shlex.split(args.start_server), env=env)
+            if not wait_until_ready(args.url, 60):
+                print(f"Server did not answer at {args.url} within 60s")
+                return 1
+        elif not wait_until_ready(args.url, 5):
+            print(f"No app answering at {args.url} (start it, or pass --start-server)")
+            return 1
+
+        report = run(args)
+        if stub is not None:
+            report['llm_stub_calls'] = stub.calls
+        report['settings'] = {key: value for key, value in vars(args).items() if key != 'output'}
+        print_report(report)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+        return 0
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if stub is not None:
+            stub.stop()
+        if scratch is not None:
+            scratch.cleanup()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Benchmark suite: templates, exporters, content compressor and match scoring
+
+Times every case against synthetic profiles (sparse, typical, huge), writes the
+results as JSON and compares them with a stored baseline. The exit status is 1
+when any case is slower than the baseline by more than --threshold.
+
+Each run also times a fixed pure-Python calibration loop. By default results
+are compared relative to it, so a baseline recorded on one machine can be
+checked on another. --normalize suite instead divides out the median change of
+all cases, which also absorbs a machine that is slower for the whole run (it
+cannot see a slowdown that hits every case equally). Cases that look regressed
+are re-timed --retries times before the run fails.
+
+Usage:
+    python -m benchmarks.suite                       # run, compare with the baseline
+    python -m benchmarks.suite --quick --filter pdf  # fewer repeats, only matching cases
+    python -m benchmarks.suite --update-baseline     # record a new baseline
+    python -m benchmarks.suite --output run.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# The match-score AI suggestion is a network call; keep it out of the timings
+os.environ['GROQ_API_KEY'] = ''
+
+from backend.services.ai_content_compressor import AIContentCompressor  # noqa: E402
+from backend.services.resume_exporter import ResumeExporter  # noqa: E402
+from backend.services import semantic_matcher  # noqa: E402
+from backend.services.resume_optimizer import ResumeOptimizer  # noqa: E402
+from backend.services.resume_templates import ResumeTemplates  # noqa: E402
+from benchmarks.synthetic import SIZES, make_job_description, make_user, resume_text  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'suite.json')
+
+TEMPLATES = ('professional', 'modern', 'simple', 'technical', 'academic', 'detailed')
+FORMATS = (('txt', None), ('html', None), ('pdf', None), ('pdf', 'canvas'), ('docx', 'python-docx'),
+           ('docx', 'ooxml'))
+
+
+def build_cases():
+    """Ordered {case name: zero-argument callable}"""
+    cases = {}
+    job_description = make_job_description()
+    for size in SIZES:
+        user, profile = make_user(size)
+
+        for template in TEMPLATES:
+            cases[f'template/{template}/{size}'] = (
+                lambda t=template, u=user, p=profile: ResumeTemplates.generate_from_template(t, u, p)
+            )
+
+        for format_type, backend in FORMATS:
+            name = format_type if backend in (None, 'python-docx') else f'{format_type}-{backend}'
+            cases[f'export/{name}/{size}'] = (
+                lambda f=format_type, b=backend, u=user, p=profile:
+                ResumeExporter.export_resume(u, p, f, 'professional', b if f == 'docx' else None,
+                                             pdf_backend=b if f == 'pdf' else None)
+            )
+
+        if profile.summary:
+            cases[f'compress/summary/{size}'] = lambda p=profile: AIContentCompressor.compress_summary(p.summary)
+        if profile.projects:
+            cases[f'compress/projects/{size}'] = lambda p=profile: AIContentCompressor.compress_projects(p.projects)
+        if profile.skills:
+            cases[f'compress/skills/{size}'] = lambda p=profile: AIContentCompressor.compress_skills(p.skills)
+        if profile.experience:
+            cases[f'compress/experience/{size}'] = (
+                lambda p=profile: AIContentCompressor.compress_experience(p.experience)
+            )
+
+        text = resume_text(user, profile)
+        cases[f'optimizer/match_score/{size}'] = (
+            lambda r=text: ResumeOptimizer.calculate_match_score(r, job_description)
+        )
+        if semantic_matcher.available():
+            # Semantic component alone, with warm and empty embedding caches
+            cases[f'optimizer/semantic/{size}'] = (
+                lambda r=text: semantic_matcher.semantic_match(r, job_description)
+            )
+            cases[f'optimizer/semantic_cold/{size}'] = (
+                lambda r=text: semantic_matcher.semantic_match(r, job_description,
+                                                               embedder=semantic_matcher.HashedEmbedder())
+            )
+    return cases
+
+
+def calibrate(rounds=7):
+    """Fastest time (ms) of a fixed pure-Python workload, used to normalize across machines"""
+    def workload():
+        data = {}
+        for i in range(60000):
+            data[str(i)] = i * 3 % 7
+        return sorted(data.items(), key=lambda item: (item[1], item[0]))[:10]
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        workload()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def time_case(func, min_time, max_runs, min_runs=3, min_sample_ms=1.0):
+    """Run func until min_time seconds have passed (within the run limits)
+
+    Fast cases are called several times per sample so each sample lasts at
+    least min_sample_ms; reported times are per call.
+
+    Returns:
+        dict: median_ms, p95_ms, min_ms, runs (samples) and calls per sample
+    """
+    start = time.perf_counter()
+    func()  # warm-up: lazy imports and caches are not part of the measurement
+    func()
+    single_ms = (time.perf_counter() - start) * 500
+    inner = max(1, int(min_sample_ms / single_ms)) if single_ms > 0 else 1000
+
+    timings = []
+    deadline = time.perf_counter() + min_time
+    while len(timings) < min_runs or (time.perf_counter() < deadline and len(timings) < max_runs):
+        start = time.perf_counter()
+        for _ in range(inner):
+            func()
+        timings.append((time.perf_counter() - start) * 1000 / inner)
+    timings.sort()
+    return {
+        'median_ms': round(statistics.median(timings), 5),
+        'p95_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 5),
+        'min_ms': round(timings[0], 5),
+        'runs': len(timings),
+        'calls_per_run': inner,
+    }
+
+
+def compare(results, baseline, normalize='calibration', metric='min_ms'):
+    """Compare a run with a baseline
+
+    The fastest sample (min_ms) is the default metric: on a busy machine it
+    moves far less between runs than the median.
+
+    Args:
+        normalize: 'calibration', 'suite' or 'none' (see module docstring)
+
+    Returns:
+        list: (case, baseline ms, current ms, relative change) for cases in both
+    """
+    pairs = []
+    for case, current in results['cases'].items():
+        previous = baseline['cases'].get(case)
+        if previous is not None and previous.get(metric):
+            pairs.append((case, previous[metric], current[metric]))
+
+    scale = 1.0
+    if normalize == 'calibration' and baseline['meta'].get('calibration_ms') and results['meta'].get('calibration_ms'):
+        scale = baseline['meta']['calibration_ms'] / results['meta']['calibration_ms']
+    elif normalize == 'suite' and pairs:
+        scale = 1 / statistics.median(current / previous for _, previous, current in pairs)
+
+    return [(case, previous, current, current * scale / previous - 1) for case, previous, current in pairs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON to compare with')
+    parser.add_argument('--output', help='Write this run as JSON')
+    parser.add_argument('--update-baseline', action='store_true', help='Save this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown vs. the baseline (0.25 = 25%%)')
+    parser.add_argument('--filter', default='', help='Only run cases whose name contains this text')
+    parser.add_argument('--quick', action='store_true', help='Fewer repeats (noisier, for CI)')
+    parser.add_argument('--normalize', choices=('calibration', 'suite', 'none'), default='calibration',
+                        help='How to cancel out machine speed (see above)')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='Re-time regressed cases this many times before failing (filters out noise)')
+    parser.add_argument('--metric', choices=('min_ms', 'median_ms', 'p95_ms'), default='min_ms',
+                        help='Statistic compared with the baseline')
+    args = parser.parse_args()
+
+    min_time, max_runs = (0.05, 20) if args.quick else (0.3, 200)
+    cases = {name: func for name, func in build_cases().items() if args.filter in name}
+    if not cases:
+        print(f"No cases match '{args.filter}'")
+        return 2
+
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'calibration_ms': None,
+            'quick': args.quick,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'cases': {},
+    }
+
+    calibration_before = calibrate()
+    print(f"{'case':<40}{'median ms':>12}{'p95 ms':>12}{'min ms':>12}{'runs':>7}")
+    for name, func in cases.items():
+        stats = time_case(func, min_time, max_runs)
+        results['cases'][name] = stats
+        print(f"{name:<40}{stats['median_ms']:>12.3f}{stats['p95_ms']:>12.3f}{stats['min_ms']:>12.3f}{stats['runs']:>7}")
+    # Calibrate on both sides of the run so a machine that slows down midway is averaged out
+    results['meta']['calibration_ms'] = round((calibration_before + calibrate()) / 2, 4)
+    print(f"\nCalibration: {results['meta']['calibration_ms']:.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.normalize, args.metric)
+    for attempt in range(args.retries):
+        regressed = [row[0] for row in rows if row[3] > args.threshold]
+        if not regressed:
+            break
+        print(f"\nRe-timing {len(regressed)} regressed case(s) (attempt {attempt + 1}/{args.retries})")
+        for name in regressed:
+            stats = time_case(cases[name], min_time * 2, max_runs * 2)
+            previous = results['cases'][name]
+            # Keep the best sample of either attempt: noise only ever adds time
+            for key in ('min_ms', 'median_ms', 'p95_ms'):
+                previous[key] = min(previous[key], stats[key])
+        rows = compare(results, baseline, args.normalize, args.metric)
+    regressions = [row for row in rows if row[3] > args.threshold]
+    print(f"\nCompared {len(rows)} cases with {args.baseline} (threshold +{args.threshold:.0%})")
+    for case, previous, current, change in sorted(rows, key=lambda row: -row[3])[:10]:
+        marker = '  REGRESSION' if change > args.threshold else ''
+        print(f"  {case:<40}{previous:>10.3f} -> {current:>10.3f} ms  {change:+.1%}{marker}")
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Synthetic users, profiles and job descriptions for benchmarks
+
+Profiles are generated from a fixed seed so every run (and every machine) times
+the same content. Sizes:
+    sparse:  name, email, a few skills and nothing else
+    typical: one page worth of summary, projects, experience and education
+    huge:    several pages (long summary, 40 skills, 25 projects, 15 roles)
+"""
+import random
+
+from backend.services.profile_snapshot import ProfileSnapshot, UserSnapshot
+
+SIZES = ('sparse', 'typical', 'huge')
+
+_WORDS = (
+    'built designed led migrated optimized automated scaled deployed reduced improved shipped '
+    'api service pipeline platform dashboard cluster cache queue database search index model '
+    'python flask django react typescript postgresql redis kafka docker kubernetes aws terraform '
+    'latency throughput reliability cost onboarding customers revenue team incidents releases '
+    'across teams with for the a of to and in by using while serving millions of daily requests'
+).split()
+
+_SKILLS = (
+    'Python', 'Flask', 'Django', 'FastAPI', 'React', 'TypeScript', 'JavaScript', 'Node.js', 'Go',
+    'Java', 'SQL', 'PostgreSQL', 'MySQL', 'Redis', 'Kafka', 'RabbitMQ', 'Docker', 'Kubernetes',
+    'AWS', 'GCP', 'Azure', 'Terraform', 'Ansible', 'Linux', 'Git', 'CI/CD', 'GraphQL', 'REST',
+    'Pandas', 'NumPy', 'Spark', 'Airflow', 'TensorFlow', 'PyTorch', 'Elasticsearch', 'Nginx',
+    'Celery', 'gRPC', 'Prometheus', 'Grafana',
+)
+
+_SHAPES = {
+    'sparse': {'summary': 0, 'skills': 4, 'projects': 0, 'experience': 0, 'education': 0},
+    'typical': {'summary': 3, 'skills': 12, 'projects': 3, 'experience': 4, 'education': 1},
+    'huge': {'summary': 14, 'skills': 40, 'projects': 25, 'experience': 15, 'education': 4},
+}
+
+
+def _sentence(rng, words=14):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def make_profile(size, seed=0):
+    """Profile dictionary of the given size (see module docstring)"""
+    shape = _SHAPES[size]
+    rng = random.Random(f'{size}-{seed}')
+    profile = {
+        'email': 'jane.doe@example.com',
+        'skills': ', '.join(_SKILLS[:shape['skills']]),
+    }
+    if size == 'sparse':
+        return profile
+    profile.update({
+        'headline': 'Senior Backend Engineer',
+        'phone': '+1 555 0100',
+        'linkedin': 'linkedin.com/in/janedoe',
+        'github': 'github.com/janedoe',
+        'leetcode': 'leetcode.com/janedoe',
+        'other_links': 'janedoe.dev\nblog.janedoe.dev',
+        'summary': ' '.join(_sentence(rng, 18) for _ in range(shape['summary'])),
+        'projects': '\n'.join(
+            f'Project {index + 1} - {_sentence(rng, 16)} {_sentence(rng, 10)}'
+            for index in range(shape['projects'])
+        ),
+        'experience': '\n'.join(
+            f'Engineer {index + 1}, Company {index + 1} (20{10 + index}-20{11 + index}) - {_sentence(rng, 20)}'
+            for index in range(shape['experience'])
+        ),
+        'education': '\n'.join(
+            f'B.Sc. Computer Science, State University {index + 1}, 20{10 + index}'
+            for index in range(shape['education'])
+        ),
+        'languages': 'English, Spanish',
+        'hobbies': 'Climbing, chess',
+        'dob': '1990-01-01',
+    })
+    return profile
+
+
+def make_user(size, seed=0):
+    """(UserSnapshot, ProfileSnapshot) for a synthetic profile"""
+    profile = ProfileSnapshot(make_profile(size, seed))
+    return UserSnapshot(1, 'Jane Doe', 'jane.doe@example.com', profile), profile
+
+
+def make_job_description(seed=0, paragraphs=4):
+    """Job description text mixing skills that do and do not appear in the profiles"""
+    rng = random.Random(f'jd-{seed}')
+    skills = rng.sample(_SKILLS, 14)
+    lines = [f'We are hiring a backend engineer experienced with {", ".join(skills[:7])}.']
+    for _ in range(paragraphs):
+        lines.append(' '.join(_sentence(rng, 16) for _ in range(3)))
+    lines.append(f'Nice to have: {", ".join(skills[7:])}.')
+    return '\n'.join(lines)
+
+
+def resume_text(user, profile):
+    """Plain resume text as the analyze endpoint builds it from a profile"""
+    parts = [
+        f'Name: {user.name}',
+        f'Headline: {profile.headline}',
+        f'Summary: {profile.summary}',
+        f'Skills: {profile.skills}',
+        f'Projects: {profile.projects}',
+        f'Education: {profile.education}',
+    ]
+    return '\n'.join(parts)
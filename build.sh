@@ -16,3 +16,7 @@ pip install -r requirements.txt
 cd frontend
 npm install
 npm run build
+
+# Precompress the build (.gz/.br next to each file) so workers never compress at runtime
+cd ..
+python -m backend.services.static_assets frontend/build
@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration
+Format backends and AI SDKs are imported lazily on first use. With
+WARMUP_BACKENDS=true they are imported and warmed before any request is served:
+once in the master when preload_app is on (workers inherit them on fork), or in
+every worker right after it loads the app otherwise
+"""
+import os
+
+from backend.config import Config
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() == "true"
+
+
+def _warmup(log):
+    from backend.services.backend_registry import warmup
+
+    timings = warmup()
+    log.info("Backends warmed up: %s", timings)
+
+
+def when_ready(server):
+    if Config.WARMUP_BACKENDS and preload_app:
+        _warmup(server.log)
+
+
+def post_worker_init(worker):
+    if Config.WARMUP_BACKENDS and not preload_app:
+        _warmup(worker.log)